@@ -0,0 +1,281 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Benchmark - latency, throughput, index build time and memory
+for core.search, core.search_stack and generate_design_system.
+
+Usage:
+    python bench.py                                   # 1x, 10x, 100x of data/
+    python bench.py --scales 1 10 --queries 500 -o bench.json
+    python bench.py --compare bench.json              # run again, print deltas
+
+Each scale runs in a fresh child process over synthetic CSVs generated from
+data/ (same columns, rows resampled and perturbed, vocabulary grown with the
+scale), so index build time and peak RSS are measured cold. The query cache
+is disabled unless --with-cache is given.
+"""
+
+import argparse
+import csv
+import json
+import os
+import random
+import re
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+import core
+
+DEFAULT_SCALES = [1, 10, 100]
+DEFAULT_QUERIES = 200
+MIXES = ["single_term", "multi_term", "auto_domain", "stack"]
+
+
+# ============ SYNTHETIC DATA ============
+def _words(text: str) -> list:
+    return re.findall(r"[^\s,;]+", text)
+
+
+def _synthesize_csv(source: Path, target: Path, scale: int, rng: random.Random) -> int:
+    """Write scale x the rows of source, resampled and perturbed; returns row count."""
+    with open(source, 'r', encoding='utf-8', newline='') as f:
+        reader = csv.reader(f)
+        header = next(reader)
+        rows = [row for row in reader if row]
+    if not rows:
+        return 0
+
+    target.parent.mkdir(parents=True, exist_ok=True)
+    with open(target, 'w', encoding='utf-8', newline='') as f:
+        writer = csv.writer(f)
+        writer.writerow(header)
+        total = len(rows) * scale
+        for i in range(total):
+            base = rows[i % len(rows)]
+            if i < len(rows):
+                writer.writerow(base)  # the original rows stay in every scale
+                continue
+            donor = rows[rng.randrange(len(rows))]
+            record = []
+            for col, value in enumerate(base):
+                words = _words(value) + _words(donor[col] if col < len(donor) else "")
+                if not words:
+                    record.append(value)
+                    continue
+                picked = rng.sample(words, k=min(len(words), max(1, len(_words(value)))))
+                # Grow the vocabulary with the scale: occasional word variants
+                picked = [f"{w}{rng.randrange(scale * 10)}" if rng.random() < 0.1 else w for w in picked]
+                record.append(" ".join(picked))
+            writer.writerow(record)
+    return total
+
+
+def build_dataset(scale: int, target: Path, seed: int) -> dict:
+    """Synthetic copy of data/ at the given scale; returns {relative file: rows}."""
+    rng = random.Random(seed + scale)
+    counts = {}
+    for source in sorted(core.DATA_DIR.rglob("*.csv")):
+        relative = source.relative_to(core.DATA_DIR)
+        if relative.parts[0].startswith("."):
+            continue
+        counts[str(relative)] = _synthesize_csv(source, target / relative, scale, rng)
+    return counts
+
+
+def _query_vocabulary(rng: random.Random) -> list:
+    """Real search-column words to draw queries from."""
+    vocab = set()
+    for config in core.CSV_CONFIG.values():
+        filepath = core.DATA_DIR / config["file"]
+        if not filepath.exists():
+            continue
+        with open(filepath, 'r', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                for col in config["search_cols"]:
+                    vocab.update(w for w in core.TOKENIZER.tokenize(row.get(col) or ""))
+    words = sorted(vocab)
+    rng.shuffle(words)
+    return words
+
+
+def build_queries(count: int, seed: int) -> dict:
+    """Representative query mixes, deterministic for a seed."""
+    rng = random.Random(seed)
+    vocab = _query_vocabulary(rng)
+    domain_hints = ["dashboard", "color palette", "landing hero", "font serif", "chart trend",
+                    "accessibility keyboard", "icon", "react rerender", "form input", "glassmorphism"]
+    domains = list(core.CSV_CONFIG)
+    return {
+        "single_term": [(rng.choice(vocab), rng.choice(domains)) for _ in range(count)],
+        "multi_term": [(" ".join(rng.sample(vocab, rng.randint(3, 5))), rng.choice(domains)) for _ in range(count)],
+        "auto_domain": [(f"{rng.choice(domain_hints)} {rng.choice(vocab)}", None) for _ in range(count)],
+        "stack": [(" ".join(rng.sample(vocab, 2)), rng.choice(core.AVAILABLE_STACKS)) for _ in range(count)],
+        "design_system": [" ".join(rng.sample(domain_hints, 2)) for _ in range(max(5, count // 10))],
+    }
+
+
+# ============ MEASUREMENT ============
+def _percentile(sorted_values: list, pct: float) -> float:
+    if not sorted_values:
+        return 0.0
+    k = (len(sorted_values) - 1) * pct / 100
+    lo, hi = int(k), min(int(k) + 1, len(sorted_values) - 1)
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * (k - lo)
+
+
+def _summarize(latencies: list, wall: float) -> dict:
+    ordered = sorted(latencies)
+    return {
+        "count": len(ordered),
+        "p50_ms": round(_percentile(ordered, 50) * 1000, 4),
+        "p95_ms": round(_percentile(ordered, 95) * 1000, 4),
+        "max_ms": round(ordered[-1] * 1000, 4) if ordered else 0.0,
+        "throughput_qps": round(len(ordered) / wall, 2) if wall else 0.0,
+    }
+
+
+def _timed(calls: list) -> dict:
+    latencies = []
+    start = time.perf_counter()
+    for fn, args in calls:
+        t0 = time.perf_counter()
+        fn(*args)
+        latencies.append(time.perf_counter() - t0)
+    return _summarize(latencies, time.perf_counter() - start)
+
+
+def _peak_rss_mb() -> float:
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return round(peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024, 2)
+
+
+def run_scale(scale: int, queries: int, seed: int, with_cache: bool) -> dict:
+    """Benchmark one scale in this process (meant to run in a fresh child)."""
+    import design_system
+
+    queries_by_mix = build_queries(queries, seed)
+    with tempfile.TemporaryDirectory(prefix=f"uipro-bench-{scale}x-") as tmp:
+        data_dir = Path(tmp) / "data"
+        t0 = time.perf_counter()
+        rows = build_dataset(scale, data_dir, seed)
+        synth_s = time.perf_counter() - t0
+
+        core.DATA_DIR = design_system.DATA_DIR = data_dir
+        os.environ["UIPRO_INDEX_DIR"] = str(Path(tmp) / "index")
+        if not with_cache:
+            core.QUERY_CACHE = core.QueryCache(max_entries=0)
+
+        t0 = time.perf_counter()
+        core.build_indexes()
+        build_s = time.perf_counter() - t0
+
+        # Warm reload: drop in-process indexes, load them back from disk
+        core._INDEXES.clear()
+        t0 = time.perf_counter()
+        core.build_indexes()
+        load_s = time.perf_counter() - t0
+
+        results = {}
+        for mix in MIXES:
+            fn = core.search_stack if mix == "stack" else core.search
+            results[mix] = _timed([(fn, (q, target)) for q, target in queries_by_mix[mix]])
+        results["design_system"] = _timed([(design_system.generate_design_system, (q,))
+                                           for q in queries_by_mix["design_system"]])
+
+        index_bytes = sum(p.stat().st_size for p in (Path(tmp) / "index").glob("*.idx"))
+
+    return {
+        "scale": scale,
+        "rows": sum(rows.values()),
+        "synthesize_s": round(synth_s, 3),
+        "index_build_s": round(build_s, 3),
+        "index_load_s": round(load_s, 4),
+        "index_bytes": index_bytes,
+        "peak_rss_mb": _peak_rss_mb(),
+        "numpy": core._numpy() is not None,
+        "query_cache": with_cache,
+        "mixes": results,
+    }
+
+
+# ============ REPORTING ============
+def print_report(report: dict, baseline: dict = None):
+    base_by_scale = {r["scale"]: r for r in (baseline or {}).get("results", [])}
+    for result in report["results"]:
+        base = base_by_scale.get(result["scale"])
+        print(f"\n## {result['scale']}x  ({result['rows']} rows)")
+        print(f"   index build {result['index_build_s']}s | warm load {result['index_load_s']}s | "
+              f"index {result['index_bytes'] / 1024:.0f} KiB | peak RSS {result['peak_rss_mb']} MB")
+        print(f"   {'mix':<15}{'p50 ms':>10}{'p95 ms':>10}{'qps':>10}{'Δp50':>9}{'Δp95':>9}")
+        for mix, stats in result["mixes"].items():
+            delta = ""
+            if base and mix in base["mixes"]:
+                old = base["mixes"][mix]
+                delta = "".join(f"{_pct_change(old[k], stats[k]):>9}" for k in ("p50_ms", "p95_ms"))
+            print(f"   {mix:<15}{stats['p50_ms']:>10.3f}{stats['p95_ms']:>10.3f}{stats['throughput_qps']:>10.1f}{delta}")
+
+
+def _pct_change(old: float, new: float) -> str:
+    if not old:
+        return "n/a"
+    return f"{(new - old) / old * 100:+.1f}%"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="UI Pro Max search benchmark")
+    parser.add_argument("--scales", type=int, nargs="+", default=DEFAULT_SCALES, help="Data size multipliers (default: 1 10 100)")
+    parser.add_argument("--queries", "-q", type=int, default=DEFAULT_QUERIES, help="Queries per mix (default: 200)")
+    parser.add_argument("--seed", type=int, default=42, help="Random seed for data and queries")
+    parser.add_argument("--with-cache", action="store_true", help="Keep the query result cache enabled")
+    parser.add_argument("--output", "-o", type=str, default=None, help="Write JSON results here")
+    parser.add_argument("--compare", type=str, default=None, help="Previous JSON results to diff against")
+    parser.add_argument("--child", type=int, default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child is not None:
+        print(json.dumps(run_scale(args.child, args.queries, args.seed, args.with_cache)))
+        return 0
+
+    report = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "queries_per_mix": args.queries,
+        "seed": args.seed,
+        "results": [],
+    }
+    for scale in args.scales:
+        cmd = [sys.executable, str(Path(__file__).resolve()), "--child", str(scale),
+               "--queries", str(args.queries), "--seed", str(args.seed)]
+        if args.with_cache:
+            cmd.append("--with-cache")
+        print(f"Running {scale}x ...", file=sys.stderr)
+        env = dict(os.environ, UIPRO_NO_DAEMON="1")
+        env.pop("UIPRO_QUERY_CACHE", None)
+        out = subprocess.run(cmd, capture_output=True, text=True, env=env)
+        if out.returncode != 0:
+            print(out.stderr, file=sys.stderr)
+            return out.returncode
+        report["results"].append(json.loads(out.stdout.strip().splitlines()[-1]))
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, 'r', encoding='utf-8') as f:
+            baseline = json.load(f)
+    print_report(report, baseline)
+
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+        print(f"\n💾 Results saved to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
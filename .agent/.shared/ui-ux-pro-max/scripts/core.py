@@ -5,15 +5,61 @@ UI/UX Pro Max Core - BM25 search engine for UI/UX style guides
 """
 
 import csv
+import hashlib
+import heapq
+import json
+import mmap
+import os
 import re
+import sqlite3
+import struct
+import sys
+import threading
+import unicodedata
+from array import array
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
 from math import log
-from collections import defaultdict
+
+# Optional: BM25Matrix needs NumPy, BM25 does not. Imported on first use so
+# one-shot CLI calls (and daemon clients) don't pay for it.
+np = None
+_NUMPY_CHECKED = False
+
+
+def _numpy():
+    """Return the numpy module, or None when it is not installed"""
+    global np, _NUMPY_CHECKED
+    if not _NUMPY_CHECKED:
+        try:
+            import numpy
+            np = numpy
+        except ImportError:
+            np = None
+        _NUMPY_CHECKED = True
+    return np
 
 # ============ CONFIGURATION ============
 DATA_DIR = Path(__file__).parent.parent / "data"
 MAX_RESULTS = 3
 
+# On-disk BM25 indexes (one per CSV), rebuilt when the source CSV changes.
+# Override the location with UIPRO_INDEX_DIR (defaults to data/.index).
+INDEX_VERSION = 4
+INDEX_MAGIC = b"UIPXIDX\0"
+
+# Tokenizer options (changing them rebuilds the indexes):
+#   UIPRO_FOLD_ACCENTS=1    fold accents ("ação" -> "acao")
+#   UIPRO_STEM=en|pt        light suffix stemming for English or Portuguese
+TOKENIZER_FOLD_ACCENTS = os.environ.get("UIPRO_FOLD_ACCENTS", "") not in ("", "0")
+TOKENIZER_STEM = os.environ.get("UIPRO_STEM") or None
+
+# Query result cache: in-process LRU, optionally backed by SQLite.
+# UIPRO_QUERY_CACHE=<path.sqlite> enables the on-disk layer.
+QUERY_CACHE_SIZE = int(os.environ.get("UIPRO_QUERY_CACHE_SIZE", 2048))
+QUERY_CACHE_DISK_SIZE = int(os.environ.get("UIPRO_QUERY_CACHE_DISK_SIZE", 20000))
+
 CSV_CONFIG = {
     "style": {
         "file": "styles.csv",
@@ -96,74 +142,672 @@ _STACK_COLS = {
 AVAILABLE_STACKS = list(STACK_CONFIG.keys())
 
 
+# ============ TOKENIZER ============
+_PUNCT_RE = re.compile(r'[^\w\s]')
+
+# (suffix, replacement, minimum stem length left after stripping)
+_EN_SUFFIXES = (
+    ("sses", "ss", 2), ("ies", "y", 3), ("ing", "", 4), ("ed", "", 4),
+    ("es", "e", 3), ("s", "", 3),
+)
+_PT_SUFFIXES = (
+    ("mente", "", 4), ("ções", "ção", 2), ("ões", "ão", 2), ("ães", "ão", 2),
+    ("ais", "al", 2), ("éis", "el", 2), ("óis", "ol", 2), ("res", "r", 3),
+    ("les", "l", 3), ("ns", "m", 3), ("s", "", 3),
+)
+_KEEP_EN = ("ss", "us", "is", "aes", "ees", "oes")
+_KEEP_PT = ("ss", "us", "is")
+
+
+def _strip_suffix(word, suffixes, keep):
+    """Apply the first matching suffix rule; bare "s" is never stripped from keep endings"""
+    for suffix, replacement, min_stem in suffixes:
+        if word.endswith(suffix) and len(word) - len(suffix) >= min_stem:
+            if suffix == "s" and word.endswith(keep):
+                return word
+            return word[:-len(suffix)] + replacement
+    return word
+
+
+def _stem_en(word):
+    """Light English stemmer (plural / -ing / -ed stripping)"""
+    return _strip_suffix(word, _EN_SUFFIXES, _KEEP_EN)
+
+
+def _stem_pt(word):
+    """Light Portuguese stemmer (plural and -mente reduction)"""
+    return _strip_suffix(word, _PT_SUFFIXES, _KEEP_PT)
+
+
+_STEMMERS = {"en": _stem_en, "pt": _stem_pt}
+
+
+def _fold_accents(word):
+    """Strip diacritics: "configuração" -> "configuracao" """
+    return "".join(c for c in unicodedata.normalize("NFKD", word) if not unicodedata.combining(c))
+
+
+class Vocabulary:
+    """Process-wide term interning: every index maps its terms to these ids"""
+
+    def __init__(self):
+        self._ids = {}
+        self._terms = []
+        self._lock = threading.Lock()
+
+    def intern(self, term):
+        """Id for term, allocating one if it is new"""
+        term_id = self._ids.get(term)
+        if term_id is None:
+            with self._lock:
+                term_id = self._ids.get(term)
+                if term_id is None:
+                    term_id = self._ids[term] = len(self._terms)
+                    self._terms.append(term)
+        return term_id
+
+    def get(self, term):
+        """Id for term, or None if no index has seen it"""
+        return self._ids.get(term)
+
+    def term(self, term_id):
+        return self._terms[term_id]
+
+    def __len__(self):
+        return len(self._terms)
+
+
+VOCABULARY = Vocabulary()
+
+
+class Tokenizer:
+    """Precompiled tokenizer with optional accent folding and stemming"""
+
+    def __init__(self, min_length=3, fold_accents=False, stem=None):
+        if stem is not None and stem not in _STEMMERS:
+            raise ValueError(f"Unknown stemmer: {stem}. Available: {', '.join(_STEMMERS)}")
+        self.min_length = min_length
+        self.fold_accents = fold_accents
+        self.stem = stem
+        self._stemmer = _STEMMERS.get(stem)
+        self.signature = f"min{min_length}|fold{int(fold_accents)}|stem:{stem or '-'}"
+        self.query_tokens = lru_cache(maxsize=4096)(self._query_tokens)
+
+    def tokenize(self, text):
+        """Lowercase, split, remove punctuation, filter short words"""
+        words = _PUNCT_RE.sub(' ', str(text).lower()).split()
+        tokens = [w for w in words if len(w) >= self.min_length]
+        if self._stemmer:
+            tokens = [self._stemmer(w) for w in tokens]
+        if self.fold_accents:
+            tokens = [_fold_accents(w) for w in tokens]
+        return tokens
+
+    def _query_tokens(self, query):
+        return tuple(self.tokenize(query))
+
+    def encode(self, text, vocabulary=VOCABULARY):
+        """Interned token ids for text (allocates ids for new terms)"""
+        return array('I', (vocabulary.intern(t) for t in self.tokenize(text)))
+
+    def lookup(self, query, vocabulary=VOCABULARY):
+        """Known token ids for a query; unseen terms are dropped, never interned"""
+        ids = (vocabulary.get(t) for t in self.query_tokens(query))
+        return [term_id for term_id in ids if term_id is not None]
+
+
+TOKENIZER = Tokenizer(fold_accents=TOKENIZER_FOLD_ACCENTS, stem=TOKENIZER_STEM)
+
+
 # ============ BM25 IMPLEMENTATION ============
+def _align(offset, size=8):
+    """Round offset up to the next multiple of size"""
+    return (offset + size - 1) // size * size
+
+
 class BM25:
     """BM25 ranking algorithm for text search"""
 
-    def __init__(self, k1=1.5, b=0.75):
+    def __init__(self, k1=1.5, b=0.75, tokenizer=None):
         self.k1 = k1
         self.b = b
-        self.corpus = []
+        self.tokenizer = tokenizer or TOKENIZER
+        self.corpus = []          # per-document local term id sequences
         self.doc_lengths = []
         self.avgdl = 0
-        self.idf = {}
-        self.doc_freqs = defaultdict(int)
+        self.term_ids = array('I')  # local term id -> VOCABULARY id
+        self.local_ids = {}         # VOCABULARY id -> local term id
+        self.doc_freqs = []       # term id -> document frequency
+        self.idf = []             # term id -> idf
+        self.postings = []        # term id -> (doc ids, term frequencies)
         self.N = 0
+        self.extras = {}          # extra named arrays persisted with the index
+        self._mmap = None
+        self._matrix = None
 
     def tokenize(self, text):
-        """Lowercase, split, remove punctuation, filter short words"""
-        text = re.sub(r'[^\w\s]', ' ', str(text).lower())
-        return [w for w in text.split() if len(w) > 2]
+        """Tokens for text under this index's tokenizer"""
+        return self.tokenizer.tokenize(text)
 
     def fit(self, documents):
         """Build BM25 index from documents"""
-        self.corpus = [self.tokenize(doc) for doc in documents]
+        self.corpus = []
+        for doc in documents:
+            ids = array('I')
+            for global_id in self.tokenizer.encode(doc):
+                term_id = self.local_ids.get(global_id)
+                if term_id is None:
+                    term_id = self.local_ids[global_id] = len(self.term_ids)
+                    self.term_ids.append(global_id)
+                    self.doc_freqs.append(0)
+                ids.append(term_id)
+            self.corpus.append(ids)
         self.N = len(self.corpus)
         if self.N == 0:
             return
-        self.doc_lengths = [len(doc) for doc in self.corpus]
+        self.doc_lengths = array('I', (len(doc) for doc in self.corpus))
         self.avgdl = sum(self.doc_lengths) / self.N
 
-        for doc in self.corpus:
-            seen = set()
-            for word in doc:
-                if word not in seen:
-                    self.doc_freqs[word] += 1
-                    seen.add(word)
-
-        for word, freq in self.doc_freqs.items():
-            self.idf[word] = log((self.N - freq + 0.5) / (freq + 0.5) + 1)
+        # Inverted postings: term -> ascending doc ids + term frequency
+        self.postings = [(array('I'), array('I')) for _ in self.term_ids]
+        for idx, doc in enumerate(self.corpus):
+            term_freqs = {}
+            for term_id in doc:
+                term_freqs[term_id] = term_freqs.get(term_id, 0) + 1
+            for term_id, tf in term_freqs.items():
+                docs, tfs = self.postings[term_id]
+                docs.append(idx)
+                tfs.append(tf)
+                self.doc_freqs[term_id] += 1
+
+        self.idf = array('d', (log((self.N - freq + 0.5) / (freq + 0.5) + 1) for freq in self.doc_freqs))
+
+    def query_terms(self, query):
+        """Local term ids of the query tokens this index knows, in query order"""
+        local_ids = self.local_ids
+        return [local_ids[g] for g in self.tokenizer.lookup(query) if g in local_ids]
+
+    def _accumulate(self, query):
+        """Sum BM25 contributions for documents containing a query term"""
+        scores = {}
+        for term_id in self.query_terms(query):
+            idf = self.idf[term_id]
+            docs, tfs = self.postings[term_id]
+            for idx, tf in zip(docs, tfs):
+                numerator = tf * (self.k1 + 1)
+                denominator = tf + self.k1 * (1 - self.b + self.b * self.doc_lengths[idx] / self.avgdl)
+                scores[idx] = scores.get(idx, 0) + idf * numerator / denominator
+        return scores
 
     def score(self, query):
         """Score all documents against query"""
-        query_tokens = self.tokenize(query)
-        scores = []
-
-        for idx, doc in enumerate(self.corpus):
-            score = 0
-            doc_len = self.doc_lengths[idx]
-            term_freqs = defaultdict(int)
-            for word in doc:
-                term_freqs[word] += 1
-
-            for token in query_tokens:
-                if token in self.idf:
-                    tf = term_freqs[token]
-                    idf = self.idf[token]
-                    numerator = tf * (self.k1 + 1)
-                    denominator = tf + self.k1 * (1 - self.b + self.b * doc_len / self.avgdl)
-                    score += idf * numerator / denominator
-
-            scores.append((idx, score))
-
-        return sorted(scores, key=lambda x: x[1], reverse=True)
+        scores = self._accumulate(query)
+        ranked = [(idx, scores.get(idx, 0)) for idx in range(self.N)]
+        return sorted(ranked, key=lambda x: x[1], reverse=True)
+
+    def top_k(self, query, k):
+        """Best k (doc id, score) pairs with score > 0, ties broken by doc order"""
+        scores = self._accumulate(query)
+        return heapq.nlargest(k, scores.items(), key=lambda x: (x[1], -x[0]))
+
+    def top_k_many(self, queries, k):
+        """top_k for a batch of queries; vectorized when NumPy is available"""
+        if _numpy() is None:
+            return [self.top_k(query, k) for query in queries]
+        if self._matrix is None:
+            self._matrix = BM25Matrix(self)
+        return self._matrix.top_k_many(queries, k)
+
+    # ---------- persistence ----------
+    def _arrays(self):
+        """Flat arrays written to disk, in file order"""
+        tokens = array('I')
+        offsets = array('I', [0])
+        for doc in self.corpus:
+            tokens.extend(doc)
+            offsets.append(len(tokens))
+        post_docs = array('I')
+        post_tfs = array('I')
+        post_offsets = array('I', [0])
+        for docs, tfs in self.postings:
+            post_docs.extend(docs)
+            post_tfs.extend(tfs)
+            post_offsets.append(len(post_docs))
+        return {
+            "doc_lengths": array('I', self.doc_lengths),
+            "doc_freqs": array('I', self.doc_freqs),
+            "idf": array('d', self.idf),
+            "tokens": tokens,
+            "offsets": offsets,
+            "post_docs": post_docs,
+            "post_tfs": post_tfs,
+            "post_offsets": post_offsets,
+            **{f"extra:{name}": arr for name, arr in self.extras.items()},
+        }
+
+    def save(self, path, meta=None):
+        """Write the fitted index to path atomically"""
+        arrays = self._arrays()
+        layout, offset = {}, 0
+        for name, arr in arrays.items():
+            typecode = arr.typecode if isinstance(arr, array) else arr.format
+            layout[name] = [offset, typecode, len(arr)]
+            offset = _align(offset + len(arr) * arr.itemsize)
+        header = json.dumps({
+            "version": INDEX_VERSION,
+            "byteorder": sys.byteorder,
+            "k1": self.k1,
+            "b": self.b,
+            "N": self.N,
+            "avgdl": self.avgdl,
+            "tokenizer": self.tokenizer.signature,
+            "terms": [VOCABULARY.term(g) for g in self.term_ids],
+            "arrays": layout,
+            "meta": meta or {},
+        }, ensure_ascii=False).encode('utf-8')
+
+        prefix = INDEX_MAGIC + struct.pack('<I', len(header)) + header
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp, 'wb') as f:
+            f.write(prefix + b"\0" * (_align(len(prefix)) - len(prefix)))
+            for name, arr in arrays.items():
+                data = arr.tobytes()
+                f.write(data + b"\0" * (_align(len(data)) - len(data)))
+        os.replace(tmp, path)
+
+    @classmethod
+    def load(cls, path, tokenizer=None):
+        """Memory-map an index written by save(); returns (BM25, meta)"""
+        tokenizer = tokenizer or TOKENIZER
+        with open(path, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if mm[:len(INDEX_MAGIC)] != INDEX_MAGIC:
+            raise ValueError(f"Not a BM25 index: {path}")
+        pos = len(INDEX_MAGIC)
+        (header_len,) = struct.unpack_from('<I', mm, pos)
+        pos += 4
+        header = json.loads(mm[pos:pos + header_len].decode('utf-8'))
+        if (header.get("version") != INDEX_VERSION or header.get("byteorder") != sys.byteorder
+                or header.get("tokenizer") != tokenizer.signature):
+            raise ValueError(f"Stale BM25 index: {path}")
+
+        view = memoryview(mm)
+        base = _align(pos + header_len)
+        arrays = {}
+        for name, (offset, typecode, count) in header["arrays"].items():
+            start = base + offset
+            arrays[name] = view[start:start + count * array(typecode).itemsize].cast(typecode)
+
+        bm25 = cls(header["k1"], header["b"], tokenizer)
+        bm25._mmap = mm
+        bm25.N = header["N"]
+        bm25.avgdl = header["avgdl"]
+        bm25.term_ids = array('I', (VOCABULARY.intern(term) for term in header["terms"]))
+        bm25.local_ids = {global_id: term_id for term_id, global_id in enumerate(bm25.term_ids)}
+        bm25.doc_lengths = arrays["doc_lengths"]
+        bm25.doc_freqs = arrays["doc_freqs"]
+        bm25.idf = arrays["idf"]
+        tokens, offsets = arrays["tokens"], arrays["offsets"]
+        bm25.corpus = [tokens[offsets[i]:offsets[i + 1]] for i in range(bm25.N)]
+        post_docs, post_tfs, post_offsets = arrays["post_docs"], arrays["post_tfs"], arrays["post_offsets"]
+        bm25.postings = [
+            (post_docs[post_offsets[t]:post_offsets[t + 1]], post_tfs[post_offsets[t]:post_offsets[t + 1]])
+            for t in range(len(bm25.term_ids))
+        ]
+        bm25.extras = {name[len("extra:"):]: arr for name, arr in arrays.items() if name.startswith("extra:")}
+        return bm25, header["meta"]
+
+
+class BM25Matrix:
+    """NumPy view of a fitted BM25 as a CSR term-document matrix.
+
+    Rows are terms, columns are documents; each stored entry keeps the BM25
+    numerator and denominator for that posting, so a batch of queries is
+    scored with one gather + bincount instead of a Python loop per posting.
+    """
+
+    def __init__(self, bm25):
+        arrays = bm25._arrays()
+        self.bm25 = bm25
+        self.N = bm25.N
+        self.indptr = np.frombuffer(arrays["post_offsets"], dtype=np.uint32).astype(np.int64)
+        self.indices = np.frombuffer(arrays["post_docs"], dtype=np.uint32).astype(np.int64)
+        tf = np.frombuffer(arrays["post_tfs"], dtype=np.uint32).astype(np.float64)
+        doc_lengths = np.frombuffer(arrays["doc_lengths"], dtype=np.uint32).astype(np.float64)
+        self.idf = np.frombuffer(arrays["idf"], dtype=np.float64)
+        self.numerators = tf * (bm25.k1 + 1)
+        if self.N:
+            self.denominators = tf + bm25.k1 * (1 - bm25.b + bm25.b * doc_lengths[self.indices] / bm25.avgdl)
+        else:
+            self.denominators = tf
+
+    def score_many(self, queries):
+        """Dense (len(queries), N) score matrix"""
+        query_rows, term_ids = [], []
+        for row, query in enumerate(queries):
+            for term_id in self.bm25.query_terms(query):
+                query_rows.append(row)
+                term_ids.append(term_id)
+        if not term_ids or not self.N:
+            return np.zeros((len(queries), self.N))
+
+        term_ids = np.asarray(term_ids, dtype=np.int64)
+        starts = self.indptr[term_ids]
+        lengths = self.indptr[term_ids + 1] - starts
+        # Expand each (query, term) pair into the positions of its postings
+        owners = np.repeat(np.arange(len(term_ids)), lengths)
+        positions = np.arange(lengths.sum()) - np.repeat(np.cumsum(lengths) - lengths, lengths) + starts[owners]
+        contributions = self.idf[term_ids[owners]] * self.numerators[positions] / self.denominators[positions]
+        cells = np.asarray(query_rows, dtype=np.int64)[owners] * self.N + self.indices[positions]
+        scores = np.bincount(cells, weights=contributions, minlength=len(queries) * self.N)
+        return scores.reshape(len(queries), self.N)
+
+    def top_k_many(self, queries, k):
+        """Best k (doc id, score) pairs with score > 0 for each query"""
+        results = []
+        for row in self.score_many(queries):
+            candidates = np.flatnonzero(row > 0)
+            order = np.lexsort((candidates, -row[candidates]))[:k]
+            results.append([(int(candidates[i]), float(row[candidates[i]])) for i in order])
+        return results
+
+
+# ============ INDEX CACHE ============
+# filepath/search_cols -> {"stamp": (mtime_ns, size), "bm25": BM25, "rows": [...]}
+_INDEXES = {}
+_INDEX_LOCKS = {}  # one lock per key so concurrent searches build an index once
+
+
+def _index_dir():
+    """Directory holding persisted indexes"""
+    return Path(os.environ.get("UIPRO_INDEX_DIR") or DATA_DIR / ".index")
+
+
+def _index_path(filepath, search_cols):
+    """Index file for a CSV + search column combination"""
+    source = f"{Path(filepath).resolve()}|{'|'.join(search_cols)}|{TOKENIZER.signature}"
+    key = hashlib.sha1(source.encode('utf-8')).hexdigest()[:12]
+    return _index_dir() / f"{Path(filepath).stem}-{key}.idx"
+
+
+def _source_stamp(filepath):
+    """Cheap change detector for a CSV: (mtime_ns, size)"""
+    st = os.stat(filepath)
+    return st.st_mtime_ns, st.st_size
+
+
+def _file_digest(filepath):
+    """Content hash of a CSV, used when the mtime changed"""
+    with open(filepath, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def _build_index(filepath, search_cols):
+    """Fit a fresh BM25 over the search columns, keeping only row offsets"""
+    store, documents = CsvStore.scan(filepath, search_cols)
+    bm25 = BM25()
+    bm25.fit(documents)
+    bm25.extras["row_offsets"] = store.offsets
+    return bm25, store
+
+
+def _load_index(filepath, search_cols):
+    """Return (BM25, CsvStore) for a CSV, reusing the in-process or on-disk index"""
+    key = (str(filepath), tuple(search_cols))
+    stamp = _source_stamp(filepath)
+    cached = _INDEXES.get(key)
+    if cached and cached["stamp"] == stamp:
+        return cached["bm25"], cached["store"]
+
+    with _INDEX_LOCKS.setdefault(key, threading.Lock()):
+        cached = _INDEXES.get(key)
+        if cached and cached["stamp"] == stamp:
+            return cached["bm25"], cached["store"]
+        return _refresh_index(key, filepath, search_cols, stamp)
+
+
+def _refresh_index(key, filepath, search_cols, stamp):
+    """(Re)load an index from disk or rebuild it; caller holds the key lock"""
+    path = _index_path(filepath, search_cols)
+    meta = {"source": str(filepath), "stamp": list(stamp), "search_cols": list(search_cols)}
+    bm25 = store = None
+    try:
+        disk, disk_meta = BM25.load(path)
+        if disk_meta.get("search_cols") != list(search_cols):
+            raise ValueError(f"Index built for other columns: {path}")
+        if disk_meta.get("stamp") == list(stamp):
+            bm25 = disk
+        elif disk_meta.get("sha1") == _file_digest(filepath):
+            # Touched but unchanged: keep the index, refresh its stamp
+            bm25 = disk
+            meta.update(sha1=disk_meta["sha1"], header=disk_meta["header"])
+            disk.save(path, meta)
+        if bm25 is not None:
+            store = CsvStore(filepath, disk_meta["header"], disk.extras["row_offsets"])
+    except (OSError, ValueError, KeyError):
+        bm25 = None
+
+    if bm25 is None:
+        bm25, store = _build_index(filepath, search_cols)
+        meta.update(sha1=_file_digest(filepath), header=store.header)
+        try:
+            bm25.save(path, meta)
+        except OSError:
+            pass  # read-only data dir: keep the in-memory index only
+
+    _INDEXES[key] = {"stamp": stamp, "bm25": bm25, "store": store}
+    return bm25, store
+
+
+def build_indexes():
+    """Build (or refresh) the persisted index for every domain and stack CSV"""
+    built = []
+    targets = [(DATA_DIR / c["file"], c["search_cols"]) for c in CSV_CONFIG.values()]
+    targets += [(DATA_DIR / c["file"], _STACK_COLS["search_cols"]) for c in STACK_CONFIG.values()]
+    for filepath, search_cols in targets:
+        if filepath.exists():
+            _load_index(filepath, search_cols)
+            built.append(str(_index_path(filepath, search_cols)))
+    return built
+
+
+# ============ QUERY CACHE ============
+class QueryCache:
+    """LRU cache of search results with hit/miss counters.
+
+    Keys are (index version, tokenizer, source CSV, CSV stamp, query tokens, max_results),
+    so queries that tokenize the same share an entry and editing a CSV
+    invalidates its results. An optional SQLite file keeps entries across
+    processes; it is trimmed in batches once it grows past disk_max_entries.
+    """
+
+    def __init__(self, max_entries=QUERY_CACHE_SIZE, path=None, disk_max_entries=QUERY_CACHE_DISK_SIZE):
+        self.max_entries = max_entries
+        self.disk_max_entries = disk_max_entries
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self._db = None
+        self._disk_rows = 0
+        self.path = None
+        self.hits = self.misses = self.evictions = self.disk_hits = 0
+        if path:
+            self.attach(path)
+
+    def attach(self, path):
+        """Enable the on-disk layer at path (SQLite)"""
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        db = sqlite3.connect(str(path), check_same_thread=False, timeout=5)
+        db.execute("CREATE TABLE IF NOT EXISTS results (key TEXT PRIMARY KEY, value TEXT NOT NULL, used INTEGER NOT NULL)")
+        rows = db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        with self._lock:
+            self._db, self.path, self._disk_rows = db, str(path), rows
+
+    def get(self, key):
+        """Cached value for key, or None"""
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+            if self._db is not None:
+                disk_key = json.dumps(key)
+                row = self._db.execute("SELECT value FROM results WHERE key = ?", (disk_key,)).fetchone()
+                if row:
+                    self._db.execute("UPDATE results SET used = strftime('%s','now') WHERE key = ?", (disk_key,))
+                    self._db.commit()
+                    value = json.loads(row[0])
+                    self._remember(key, value)
+                    self.hits += 1
+                    self.disk_hits += 1
+                    return value
+            self.misses += 1
+            return None
+
+    def put(self, key, value):
+        """Store value under key, evicting least recently used entries"""
+        with self._lock:
+            self._remember(key, value)
+            if self._db is not None:
+                disk_key = json.dumps(key)
+                if self._db.execute("SELECT 1 FROM results WHERE key = ?", (disk_key,)).fetchone() is None:
+                    self._disk_rows += 1
+                self._db.execute("INSERT OR REPLACE INTO results (key, value, used) VALUES (?, ?, strftime('%s','now'))",
+                                 (disk_key, json.dumps(value, ensure_ascii=False)))
+                if self._disk_rows > self.disk_max_entries:
+                    self._evict_disk()
+                self._db.commit()
+
+    def _evict_disk(self):
+        """Drop the least recently used rows down to 90% of disk_max_entries"""
+        # Other processes may share the file: recount before and after
+        rows = self._db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+        excess = rows - self.disk_max_entries * 9 // 10
+        if rows > self.disk_max_entries and excess > 0:
+            self._db.execute("DELETE FROM results WHERE key IN "
+                             "(SELECT key FROM results ORDER BY used LIMIT ?)", (excess,))
+        self._disk_rows = self._db.execute("SELECT COUNT(*) FROM results").fetchone()[0]
+
+    def _remember(self, key, value):
+        self._entries[key] = value
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    def clear(self):
+        """Drop every entry (memory and disk) and reset counters"""
+        with self._lock:
+            self._entries.clear()
+            if self._db is not None:
+                self._db.execute("DELETE FROM results")
+                self._db.commit()
+                self._disk_rows = 0
+            self.hits = self.misses = self.evictions = self.disk_hits = 0
+
+    def stats(self):
+        """Counters for tuning the cache size"""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "disk_hits": self.disk_hits,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "max_entries": self.max_entries,
+                "disk_path": self.path
+            }
+
+
+QUERY_CACHE = QueryCache(path=os.environ.get("UIPRO_QUERY_CACHE"))
+
+
+def cache_stats():
+    """Hit/miss counters of the process-wide query cache"""
+    return QUERY_CACHE.stats()
+
+
+def _cache_key(filepath, query, max_results):
+    """Query cache key: results only change with the index or the tokens"""
+    return (INDEX_VERSION, TOKENIZER.signature, str(filepath), _source_stamp(filepath),
+            TOKENIZER.query_tokens(query), max_results)
+
+
+def _copy_results(results):
+    """Fresh result dicts so callers can't mutate cached entries"""
+    return [dict(row) for row in results]
+
+
+# ============ CSV ROW STORE ============
+def _row_dict(header, record):
+    """Map a CSV record to a dict the way csv.DictReader does"""
+    row = dict(zip(header, record))
+    if len(record) > len(header):
+        row[None] = record[len(header):]
+    elif len(record) < len(header):
+        for col in header[len(record):]:
+            row[col] = None
+    return row
+
+
+def _csv_lines(f, position):
+    """Decoded lines of a binary CSV file; position[0] tracks the bytes consumed"""
+    for raw in f:
+        position[0] += len(raw)
+        yield raw.decode('utf-8').replace('\r\n', '\n')
+
+
+class CsvStore:
+    """Row-addressable view of a CSV.
+
+    Only the byte offset of each data row is kept in memory (and persisted in
+    the index); rows are parsed on demand when they make it into the results.
+    """
+
+    def __init__(self, filepath, header, offsets):
+        self.filepath = filepath
+        self.header = header
+        self.offsets = offsets
+
+    @classmethod
+    def scan(cls, filepath, search_cols):
+        """One pass over the CSV: row offsets plus the search-column documents"""
+        offsets = array('Q')
+        documents = []
+        position = [0]
+        with open(filepath, 'rb') as f:
+            reader = csv.reader(_csv_lines(f, position))
+            header = next(reader, [])
+            start = position[0]
+            for record in reader:
+                if record:  # DictReader skips blank rows
+                    offsets.append(start)
+                    row = _row_dict(header, record)
+                    documents.append(" ".join(str(row.get(col, "")) for col in search_cols))
+                start = position[0]
+        return cls(filepath, header, offsets), documents
+
+    def __len__(self):
+        return len(self.offsets)
+
+    def rows(self, ids):
+        """Parsed rows for the given row ids, in the given order"""
+        found = []
+        with open(self.filepath, 'rb') as f:
+            for idx in ids:
+                f.seek(self.offsets[idx])
+                record = next(csv.reader(_csv_lines(f, [0])))
+                found.append(_row_dict(self.header, record))
+        return found
 
 
 # ============ SEARCH FUNCTIONS ============
-def _load_csv(filepath):
-    """Load CSV and return list of dicts"""
-    with open(filepath, 'r', encoding='utf-8') as f:
-        return list(csv.DictReader(f))
+def _output_row(row, output_cols):
+    """Project a CSV row onto the output columns"""
+    return {col: row.get(col, "") for col in output_cols if col in row}
 
 
 def _search_csv(filepath, search_cols, output_cols, query, max_results):
@@ -171,24 +815,39 @@ def _search_csv(filepath, search_cols, output_cols, query, max_results):
     if not filepath.exists():
         return []
 
-    data = _load_csv(filepath)
+    key = _cache_key(filepath, query, max_results)
+    cached = QUERY_CACHE.get(key)
+    if cached is not None:
+        return _copy_results(cached)
 
-    # Build documents from search columns
-    documents = [" ".join(str(row.get(col, "")) for col in search_cols) for row in data]
+    # BM25 search over the cached index
+    bm25, store = _load_index(filepath, search_cols)
 
-    # BM25 search
-    bm25 = BM25()
-    bm25.fit(documents)
-    ranked = bm25.score(query)
+    # Get top results with score > 0, reading only the winning rows
+    hits = [idx for idx, score in bm25.top_k(query, max_results) if score > 0]
+    results = [_output_row(row, output_cols) for row in store.rows(hits)]
+
+    QUERY_CACHE.put(key, results)
+    return _copy_results(results)
 
-    # Get top results with score > 0
-    results = []
-    for idx, score in ranked[:max_results]:
-        if score > 0:
-            row = data[idx]
-            results.append({col: row.get(col, "") for col in output_cols if col in row})
 
-    return results
+def _search_csv_many(filepath, search_cols, output_cols, queries, max_results):
+    """Batch variant of _search_csv: one result list per query"""
+    if not filepath.exists():
+        return [[] for _ in queries]
+
+    keys = [_cache_key(filepath, query, max_results) for query in queries]
+    batches = [QUERY_CACHE.get(key) for key in keys]
+    misses = [i for i, cached in enumerate(batches) if cached is None]
+
+    if misses:
+        bm25, store = _load_index(filepath, search_cols)
+        ranked_many = bm25.top_k_many([queries[i] for i in misses], max_results)
+        for i, ranked in zip(misses, ranked_many):
+            hits = [idx for idx, score in ranked if score > 0]
+            batches[i] = [_output_row(row, output_cols) for row in store.rows(hits)]
+            QUERY_CACHE.put(keys[i], batches[i])
+    return [_copy_results(results) for results in batches]
 
 
 def detect_domain(query):
@@ -236,6 +895,42 @@ def search(query, domain=None, max_results=MAX_RESULTS):
     }
 
 
+def search_many(queries, domain=None, max_results=MAX_RESULTS):
+    """Run a batch of queries, scoring each domain's queries together.
+
+    Returns one result dict per query, shaped exactly like search().
+    Without a domain every query is auto-detected and grouped by domain.
+    """
+    queries = list(queries)
+    domains = [domain or detect_domain(q) for q in queries]
+    responses = [None] * len(queries)
+
+    groups = {}
+    for pos, name in enumerate(domains):
+        groups.setdefault(name, []).append(pos)
+
+    for name, positions in groups.items():
+        config = CSV_CONFIG.get(name, CSV_CONFIG["style"])
+        filepath = DATA_DIR / config["file"]
+        if not filepath.exists():
+            for pos in positions:
+                responses[pos] = {"error": f"File not found: {filepath}", "domain": name}
+            continue
+
+        batch = _search_csv_many(filepath, config["search_cols"], config["output_cols"],
+                                 [queries[pos] for pos in positions], max_results)
+        for pos, results in zip(positions, batch):
+            responses[pos] = {
+                "domain": name,
+                "query": queries[pos],
+                "file": config["file"],
+                "count": len(results),
+                "results": results
+            }
+
+    return responses
+
+
 def search_stack(query, stack, max_results=MAX_RESULTS):
     """Search stack-specific guidelines"""
     if stack not in STACK_CONFIG:
@@ -0,0 +1,223 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+UI/UX Pro Max Daemon - keeps every BM25 index warm in one long-lived process
+and answers search requests as JSON lines.
+
+Usage:
+    python search.py --serve                 # Unix socket (default path below)
+    python search.py --serve --stdio         # JSON lines on stdin/stdout
+
+Protocol (one JSON object per line, one response line per request):
+    {"op": "search", "query": "...", "domain": "ux", "max_results": 3}
+    {"op": "search_stack", "query": "...", "stack": "react", "max_results": 3}
+    {"op": "design_system", "query": "...", "project_name": "...", "format": "ascii",
+     "persist": false, "page": null, "output_dir": "/abs/path"}
+    {"op": "cache_stats"} | {"op": "ping"} | {"op": "shutdown"}
+
+Responses are {"ok": true, "result": ...} or {"ok": false, "error": "..."}.
+search.py tries the socket first and falls back to in-process search when no
+daemon is listening (or UIPRO_NO_DAEMON is set).
+"""
+
+import getpass
+import json
+import os
+import socket
+import socketserver
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+# Keep this module import-light: clients load it before core/design_system.
+SOCKET_PATH = Path(os.environ.get("UIPRO_SOCKET") or
+                   Path(tempfile.gettempdir()) / f"uipro-{getpass.getuser()}.sock")
+CLIENT_TIMEOUT = 30
+
+# Expected JSON types of request fields (None allowed for the optional ones)
+FIELD_TYPES = {
+    "query": (str,),
+    "domain": (str, type(None)),
+    "stack": (str,),
+    "max_results": (int,),
+    "project_name": (str, type(None)),
+    "format": (str,),
+    "persist": (bool,),
+    "page": (str, type(None)),
+    "output_dir": (str, type(None)),
+}
+
+
+# ============ REQUEST HANDLING ============
+def _field_error(request: dict):
+    """Error message for the first field with the wrong JSON type, else None."""
+    for field, types in FIELD_TYPES.items():
+        if field not in request:
+            continue
+        value = request[field]
+        # bool is an int subclass; "max_results": true is still a type error
+        if not isinstance(value, types) or (isinstance(value, bool) and bool not in types):
+            expected = " or ".join("null" if t is type(None) else t.__name__ for t in types)
+            return f"Field '{field}' must be {expected}, got {type(value).__name__}"
+    return None
+
+
+def handle(request: dict) -> dict:
+    """Dispatch a single protocol request; never raises, errors become ok=false replies."""
+    from core import search, search_stack
+    from design_system import generate_design_system
+
+    op = request.get("op", "search")
+    error = _field_error(request)
+    if error:
+        return {"ok": False, "error": error}
+    try:
+        if op == "ping":
+            return {"ok": True, "result": "pong", "pid": os.getpid()}
+        if op == "cache_stats":
+            from core import cache_stats
+            return {"ok": True, "result": cache_stats()}
+        if op == "search":
+            result = search(request["query"], request.get("domain"), request.get("max_results", 3))
+        elif op == "search_stack":
+            result = search_stack(request["query"], request["stack"], request.get("max_results", 3))
+        elif op == "design_system":
+            result = generate_design_system(
+                request["query"],
+                request.get("project_name"),
+                request.get("format", "ascii"),
+                persist=request.get("persist", False),
+                page=request.get("page"),
+                output_dir=request.get("output_dir")
+            )
+        else:
+            return {"ok": False, "error": f"Unknown op: {op}"}
+    except KeyError as e:
+        return {"ok": False, "error": f"Missing field: {e.args[0]}"}
+    except Exception as e:
+        return {"ok": False, "error": f"{type(e).__name__}: {e}"}
+    return {"ok": True, "result": result}
+
+
+def _respond(line: str) -> tuple:
+    """Decode one request line, return (response line, shutdown requested)."""
+    try:
+        request = json.loads(line)
+    except json.JSONDecodeError as e:
+        return json.dumps({"ok": False, "error": f"Invalid JSON: {e}"}), False
+    if not isinstance(request, dict):
+        return json.dumps({"ok": False, "error": "Request must be a JSON object"}), False
+    if request.get("op") == "shutdown":
+        return json.dumps({"ok": True, "result": "bye"}), True
+    try:
+        return json.dumps(handle(request), ensure_ascii=False), False
+    except Exception as e:  # e.g. a result that is not JSON-serializable
+        return json.dumps({"ok": False, "error": f"{type(e).__name__}: {e}"}), False
+
+
+def warm() -> int:
+    """Load every domain and stack index into this process."""
+    from core import build_indexes
+    return len(build_indexes())
+
+
+# ============ SERVERS ============
+class _LineHandler(socketserver.StreamRequestHandler):
+    def handle(self):
+        for raw in self.rfile:
+            line = raw.decode("utf-8", errors="replace").strip()
+            if not line:
+                continue
+            try:
+                response, stop = _respond(line)
+            except Exception as e:  # one bad request must not drop the connection
+                response, stop = json.dumps({"ok": False, "error": f"{type(e).__name__}: {e}"}), False
+            self.wfile.write(response.encode("utf-8") + b"\n")
+            self.wfile.flush()
+            if stop:
+                threading.Thread(target=self.server.shutdown, daemon=True).start()
+                return
+
+
+class _Server(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+
+def serve_socket(path: Path = None):
+    """Serve the protocol on a Unix socket until a shutdown request."""
+    if not hasattr(socket, "AF_UNIX"):
+        print("Unix sockets are not available here; use --stdio", file=sys.stderr)
+        return 1
+    path = Path(path or SOCKET_PATH)
+    if ping(path):
+        print(f"Daemon already running on {path}", file=sys.stderr)
+        return 1
+    if path.exists():
+        path.unlink()  # stale socket from a crashed daemon
+
+    count = warm()
+    with _Server(str(path), _LineHandler) as server:
+        os.chmod(path, 0o600)
+        print(f"UI Pro Max daemon: {count} indexes warm, listening on {path}", file=sys.stderr)
+        try:
+            server.serve_forever()
+        except KeyboardInterrupt:
+            pass
+        finally:
+            if path.exists():
+                path.unlink()
+    return 0
+
+
+def serve_stdio():
+    """Serve the protocol over stdin/stdout until EOF or a shutdown request."""
+    warm()
+    for line in sys.stdin:
+        line = line.strip()
+        if not line:
+            continue
+        response, stop = _respond(line)
+        sys.stdout.write(response + "\n")
+        sys.stdout.flush()
+        if stop:
+            break
+    return 0
+
+
+# ============ CLIENT ============
+def _send(payload: dict, path: Path, timeout: float):
+    """Round-trip one request over the socket; None on any connection error."""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as sock:
+            sock.settimeout(timeout)
+            sock.connect(str(path))
+            sock.sendall(json.dumps(payload).encode("utf-8") + b"\n")
+            with sock.makefile("rb") as reader:
+                line = reader.readline()
+    except OSError:
+        return None
+    return json.loads(line) if line else None
+
+
+def request(payload: dict, path: Path = None, timeout: float = CLIENT_TIMEOUT):
+    """Send one request to a running daemon; None if no daemon is reachable."""
+    if os.environ.get("UIPRO_NO_DAEMON") or not hasattr(socket, "AF_UNIX"):
+        return None
+    path = Path(path or SOCKET_PATH)
+    if not path.exists():
+        return None
+    return _send(payload, path, timeout)
+
+
+def ping(path: Path = None) -> bool:
+    """True when a daemon answers on path."""
+    path = Path(path or SOCKET_PATH)
+    if not hasattr(socket, "AF_UNIX") or not path.exists():
+        return False
+    response = _send({"op": "ping"}, path, timeout=2)
+    return bool(response and response.get("ok"))
+
+
+if __name__ == "__main__":
+    sys.exit(serve_stdio() if "--stdio" in sys.argv else serve_socket())
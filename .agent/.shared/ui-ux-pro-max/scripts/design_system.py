@@ -16,9 +16,11 @@ Usage:
 import csv
 import json
 import os
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from datetime import datetime
 from pathlib import Path
-from core import search, DATA_DIR
+from core import search, search_many, DATA_DIR
 
 
 # ============ CONFIGURATION ============
@@ -32,13 +34,47 @@ SEARCH_CONFIG = {
     "typography": {"max_results": 2}
 }
 
+# Searches behind each page override file
+OVERRIDE_SEARCH_CONFIG = {
+    "style": 1,
+    "ux": 3,
+    "landing": 1
+}
+
+# Per-domain fan-out: "thread" (default), "process" or "serial"
+SEARCH_EXECUTOR = os.environ.get("UIPRO_SEARCH_EXECUTOR", "thread")
+SEARCH_WORKERS = int(os.environ.get("UIPRO_SEARCH_WORKERS", len(SEARCH_CONFIG)))
+
+# Pools are created once and reused so workers keep their loaded indexes warm
+_EXECUTORS = {}
+
+
+def _get_executor(kind: str, max_workers: int):
+    """Shared thread/process pool for multi-domain searches."""
+    key = (kind, max_workers)
+    if key not in _EXECUTORS:
+        pool_cls = ProcessPoolExecutor if kind == "process" else ThreadPoolExecutor
+        _EXECUTORS[key] = pool_cls(max_workers=max_workers)
+    return _EXECUTORS[key]
+
+
+def _timed_search(query: str, domain: str, max_results: int) -> dict:
+    """search() plus wall-clock timing; top-level so process pools can pickle it."""
+    start = time.perf_counter()
+    result = search(query, domain, max_results)
+    result["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 3)
+    return result
+
 
 # ============ DESIGN SYSTEM GENERATOR ============
 class DesignSystemGenerator:
     """Generates design system recommendations from aggregated searches."""
 
-    def __init__(self):
+    def __init__(self, executor: str = None, max_workers: int = None):
         self.reasoning_data = self._load_reasoning()
+        self.executor = executor or SEARCH_EXECUTOR
+        self.max_workers = max_workers or SEARCH_WORKERS
+        self.last_timing = {}
 
     def _load_reasoning(self) -> list:
         """Load reasoning rules from CSV."""
@@ -48,17 +84,44 @@ class DesignSystemGenerator:
         with open(filepath, 'r', encoding='utf-8') as f:
             return list(csv.DictReader(f))
 
+    def _domain_query(self, domain: str, query: str, style_priority: list = None) -> str:
+        """Query string used for one domain of the multi-domain search."""
+        if domain == "style" and style_priority:
+            # For style, also search with priority keywords
+            priority_query = " ".join(style_priority[:2]) if style_priority else query
+            return f"{query} {priority_query}"
+        return query
+
     def _multi_domain_search(self, query: str, style_priority: list = None) -> dict:
-        """Execute searches across multiple domains."""
-        results = {}
+        """Execute searches across multiple domains concurrently.
+
+        Each per-domain result carries its own "elapsed_ms"; the overall
+        wall-clock is recorded in self.last_timing["total_ms"].
+        """
+        start = time.perf_counter()
+        jobs = {domain: (self._domain_query(domain, query, style_priority), domain, config["max_results"])
+                for domain, config in SEARCH_CONFIG.items()}
+
+        if self.executor == "serial" or self.max_workers <= 1:
+            results = {domain: _timed_search(*args) for domain, args in jobs.items()}
+        else:
+            pool = _get_executor(self.executor, self.max_workers)
+            futures = {domain: pool.submit(_timed_search, *args) for domain, args in jobs.items()}
+            results = {domain: future.result() for domain, future in futures.items()}
+
+        self.last_timing = {domain: result.get("elapsed_ms", 0) for domain, result in results.items()}
+        self.last_timing["total_ms"] = round((time.perf_counter() - start) * 1000, 3)
+        return results
+
+    def _multi_domain_search_many(self, queries: list, style_priorities: list) -> list:
+        """Batched _multi_domain_search: one search_many call per domain."""
+        results = [{} for _ in queries]
         for domain, config in SEARCH_CONFIG.items():
-            if domain == "style" and style_priority:
-                # For style, also search with priority keywords
-                priority_query = " ".join(style_priority[:2]) if style_priority else query
-                combined_query = f"{query} {priority_query}"
-                results[domain] = search(combined_query, domain, config["max_results"])
-            else:
-                results[domain] = search(query, domain, config["max_results"])
+            if domain == "product":
+                continue  # callers already ran the product search
+            domain_queries = [self._domain_query(domain, q, p) for q, p in zip(queries, style_priorities)]
+            for result, found in zip(results, search_many(domain_queries, domain, config["max_results"])):
+                result[domain] = found
         return results
 
     def _find_reasoning_rule(self, category: str) -> dict:
@@ -160,23 +223,48 @@ class DesignSystemGenerator:
         """Extract results list from search result dict."""
         return search_result.get("results", [])
 
-    def generate(self, query: str, project_name: str = None) -> dict:
-        """Generate complete design system recommendation."""
-        # Step 1: First search product to get category
-        product_result = search(query, "product", 1)
+    def _category_reasoning(self, product_result: dict) -> tuple:
+        """Product category and reasoning rules from a product search."""
         product_results = product_result.get("results", [])
         category = "General"
         if product_results:
             category = product_results[0].get("Product Type", "General")
+        return category, self._apply_reasoning(category, {})
+
+    def generate(self, query: str, project_name: str = None) -> dict:
+        """Generate complete design system recommendation."""
+        # Step 1: First search product to get category
+        product_result = search(query, "product", 1)
 
         # Step 2: Get reasoning rules for this category
-        reasoning = self._apply_reasoning(category, {})
+        category, reasoning = self._category_reasoning(product_result)
         style_priority = reasoning.get("style_priority", [])
 
         # Step 3: Multi-domain search with style priority hints
         search_results = self._multi_domain_search(query, style_priority)
         search_results["product"] = product_result  # Reuse product search
 
+        return self._compose(query, project_name, category, reasoning, search_results)
+
+    def generate_many(self, queries: list, project_names: list = None) -> list:
+        """Generate design systems for several queries with batched searches."""
+        project_names = project_names or [None] * len(queries)
+        product_results = search_many(queries, "product", 1)
+        categories, reasonings = [], []
+        for product_result in product_results:
+            category, reasoning = self._category_reasoning(product_result)
+            categories.append(category)
+            reasonings.append(reasoning)
+
+        batched = self._multi_domain_search_many(queries, [r.get("style_priority", []) for r in reasonings])
+        systems = []
+        for i, query in enumerate(queries):
+            batched[i]["product"] = product_results[i]
+            systems.append(self._compose(query, project_names[i], categories[i], reasonings[i], batched[i]))
+        return systems
+
+    def _compose(self, query: str, project_name: str, category: str, reasoning: dict, search_results: dict) -> dict:
+        """Build the final design system from per-domain search results."""
         # Step 4: Select best matches from each domain using priority
         style_results = self._extract_results(search_results.get("style", {}))
         color_results = self._extract_results(search_results.get("color", {}))
@@ -502,41 +590,126 @@ def persist_design_system(design_system: dict, page: str = None, output_dir: str
         dict with created file paths and status
     """
     base_dir = Path(output_dir) if output_dir else Path.cwd()
-    
+    design_system_dir, files = _plan_design_system_files(design_system, base_dir, [page] if page else [], page_query)
+
+    created_files = []
+    for path, content in files:
+        _write_file(path, content)
+        created_files.append(str(path))
+
+    return {
+        "status": "success",
+        "design_system_dir": str(design_system_dir),
+        "created_files": created_files
+    }
+
+
+def _plan_design_system_files(design_system: dict, base_dir: Path, pages: list,
+                              page_query: str = None, page_overrides: dict = None) -> tuple:
+    """
+    Render MASTER.md and page override files without writing them.
+
+    Returns (design_system_dir, [(path, content), ...]). Directories are created
+    here so the writes themselves can run in parallel.
+    """
     # Use project name for project-specific folder
     project_name = design_system.get("project_name", "default")
     project_slug = project_name.lower().replace(' ', '-')
-    
+
     design_system_dir = base_dir / "design-system" / project_slug
     pages_dir = design_system_dir / "pages"
-    
-    created_files = []
-    
+
     # Create directories
     design_system_dir.mkdir(parents=True, exist_ok=True)
     pages_dir.mkdir(parents=True, exist_ok=True)
-    
-    master_file = design_system_dir / "MASTER.md"
-    
-    # Generate and write MASTER.md
-    master_content = format_master_md(design_system)
-    with open(master_file, 'w', encoding='utf-8') as f:
-        f.write(master_content)
-    created_files.append(str(master_file))
-    
-    # If page is specified, create page override file with intelligent content
-    if page:
+
+    files = [(design_system_dir / "MASTER.md", format_master_md(design_system))]
+
+    # Page override files with intelligent content
+    for page in pages:
         page_file = pages_dir / f"{page.lower().replace(' ', '-')}.md"
-        page_content = format_page_override_md(design_system, page, page_query)
-        with open(page_file, 'w', encoding='utf-8') as f:
-            f.write(page_content)
-        created_files.append(str(page_file))
-    
-    return {
-        "status": "success",
-        "design_system_dir": str(design_system_dir),
-        "created_files": created_files
-    }
+        overrides = (page_overrides or {}).get((page, page_query))
+        files.append((page_file, format_page_override_md(design_system, page, page_query, overrides)))
+
+    return design_system_dir, files
+
+
+def _write_file(path: Path, content: str):
+    """Write a UTF-8 text file."""
+    with open(path, 'w', encoding='utf-8') as f:
+        f.write(content)
+
+
+# ============ BATCH GENERATION ============
+BATCH_IO_WORKERS = 8
+
+
+def load_manifest(path: str) -> list:
+    """
+    Load a batch manifest of projects.
+
+    JSONL: one {"project_name": ..., "query": ..., "pages": [...]} object per line
+    ("project" is accepted for project_name, pages may be a list or a string).
+    CSV: columns project_name (or project), query, pages; pages separated by ";" or ",".
+
+    Returns a list of {"project_name", "query", "pages"} dicts.
+    """
+    path = Path(path)
+    with open(path, 'r', encoding='utf-8') as f:
+        if path.suffix.lower() == ".csv":
+            raw = list(csv.DictReader(f))
+        else:
+            raw = [json.loads(line) for line in f if line.strip()]
+
+    entries = []
+    for item in raw:
+        pages = item.get("pages") or []
+        if isinstance(pages, str):
+            pages = [p for p in pages.replace(";", ",").split(",")]
+        entries.append({
+            "project_name": item.get("project_name") or item.get("project") or None,
+            "query": item["query"],
+            "pages": [p.strip() for p in pages if p and p.strip()]
+        })
+    return entries
+
+
+def generate_batch(entries: list, output_dir: str = None, io_workers: int = BATCH_IO_WORKERS) -> list:
+    """
+    Generate and persist design systems for many projects in one run.
+
+    Identical queries are generated once and identical page contexts are
+    searched once (batched per domain); files are written on a bounded
+    thread pool.
+
+    Returns one persist_design_system-style dict per entry.
+    """
+    base_dir = Path(output_dir) if output_dir else Path.cwd()
+    generator = DesignSystemGenerator()
+
+    unique_queries = list(dict.fromkeys(entry["query"] for entry in entries))
+    systems = dict(zip(unique_queries, generator.generate_many(unique_queries)))
+    page_overrides = _generate_intelligent_overrides_many(
+        list(dict.fromkeys((page, entry["query"]) for entry in entries for page in entry["pages"]))
+    )
+
+    reports, writes = [], []
+    for entry in entries:
+        design_system = dict(systems[entry["query"]])
+        design_system["project_name"] = entry["project_name"] or entry["query"].upper()
+        design_system_dir, files = _plan_design_system_files(
+            design_system, base_dir, entry["pages"], entry["query"], page_overrides
+        )
+        writes.extend(files)
+        reports.append({
+            "status": "success",
+            "design_system_dir": str(design_system_dir),
+            "created_files": [str(path) for path, _ in files]
+        })
+
+    with ThreadPoolExecutor(max_workers=max(1, io_workers)) as pool:
+        list(pool.map(lambda item: _write_file(*item), writes))
+    return reports
 
 
 def format_master_md(design_system: dict) -> str:
@@ -802,14 +975,16 @@ def format_master_md(design_system: dict) -> str:
     return "\n".join(lines)
 
 
-def format_page_override_md(design_system: dict, page_name: str, page_query: str = None) -> str:
+def format_page_override_md(design_system: dict, page_name: str, page_query: str = None,
+                            page_overrides: dict = None) -> str:
     """Format a page-specific override file with intelligent AI-generated content."""
     project = design_system.get("project_name", "PROJECT")
     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
     page_title = page_name.replace("-", " ").replace("_", " ").title()
     
-    # Detect page type and generate intelligent overrides
-    page_overrides = _generate_intelligent_overrides(page_name, page_query, design_system)
+    # Detect page type and generate intelligent overrides (unless precomputed)
+    if page_overrides is None:
+        page_overrides = _generate_intelligent_overrides(page_name, page_query, design_system)
     
     lines = []
     
@@ -920,19 +1095,46 @@ def _generate_intelligent_overrides(page_name: str, page_query: str, design_syst
     """
     from core import search
     
-    page_lower = page_name.lower()
-    query_lower = (page_query or "").lower()
-    combined_context = f"{page_lower} {query_lower}"
+    combined_context = _override_context(page_name, page_query)
     
     # Search across multiple domains for page-specific guidance
-    style_search = search(combined_context, "style", max_results=1)
-    ux_search = search(combined_context, "ux", max_results=3)
-    landing_search = search(combined_context, "landing", max_results=1)
-    
+    searches = {domain: search(combined_context, domain, max_results=n)
+                for domain, n in OVERRIDE_SEARCH_CONFIG.items()}
+    return _build_overrides(combined_context, searches)
+
+
+def _generate_intelligent_overrides_many(pairs: list) -> dict:
+    """
+    Batched _generate_intelligent_overrides for (page_name, page_query) pairs.
+
+    Identical page contexts are searched once, with one search_many call per
+    domain. Returns {(page_name, page_query): overrides}.
+    """
+    contexts = {}
+    for page_name, page_query in pairs:
+        contexts.setdefault(_override_context(page_name, page_query), []).append((page_name, page_query))
+    unique = list(contexts)
+
+    batched = {domain: search_many(unique, domain, n) for domain, n in OVERRIDE_SEARCH_CONFIG.items()}
+    overrides = {}
+    for i, context in enumerate(unique):
+        built = _build_overrides(context, {domain: batched[domain][i] for domain in batched})
+        for pair in contexts[context]:
+            overrides[pair] = built
+    return overrides
+
+
+def _override_context(page_name: str, page_query: str) -> str:
+    """Search context for a page override: page name plus project query."""
+    return f"{page_name.lower()} {(page_query or '').lower()}"
+
+
+def _build_overrides(combined_context: str, searches: dict) -> dict:
+    """Turn style/ux/landing search responses into page overrides."""
     # Extract results from search response
-    style_results = style_search.get("results", [])
-    ux_results = ux_search.get("results", [])
-    landing_results = landing_search.get("results", [])
+    style_results = searches["style"].get("results", [])
+    ux_results = searches["ux"].get("results", [])
+    landing_results = searches["landing"].get("results", [])
     
     # Detect page type from search results or context
     page_type = _detect_page_type(combined_context, style_results)
@@ -5,6 +5,7 @@ UI/UX Pro Max Search - BM25 search engine for UI/UX style guides
 Usage: python search.py "<query>" [--domain <domain>] [--stack <stack>] [--max-results 3]
        python search.py "<query>" --design-system [-p "Project Name"]
        python search.py "<query>" --design-system --persist [-p "Project Name"] [--page "dashboard"]
+       python search.py --batch projects.jsonl [-o out/] [--io-workers 8]
 
 Domains: style, prompt, color, chart, landing, product, ux, typography
 Stacks: html-tailwind, react, nextjs
@@ -12,11 +13,23 @@ Stacks: html-tailwind, react, nextjs
 Persistence (Master + Overrides pattern):
   --persist    Save design system to design-system/MASTER.md
   --page       Also create a page-specific override file in design-system/pages/
+
+Batch (many projects in one run):
+  --batch      JSONL/CSV manifest of project_name, query, pages; persists MASTER.md
+               and page overrides for every entry, sharing indexes and identical searches
+
+Daemon (warm indexes, no per-call startup):
+  --serve      Keep all indexes loaded and answer queries on a Unix socket
+  --stdio      With --serve, speak JSON lines on stdin/stdout instead
+  Plain invocations use a running daemon automatically (UIPRO_NO_DAEMON=1 opts out).
 """
 
 import argparse
-from core import CSV_CONFIG, AVAILABLE_STACKS, MAX_RESULTS, search, search_stack
-from design_system import generate_design_system, persist_design_system
+import json
+import os
+import sys
+from core import CSV_CONFIG, AVAILABLE_STACKS, MAX_RESULTS
+import daemon
 
 
 def format_output(result):
@@ -45,9 +58,44 @@ def format_output(result):
     return "\n".join(output)
 
 
+def build_request(args):
+    """Translate CLI arguments into a daemon protocol request."""
+    if args.design_system:
+        return {
+            "op": "design_system",
+            "query": args.query,
+            "project_name": args.project_name,
+            "format": args.format,
+            "persist": args.persist,
+            "page": args.page,
+            "output_dir": os.path.abspath(args.output_dir or os.getcwd())
+        }
+    if args.stack:
+        return {"op": "search_stack", "query": args.query, "stack": args.stack, "max_results": args.max_results}
+    return {"op": "search", "query": args.query, "domain": args.domain, "max_results": args.max_results}
+
+
+def run_local(payload):
+    """Answer a request in-process (no daemon running)."""
+    if payload["op"] == "design_system":
+        from design_system import generate_design_system
+        return generate_design_system(
+            payload["query"],
+            payload["project_name"],
+            payload["format"],
+            persist=payload["persist"],
+            page=payload["page"],
+            output_dir=payload["output_dir"]
+        )
+    from core import search, search_stack
+    if payload["op"] == "search_stack":
+        return search_stack(payload["query"], payload["stack"], payload["max_results"])
+    return search(payload["query"], payload["domain"], payload["max_results"])
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(description="UI Pro Max Search")
-    parser.add_argument("query", help="Search query")
+    parser.add_argument("query", nargs="?", help="Search query")
     parser.add_argument("--domain", "-d", choices=list(CSV_CONFIG.keys()), help="Search domain")
     parser.add_argument("--stack", "-s", choices=AVAILABLE_STACKS, help="Stack-specific search (html-tailwind, react, nextjs)")
     parser.add_argument("--max-results", "-n", type=int, default=MAX_RESULTS, help="Max results (default: 3)")
@@ -60,19 +108,43 @@ if __name__ == "__main__":
     parser.add_argument("--persist", action="store_true", help="Save design system to design-system/MASTER.md (creates hierarchical structure)")
     parser.add_argument("--page", type=str, default=None, help="Create page-specific override file in design-system/pages/")
     parser.add_argument("--output-dir", "-o", type=str, default=None, help="Output directory for persisted files (default: current directory)")
+    # Batch generation over a manifest
+    parser.add_argument("--batch", type=str, default=None, help="Manifest (JSONL or CSV) of projects to generate and persist")
+    parser.add_argument("--io-workers", type=int, default=8, help="Parallel file writes in --batch mode (default: 8)")
+    # Long-lived daemon
+    parser.add_argument("--serve", action="store_true", help="Run a daemon that keeps all indexes warm")
+    parser.add_argument("--stdio", action="store_true", help="With --serve: JSON lines over stdin/stdout instead of a socket")
+    parser.add_argument("--socket", type=str, default=None, help=f"Daemon socket path (default: {daemon.SOCKET_PATH})")
 
     args = parser.parse_args()
 
+    if args.serve:
+        sys.exit(daemon.serve_stdio() if args.stdio else daemon.serve_socket(args.socket))
+    if args.batch:
+        from design_system import generate_batch, load_manifest
+        entries = load_manifest(args.batch)
+        reports = generate_batch(entries, args.output_dir, args.io_workers)
+        if args.json:
+            print(json.dumps(reports, indent=2, ensure_ascii=False))
+        else:
+            total = sum(len(r["created_files"]) for r in reports)
+            print(f"✅ {len(reports)} design systems persisted ({total} files)")
+            for report in reports:
+                print(f"   📁 {report['design_system_dir']} ({len(report['created_files'])} files)")
+        sys.exit(0)
+    if args.query is None:
+        parser.error("the following arguments are required: query")
+
+    # Prefer a running daemon, fall back to in-process search
+    payload = build_request(args)
+    response = daemon.request(payload, args.socket)
+    if response is not None and not response.get("ok"):
+        print(f"Error: {response.get('error')}")
+        sys.exit(1)
+    result = response["result"] if response is not None else run_local(payload)
+
     # Design system takes priority
     if args.design_system:
-        result = generate_design_system(
-            args.query, 
-            args.project_name, 
-            args.format,
-            persist=args.persist,
-            page=args.page,
-            output_dir=args.output_dir
-        )
         print(result)
         
         # Print persistence confirmation
@@ -88,19 +160,8 @@ if __name__ == "__main__":
             print(f"📖 Usage: When building a page, check design-system/{project_slug}/pages/[page].md first.")
             print(f"   If exists, its rules override MASTER.md. Otherwise, use MASTER.md.")
             print("=" * 60)
-    # Stack search
-    elif args.stack:
-        result = search_stack(args.query, args.stack, args.max_results)
-        if args.json:
-            import json
-            print(json.dumps(result, indent=2, ensure_ascii=False))
-        else:
-            print(format_output(result))
-    # Domain search
+    # Stack / domain search
+    elif args.json:
+        print(json.dumps(result, indent=2, ensure_ascii=False))
     else:
-        result = search(args.query, args.domain, args.max_results)
-        if args.json:
-            import json
-            print(json.dumps(result, indent=2, ensure_ascii=False))
-        else:
-            print(format_output(result))
+        print(format_output(result))
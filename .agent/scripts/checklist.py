@@ -9,6 +9,17 @@ Use this for incremental validation during development.
 Usage:
     python scripts/checklist.py .                    # Run core checks
     python scripts/checklist.py . --url <URL>        # Include performance checks
+    python scripts/checklist.py . --since main       # File audits always re-check files changed since main
+
+File-level audits (UX, Mobile) are incremental: unchanged files reuse their
+cached results (.agent/.cache/audit.db), so re-running after a small change
+only re-audits what changed.
+
+Optional checks whose script has a file_checker() run in this process, all
+on one walk and read of the project (project_scanner.run_checkers), when
+the first of them comes up; their results are reported in the usual order.
+Required ones (Security Scan) run alone at their turn, so a failure stops
+the checklist before the batch starts.
 
 Priority Order:
     P0: Security Scan (vulnerabilities, secrets)
@@ -23,8 +34,11 @@ Priority Order:
 import sys
 import subprocess
 import argparse
+import importlib.util
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import List, Tuple, Optional, Dict
+
+from project_scanner import run_checkers
 
 # ANSI colors for terminal output
 class Colors:
@@ -69,11 +83,15 @@ PERFORMANCE_CHECKS = [
     ("Playwright E2E", ".agent/skills/webapp-testing/scripts/playwright_runner.py", False),
 ]
 
+# Scripts that audit file by file and accept --since <git ref>
+INCREMENTAL_SCRIPTS = {"ux_audit.py", "mobile_audit.py"}
+
 def check_script_exists(script_path: Path) -> bool:
     """Check if script file exists"""
     return script_path.exists() and script_path.is_file()
 
-def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None) -> dict:
+def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None,
+               since: Optional[str] = None) -> dict:
     """
     Run a validation script and capture results
     
@@ -90,6 +108,8 @@ def run_script(name: str, script_path: Path, project_path: str, url: Optional[st
     cmd = ["python", str(script_path), project_path]
     if url and ("lighthouse" in script_path.name.lower() or "playwright" in script_path.name.lower()):
         cmd.append(url)
+    if since and script_path.name in INCREMENTAL_SCRIPTS:
+        cmd.extend(["--since", since])
     
     # Run script
     try:
@@ -125,6 +145,53 @@ def run_script(name: str, script_path: Path, project_path: str, url: Optional[st
         print_error(f"{name}: ERROR - {str(e)}")
         return {"name": name, "passed": False, "output": "", "error": str(e), "skipped": False}
 
+def load_file_checker(script_path: Path):
+    """
+    The script's file_checker factory, if it has one; None (run the check as
+    a subprocess) if it doesn't or can't be imported.
+    """
+    try:
+        if not check_script_exists(script_path):
+            return None
+        if "def file_checker(" not in script_path.read_text(encoding="utf-8", errors="ignore"):
+            return None
+        spec = importlib.util.spec_from_file_location(f"_check_{script_path.stem}", script_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module.file_checker
+    except Exception:
+        return None
+
+def run_in_process(checks: List[Tuple[str, Path, object]], project_path: str,
+                   since: Optional[str] = None) -> Dict[str, dict]:
+    """
+    Run (name, script, file_checker) checks in this process on one walk and
+    read of the project; returns a run_script-style result per name.
+    """
+    names = ', '.join(name for name, _, _ in checks)
+    print_step(f"Running in one pass: {names}" if len(checks) > 1 else f"Running: {names}")
+    checkers = []
+    for name, script, factory in checks:
+        if since and script.name in INCREMENTAL_SCRIPTS:
+            checkers.append(factory(project_path, since=since))
+        else:
+            checkers.append(factory(project_path))
+    try:
+        outcomes = run_checkers(project_path, checkers)
+    except Exception as e:
+        outcomes = [{"passed": False, "error": f"{type(e).__name__}: {e}"}] * len(checks)
+    
+    return {
+        name: {
+            "name": name,
+            "passed": outcome["passed"],
+            "output": outcome.get("output", ""),
+            "error": outcome.get("error", ""),
+            "skipped": False
+        }
+        for (name, _, _), outcome in zip(checks, outcomes)
+    }
+
 def print_summary(results: List[dict]):
     """Print final summary report"""
     print_header("📊 CHECKLIST SUMMARY")
@@ -167,11 +234,13 @@ def main():
 Examples:
   python scripts/checklist.py .                      # Core checks only
   python scripts/checklist.py . --url http://localhost:3000  # Include performance
+  python scripts/checklist.py . --since HEAD~1               # Re-audit files changed since HEAD~1
         """
     )
     parser.add_argument("project", help="Project path to validate")
     parser.add_argument("--url", help="URL for performance checks (lighthouse, playwright)")
     parser.add_argument("--skip-performance", action="store_true", help="Skip performance checks even if URL provided")
+    parser.add_argument("--since", help="Git ref: file-level audits always re-check files changed since it (the rest come from the audit cache)")
     
     args = parser.parse_args()
     
@@ -189,9 +258,28 @@ Examples:
     
     # Run core checks
     print_header("📋 CORE CHECKS")
+    factories = {name: load_file_checker(project_path / script_path) for name, script_path, _ in CORE_CHECKS}
+    in_process = [(name, project_path / script_path, factories[name])
+                  for name, script_path, required in CORE_CHECKS
+                  if factories[name] is not None and not required]
+    in_process_results = None
     for name, script_path, required in CORE_CHECKS:
         script = project_path / script_path
-        result = run_script(name, script, str(project_path))
+        if factories[name] is None:
+            result = run_script(name, script, str(project_path), since=args.since)
+        else:
+            if required:
+                result = run_in_process([(name, script, factories[name])], str(project_path), args.since)[name]
+            else:
+                if in_process_results is None:
+                    in_process_results = run_in_process(in_process, str(project_path), args.since)
+                result = in_process_results[name]
+            if result["passed"]:
+                print_success(f"{name}: PASSED")
+            else:
+                print_error(f"{name}: FAILED")
+                if result["error"]:
+                    print(f"  Error: {result['error'][:200]}")
         results.append(result)
         
         # If required check fails, stop
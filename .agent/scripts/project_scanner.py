@@ -0,0 +1,609 @@
+#!/usr/bin/env python3
+"""
+Project Scanner - Antigravity Kit
+=================================
+Shared file walker and content cache for the audit scripts.
+
+The project tree is walked once (unified skip list + .gitignore) and each
+file is read from disk once; checkers either ask for a filtered file list
+and read through the cache, or register a callback and get every matching
+file's content in a single pass.
+
+Inside a git work tree the file list comes from `git ls-files` (exact
+.gitignore semantics, including nested ignore files); otherwise the tree is
+walked with os.walk and the root .gitignore is applied.
+
+Usage (library):
+    from project_scanner import shared_scanner
+    scanner = shared_scanner(project_path)
+    for path in scanner.files({'.tsx', '.jsx'}):
+        content = scanner.read_text(path)     # or project_scanner.read_text(path)
+
+    scanner.register("secrets", on_file, extensions={'.py', '.env'})
+    scanner.run()
+
+    # Several scripts' checkers (register(scanner) + finish()) over one walk and read
+    results = run_checkers(project_path, [seo.file_checker(project_path), ux.file_checker(project_path)])
+
+    # Incremental: reuse per-file results of unchanged files; since= also re-audits a diff
+    audit_tree(UXAuditor(), project_path, {'.tsx'}, since="origin/main", source=__file__)
+
+    # Parallel: files that need auditing are sharded over a process pool
+    audit_tree(UXAuditor(), project_path, {'.tsx'}, source=__file__, jobs=os.cpu_count())
+
+Per-file audit results live in <project>/.agent/.cache/audit.db ($AGENT_AUDIT_CACHE),
+keyed by checker, path, checker version (hash of the checker's source) and
+content hash; an unchanged mtime+size skips even the read.
+
+Usage (CLI):
+    python .agent/scripts/project_scanner.py [path]     # file counts per extension
+"""
+
+import os
+import sys
+import json
+import fnmatch
+import hashlib
+import sqlite3
+import argparse
+import subprocess
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Set
+
+# Directories no audit script wants to look into (per-checker lists add to this)
+SKIP_DIRS = frozenset({
+    'node_modules', '.git', 'dist', 'build', '.next', '__pycache__', '.venv', 'venv', '.idea',
+})
+
+# Content kept in memory for re-reads by later checkers
+MAX_CACHE_BYTES = 256 * 1024 * 1024
+
+# Below this many files to audit, a process pool costs more than it saves
+MIN_PARALLEL_FILES = 16
+
+
+class GitIgnore:
+    """Minimal .gitignore matcher for trees that are not git work trees."""
+
+    def __init__(self, lines: Iterable[str]):
+        self.rules = []
+        for line in lines:
+            line = line.rstrip("\n").rstrip()
+            if not line or line.startswith("#"):
+                continue
+            negate = line.startswith("!")
+            if negate:
+                line = line[1:]
+            dir_only = line.endswith("/")
+            line = line.rstrip("/")
+            anchored = "/" in line  # leading or middle slash: match against the full path
+            self.rules.append((line.lstrip("/"), negate, dir_only, anchored))
+
+    @classmethod
+    def from_root(cls, root: Path) -> "GitIgnore":
+        try:
+            return cls((root / ".gitignore").read_text(encoding="utf-8", errors="ignore").splitlines())
+        except OSError:
+            return cls([])
+
+    def ignored(self, rel: str, is_dir: bool) -> bool:
+        result = False
+        name = rel.rsplit("/", 1)[-1]
+        for pattern, negate, dir_only, anchored in self.rules:
+            if dir_only and not is_dir:
+                continue
+            target = rel if anchored else name
+            if fnmatch.fnmatch(target, pattern):
+                result = not negate
+        return result
+
+
+class ContentCache:
+    """Raw file bytes keyed by absolute path, read from disk once per process."""
+
+    def __init__(self, max_bytes: int = MAX_CACHE_BYTES):
+        self.max_bytes = max_bytes
+        self._raw: Dict[Path, bytes] = {}
+        self._cached_bytes = 0
+        self.stats = {"reads": 0, "hits": 0}
+
+    def read_bytes(self, path, cache: bool = True) -> bytes:
+        path = Path(path).absolute()
+        raw = self._raw.get(path)
+        if raw is not None:
+            self.stats["hits"] += 1
+            return raw
+        raw = path.read_bytes()
+        self.stats["reads"] += 1
+        if cache and self._cached_bytes + len(raw) <= self.max_bytes:
+            self._raw[path] = raw
+            self._cached_bytes += len(raw)
+        return raw
+
+    def read_text(self, path, errors: str = "ignore", cache: bool = True) -> str:
+        return self.read_bytes(path, cache).decode("utf-8", errors=errors)
+
+
+CONTENT_CACHE = ContentCache()
+
+
+def read_text(path, errors: str = "ignore") -> str:
+    """Cached replacement for Path.read_text(encoding='utf-8', errors=errors)."""
+    return CONTENT_CACHE.read_text(path, errors)
+
+
+class _Checker:
+    def __init__(self, name: str, callback: Callable[[Path, str], None],
+                 extensions: Optional[Set[str]], skip_dirs: Set[str],
+                 predicate: Optional[Callable[[Path], bool]], raw: bool):
+        self.name = name
+        self.callback = callback
+        self.extensions = extensions
+        self.skip_dirs = skip_dirs
+        self.predicate = predicate
+        self.raw = raw
+        self.elapsed = 0.0  # seconds spent in predicate + callback
+        self.error: Optional[Exception] = None
+
+
+class ProjectScanner:
+    """One walk and one read per file, shared by every checker in the process."""
+
+    def __init__(self, root, skip_dirs: Iterable[str] = SKIP_DIRS, use_gitignore: bool = True,
+                 max_cache_bytes: int = MAX_CACHE_BYTES):
+        self.root = Path(root).resolve()
+        self.skip_dirs = frozenset(skip_dirs)
+        self.use_gitignore = use_gitignore
+        self.max_cache_bytes = max_cache_bytes
+        self._files: Optional[List[Path]] = None
+        self._checkers: List[_Checker] = []
+        self.content = CONTENT_CACHE if max_cache_bytes == MAX_CACHE_BYTES else ContentCache(max_cache_bytes)
+        self.stats = {"walks": 0}
+
+    # ============ WALK ============
+    def _git_files(self) -> Optional[List[str]]:
+        try:
+            result = subprocess.run(
+                ["git", "-C", str(self.root), "ls-files", "-z", "--cached", "--others", "--exclude-standard"],
+                capture_output=True, timeout=60,
+            )
+        except (OSError, subprocess.TimeoutExpired):
+            return None
+        if result.returncode != 0:
+            return None
+        return [p for p in result.stdout.decode("utf-8", errors="surrogateescape").split("\0") if p]
+
+    def _walk_files(self) -> List[str]:
+        ignore = GitIgnore.from_root(self.root) if self.use_gitignore else GitIgnore([])
+        found = []
+        for root_dir, dirs, files in os.walk(self.root):
+            rel_dir = os.path.relpath(root_dir, self.root).replace(os.sep, "/")
+            rel_dir = "" if rel_dir == "." else rel_dir + "/"
+            dirs[:] = [d for d in dirs
+                       if d not in self.skip_dirs and not ignore.ignored(rel_dir + d, True)]
+            found.extend(rel_dir + f for f in files if not ignore.ignored(rel_dir + f, False))
+        return found
+
+    def walk(self) -> List[Path]:
+        """Every file under root that survives the skip list and .gitignore, in path order."""
+        if self._files is None:
+            self.stats["walks"] += 1
+            rel_paths = self._git_files() if self.use_gitignore else None
+            if rel_paths is None:
+                rel_paths = self._walk_files()
+            files = []
+            for rel in sorted(set(rel_paths)):
+                parts = rel.split("/")
+                if any(part in self.skip_dirs for part in parts[:-1]):
+                    continue
+                path = self.root.joinpath(*parts)
+                if path.is_file():
+                    files.append(path)
+            self._files = files
+        return self._files
+
+    def files(self, extensions: Optional[Iterable[str]] = None, skip_dirs: Iterable[str] = (),
+              predicate: Optional[Callable[[Path], bool]] = None) -> List[Path]:
+        """
+        Subset of walk(): extensions are matched case-insensitively against the
+        suffix, skip_dirs are extra directory names for this checker only.
+        """
+        exts = {e.lower() for e in extensions} if extensions is not None else None
+        extra = set(skip_dirs)
+        return [p for p in self.walk() if self._accepts(p, exts, extra, predicate)]
+
+    def _accepts(self, path: Path, extensions: Optional[Set[str]], skip_dirs: Set[str],
+                 predicate: Optional[Callable[[Path], bool]]) -> bool:
+        if extensions is not None and path.suffix.lower() not in extensions:
+            return False
+        if skip_dirs and any(part in skip_dirs for part in path.relative_to(self.root).parts[:-1]):
+            return False
+        return predicate is None or predicate(path)
+
+    # ============ CONTENT ============
+    def read_bytes(self, path: Path, cache: bool = True) -> bytes:
+        return self.content.read_bytes(path, cache)
+
+    def read_text(self, path: Path, errors: str = "ignore", cache: bool = True) -> str:
+        """File content decoded as UTF-8 (raises OSError like open() would)."""
+        return self.content.read_text(path, errors, cache)
+
+    def changed_since(self, ref: str) -> Optional[Set[Path]]:
+        """Files changed since git ref (committed, staged, unstaged or untracked); None if git can't tell."""
+        changed = set()
+        for cmd in (["diff", "-z", "--name-only", "--relative", ref, "--"],
+                    ["ls-files", "-z", "--others", "--exclude-standard"]):
+            try:
+                result = subprocess.run(["git", "-C", str(self.root)] + cmd, capture_output=True, timeout=60)
+            except (OSError, subprocess.TimeoutExpired):
+                return None
+            if result.returncode != 0:
+                return None
+            rel_paths = result.stdout.decode("utf-8", errors="surrogateescape").split("\0")
+            changed.update(self.root.joinpath(*rel.split("/")) for rel in rel_paths if rel)
+        return changed
+
+    # ============ SINGLE-PASS DISPATCH ============
+    def register(self, name: str, callback: Callable[[Path, str], None],
+                 extensions: Optional[Iterable[str]] = None, skip_dirs: Iterable[str] = (),
+                 predicate: Optional[Callable[[Path], bool]] = None, raw: bool = False) -> None:
+        """
+        callback(path, content) is called by run() for every matching file;
+        raw=True passes the file's bytes instead of the decoded text.
+        """
+        exts = {e.lower() for e in extensions} if extensions is not None else None
+        self._checkers.append(_Checker(name, callback, exts, set(skip_dirs), predicate, raw))
+
+    def run(self, errors: str = "ignore") -> None:
+        """Read each file wanted by at least one registered checker once and dispatch it."""
+        for checker in self._dispatch(errors):
+            if checker.error is not None:
+                raise checker.error
+
+    def _dispatch(self, errors: str, cancelled: Optional[Callable[[], bool]] = None) -> List[_Checker]:
+        """
+        run() without the raise: a checker whose predicate or callback raises
+        is dropped for the rest of the pass and keeps the exception in .error.
+        cancelled() is polled before each file; once it returns True the pass
+        stops where it is.
+        """
+        checkers, self._checkers = self._checkers, []
+        for path in self.walk():
+            if cancelled is not None and cancelled():
+                break
+            interested = []
+            for checker in checkers:
+                if checker.error is not None:
+                    continue
+                start = time.perf_counter()
+                try:
+                    if self._accepts(path, checker.extensions, checker.skip_dirs, checker.predicate):
+                        interested.append(checker)
+                except Exception as e:
+                    checker.error = e
+                checker.elapsed += time.perf_counter() - start
+            if not interested:
+                continue
+            try:
+                raw = self.read_bytes(path, cache=False)
+            except OSError:
+                continue
+            content = None
+            for checker in interested:
+                start = time.perf_counter()
+                try:
+                    if checker.raw:
+                        checker.callback(path, raw)
+                    else:
+                        if content is None:
+                            content = raw.decode("utf-8", errors=errors)
+                        checker.callback(path, content)
+                except Exception as e:
+                    checker.error = e
+                checker.elapsed += time.perf_counter() - start
+        return checkers
+
+
+# ============ INCREMENTAL AUDITS ============
+def audit_cache_path(root: Path) -> Path:
+    return Path(os.environ.get("AGENT_AUDIT_CACHE") or Path(root) / ".agent" / ".cache" / "audit.db")
+
+
+class AuditCache:
+    """
+    Per-file audit results (SQLite), one row per (checker, file).
+
+    A row is reused when the checker version matches and either mtime+size
+    are unchanged (no read needed) or the content hash is the same.
+    """
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS results (
+            checker TEXT NOT NULL,
+            path TEXT NOT NULL,
+            version TEXT NOT NULL,
+            sha256 TEXT NOT NULL,
+            mtime REAL NOT NULL,
+            size INTEGER NOT NULL,
+            result TEXT NOT NULL,
+            PRIMARY KEY (checker, path)
+        )
+    """
+
+    def __init__(self, path: Path, checker: str, version: str):
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self.conn = sqlite3.connect(str(path), timeout=30)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(self.SCHEMA)
+        self.checker = checker
+        self.version = version
+        self.stats = {"fresh": 0, "same_content": 0, "audited": 0}
+
+    def lookup(self, path: str) -> Optional[tuple]:
+        row = self.conn.execute(
+            "SELECT version, sha256, mtime, size, result FROM results WHERE checker = ? AND path = ?",
+            (self.checker, path),
+        ).fetchone()
+        if row is None or row[0] != self.version:
+            return None
+        return row[1:]
+
+    def store(self, path: str, sha256: str, mtime: float, size: int, result: dict) -> None:
+        self.conn.execute("INSERT OR REPLACE INTO results VALUES (?, ?, ?, ?, ?, ?, ?)",
+                          (self.checker, path, self.version, sha256, mtime, size, json.dumps(result)))
+
+    def close(self) -> None:
+        self.conn.commit()
+        self.conn.close()
+
+
+def checker_version(*sources) -> str:
+    """Version of a checker = hash of its source files, so editing a check invalidates its cache."""
+    digest = hashlib.sha256()
+    for source in sources:
+        digest.update(Path(source).read_bytes())
+    return digest.hexdigest()[:16]
+
+
+def audit_file_result(auditor_cls, filepath: Path, content: str) -> dict:
+    """What audit_file adds for one file, from a fresh auditor (issues, warnings, passed, checked)."""
+    auditor = auditor_cls()
+    auditor.audit_file(str(filepath), content)
+    return {"issues": auditor.issues, "warnings": auditor.warnings,
+            "passed": auditor.passed_count, "checked": auditor.files_checked}
+
+
+def merge_file_result(auditor, result: dict) -> None:
+    auditor.issues.extend(result["issues"])
+    auditor.warnings.extend(result["warnings"])
+    auditor.passed_count += result["passed"]
+    auditor.files_checked += result["checked"]
+
+
+def _audit_shard(auditor_cls, shard: List[tuple]) -> List[dict]:
+    """Pool worker: per-file results for a list of (path, content), in order."""
+    return [audit_file_result(auditor_cls, path, content) for path, content in shard]
+
+
+def _audit_parallel(auditor_cls, pending: List[tuple], jobs: int) -> List[dict]:
+    """
+    audit_file_result for each (path, content) in pending, sharded over a
+    process pool; results come back in pending's order.
+    """
+    workers = min(jobs, len(pending))
+    # A few shards per worker evens out files of very different sizes
+    size = -(-len(pending) // (workers * 4))
+    shards = [pending[i:i + size] for i in range(0, len(pending), size)]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        results = pool.map(_audit_shard, [auditor_cls] * len(shards), shards)
+        return [result for shard in results for result in shard]
+
+
+class TreeAudit:
+    """
+    audit_tree as a scanner checker: register() hooks the audit into a
+    ProjectScanner pass, finish() merges the results into the auditor and
+    returns the run's summary. Cache-fresh files are filtered out before
+    they are read; files changed since `since` always skip the cache.
+    """
+
+    def __init__(self, auditor, extensions: Iterable[str], skip_dirs: Iterable[str] = (),
+                 since: Optional[str] = None, use_cache: bool = True, source: Optional[str] = None,
+                 errors: str = "replace", jobs: int = 1):
+        self.auditor = auditor
+        self.extensions = extensions
+        self.skip_dirs = skip_dirs
+        self.since = since
+        self.use_cache = use_cache
+        self.source = source
+        self.errors = errors
+        self.jobs = jobs
+        self.summary = {"files": 0, "since": since, "changed": 0}
+        self.root: Optional[Path] = None
+        self.changed: Optional[Set[Path]] = None
+        self.cache: Optional[AuditCache] = None
+        # One slot per file in path order: a cached result, or None for an entry of pending
+        self.slots: List[Optional[dict]] = []
+        self.pending: List[tuple] = []
+        self.keys: Dict[int, tuple] = {}
+        self._current: Optional[tuple] = None
+
+    def register(self, scanner: ProjectScanner) -> None:
+        self.root = scanner.root
+        if self.since:
+            self.changed = scanner.changed_since(self.since)
+            if self.changed is None:
+                print(f"[!] git could not diff against '{self.since}', auditing every file", file=sys.stderr)
+        if self.use_cache:
+            version = checker_version(self.source) if self.source else "1"
+            self.cache = AuditCache(audit_cache_path(scanner.root), type(self.auditor).__name__, version)
+        scanner.register(type(self.auditor).__name__, self._on_file, self.extensions, self.skip_dirs,
+                         self._wants, raw=True)
+
+    def _wants(self, path: Path) -> bool:
+        self.summary["files"] += 1
+        changed = self.changed is not None and path in self.changed
+        self.summary["changed"] += changed
+        if self.cache is None:
+            return True
+        rel = path.relative_to(self.root).as_posix()
+        try:
+            stat = path.stat()
+        except OSError:
+            return False
+        # Unchanged files still count, from the cache; changed ones are always re-audited
+        cached = None if changed else self.cache.lookup(rel)
+        if cached and cached[1] == stat.st_mtime and cached[2] == stat.st_size:
+            self.cache.stats["fresh"] += 1
+            self.slots.append(json.loads(cached[3]))
+            return False
+        # The scanner calls _on_file for this path before asking about the next one
+        self._current = (rel, stat, cached)
+        return True
+
+    def _on_file(self, path: Path, raw: bytes) -> None:
+        if self.cache is None:
+            self.pending.append((path, raw.decode("utf-8", errors=self.errors)))
+            self.slots.append(None)
+            return
+        rel, stat, cached = self._current
+        sha256 = hashlib.sha256(raw).hexdigest()
+        if cached and cached[0] == sha256:
+            self.cache.stats["same_content"] += 1
+            result = json.loads(cached[3])
+            self.cache.store(rel, sha256, stat.st_mtime, stat.st_size, result)
+            self.slots.append(result)
+            return
+        self.cache.stats["audited"] += 1
+        self.keys[len(self.pending)] = (rel, sha256, stat.st_mtime, stat.st_size)
+        self.pending.append((path, raw.decode("utf-8", errors=self.errors)))
+        self.slots.append(None)
+
+    def finish(self) -> dict:
+        auditor_cls = type(self.auditor)
+        parallel = self.jobs > 1 and len(self.pending) >= MIN_PARALLEL_FILES
+        if parallel:
+            fresh = _audit_parallel(auditor_cls, self.pending, self.jobs)
+        else:
+            fresh = [audit_file_result(auditor_cls, path, content) for path, content in self.pending]
+        if self.cache is not None:
+            for i, key in self.keys.items():
+                self.cache.store(*key, fresh[i])
+
+        audited = iter(fresh)
+        for result in self.slots:
+            merge_file_result(self.auditor, result if result is not None else next(audited))
+
+        self.summary["jobs"] = min(self.jobs, len(self.pending)) if parallel else 1
+        if self.cache is not None:
+            self.summary.update(self.cache.stats)
+            self.cache.close()
+        return self.summary
+
+
+def audit_tree(auditor, directory, extensions: Iterable[str], skip_dirs: Iterable[str] = (),
+               since: Optional[str] = None, use_cache: bool = True, source: Optional[str] = None,
+               errors: str = "replace", jobs: int = 1) -> dict:
+    """
+    Run auditor.audit_file over the project files, merged in path order.
+
+    since: files changed since this git ref are always re-audited, the rest
+    contribute their cached results (or are audited if they have none), so
+    the report still covers the whole tree. use_cache: per-file results are
+    reused from AuditCache when the file is unchanged; source is the
+    checker's script, hashed into the cache version. jobs > 1 audits the
+    files that need it in a process pool (the auditor class must be
+    picklable, i.e. importable or defined in __main__); the report is the
+    same as a serial run.
+    """
+    audit = TreeAudit(auditor, extensions, skip_dirs, since, use_cache, source, errors, jobs)
+    scanner = shared_scanner(directory)
+    audit.register(scanner)
+    scanner.run()
+    return audit.finish()
+
+
+_SCANNERS: Dict[Path, ProjectScanner] = {}
+
+
+def shared_scanner(root) -> ProjectScanner:
+    """Process-wide scanner for root, so checkers running in one process share walk and reads."""
+    key = Path(root).resolve()
+    if key not in _SCANNERS:
+        _SCANNERS[key] = ProjectScanner(key)
+    return _SCANNERS[key]
+
+
+def run_checkers(root, checkers: list, errors: str = "ignore",
+                 cancelled: Optional[Callable[[], bool]] = None) -> List[dict]:
+    """
+    Run several checkers over a single walk and read of root.
+
+    A checker is any object with register(scanner), which registers its
+    per-file callbacks on the scanner, and finish() -> {"passed": bool,
+    "output": str}, called once the pass is over. Results come back in
+    checkers' order with "duration" (time spent in that checker's
+    callbacks and finish); a checker that raises fails with "error"
+    without affecting the others.
+
+    cancelled() is polled between files and between checkers: once it
+    returns True the pass stops and the checkers not finished yet come back
+    as {"passed": True, "skipped": True, "cancelled": True}.
+    """
+    scanner = shared_scanner(root)
+    setup = []
+    for checker in checkers:
+        first = len(scanner._checkers)
+        start = time.perf_counter()
+        try:
+            checker.register(scanner)
+            error = None
+        except Exception as e:
+            error = e
+        setup.append((scanner._checkers[first:], time.perf_counter() - start, error))
+    scanner._dispatch(errors, cancelled)
+
+    results = []
+    for checker, (entries, elapsed, error) in zip(checkers, setup):
+        elapsed += sum(entry.elapsed for entry in entries)
+        if cancelled is not None and cancelled():
+            results.append({"passed": True, "skipped": True, "cancelled": True, "duration": elapsed})
+            continue
+        error = error or next((entry.error for entry in entries if entry.error is not None), None)
+        start = time.perf_counter()
+        if error is None:
+            try:
+                result = dict(checker.finish())
+            except Exception as e:
+                error = e
+        if error is not None:
+            result = {"passed": False, "output": "", "error": f"{type(error).__name__}: {error}"}
+        result["duration"] = elapsed + time.perf_counter() - start
+        results.append(result)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Show what the audit scripts will scan")
+    parser.add_argument("path", nargs="?", default=".", help="Project path")
+    parser.add_argument("--no-gitignore", action="store_true", help="Do not apply .gitignore")
+    args = parser.parse_args()
+
+    scanner = ProjectScanner(args.path, use_gitignore=not args.no_gitignore)
+    files = scanner.walk()
+    by_ext: Dict[str, int] = {}
+    for path in files:
+        ext = path.suffix.lower() or "(none)"
+        by_ext[ext] = by_ext.get(ext, 0) + 1
+
+    print(f"\n📂 {scanner.root}: {len(files)} files")
+    for ext, count in sorted(by_ext.items(), key=lambda kv: -kv[1])[:20]:
+        print(f"   {ext:<10} {count}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,6 +8,16 @@ Use this before deployment or major releases.
 
 Usage:
     python scripts/verify_all.py . --url <URL>
+    python scripts/verify_all.py . --url <URL> -j 1     # one check at a time
+
+Independent checks run concurrently (one subprocess per check, up to
+--jobs at a time, default = CPU cores). Checks are started in priority
+order (security first) and only after the checks they depend on
+(CHECK_DEPENDENCIES) have finished. Optional file-level checks whose script
+has a file_checker() (types, schema, UX, a11y, SEO, GEO, mobile, i18n) run
+in this process instead, together, on a single walk and read of the project
+(project_scanner.run_checkers); required ones (security) keep their own
+process, so a failure stops the run without waiting for the batch.
 
 Includes ALL checks:
     ✅ Security Scan (OWASP, secrets, dependencies)
@@ -22,13 +32,20 @@ Includes ALL checks:
     ✅ Mobile Audit (if applicable)
 """
 
+import os
 import sys
+import time
 import subprocess
 import argparse
+import threading
+import importlib.util
+from concurrent.futures import ThreadPoolExecutor, FIRST_COMPLETED, wait
 from pathlib import Path
 from typing import List, Dict, Optional
 from datetime import datetime
 
+from project_scanner import run_checkers
+
 # ANSI colors
 class Colors:
     HEADER = '\033[95m'
@@ -147,11 +164,36 @@ VERIFICATION_SUITE = [
     },
 ]
 
-def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None) -> dict:
-    """Run validation script"""
+# Checks that must wait for others (name -> names it waits for).
+# Anything not listed is independent and runs as soon as a worker is free.
+CHECK_DEPENDENCIES = {
+    # Lighthouse measures the page; don't hit the same URL with E2E traffic meanwhile
+    "Playwright E2E": ["Lighthouse Audit"],
+}
+
+def print_outcome(name: str, result: dict):
+    if result["passed"]:
+        print_success(f"{name}: PASSED ({result['duration']:.1f}s)")
+    else:
+        print_error(f"{name}: FAILED ({result['duration']:.1f}s)")
+        if result.get("error"):
+            print(f"  {result['error'][:300]}")
+
+def run_script(name: str, script_path: Path, project_path: str, url: Optional[str] = None,
+               procs: Optional[Dict[str, subprocess.Popen]] = None,
+               abort: Optional[threading.Event] = None) -> dict:
+    """
+    Run validation script
+
+    procs/abort are used by the scheduler: the running process is registered
+    in procs so it can be terminated, and a check killed after abort is set
+    is reported as cancelled instead of failed.
+    """
     if not script_path.exists():
         print_warning(f"{name}: Script not found, skipping")
         return {"name": name, "passed": True, "skipped": True, "duration": 0}
+    if abort is not None and abort.is_set():
+        return {"name": name, "passed": True, "skipped": True, "cancelled": True, "duration": 0}
     
     print_step(f"Running: {name}")
     start_time = datetime.now()
@@ -163,31 +205,34 @@ def run_script(name: str, script_path: Path, project_path: str, url: Optional[st
     
     # Run
     try:
-        result = subprocess.run(
-            cmd,
-            capture_output=True,
-            text=True,
-            timeout=600  # 10 minute timeout for slow checks
-        )
+        proc = subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True)
+        if procs is not None:
+            procs[name] = proc
+        try:
+            stdout, stderr = proc.communicate(timeout=600)  # 10 minute timeout for slow checks
+        except subprocess.TimeoutExpired:
+            proc.kill()
+            proc.communicate()
+            raise
+        finally:
+            if procs is not None:
+                procs.pop(name, None)
+        result = subprocess.CompletedProcess(cmd, proc.returncode, stdout, stderr)
         
         duration = (datetime.now() - start_time).total_seconds()
-        passed = result.returncode == 0
-        
-        if passed:
-            print_success(f"{name}: PASSED ({duration:.1f}s)")
-        else:
-            print_error(f"{name}: FAILED ({duration:.1f}s)")
-            if result.stderr:
-                print(f"  {result.stderr[:300]}")
-        
-        return {
+        if abort is not None and abort.is_set() and result.returncode < 0:
+            print_warning(f"{name}: cancelled ({duration:.1f}s)")
+            return {"name": name, "passed": True, "skipped": True, "cancelled": True, "duration": duration}
+        outcome = {
             "name": name,
-            "passed": passed,
+            "passed": result.returncode == 0,
             "output": result.stdout,
             "error": result.stderr,
             "skipped": False,
             "duration": duration
         }
+        print_outcome(name, outcome)
+        return outcome
     
     except subprocess.TimeoutExpired:
         duration = (datetime.now() - start_time).total_seconds()
@@ -199,7 +244,233 @@ def run_script(name: str, script_path: Path, project_path: str, url: Optional[st
         print_error(f"{name}: ERROR - {str(e)}")
         return {"name": name, "passed": False, "skipped": False, "duration": duration, "error": str(e)}
 
-def print_final_report(results: List[dict], start_time: datetime):
+def load_file_checker(script_path: Path):
+    """
+    The script's file_checker(project_path) factory, if it has one; None
+    (run the check as a subprocess) if it doesn't or can't be imported.
+    """
+    try:
+        if "def file_checker(" not in script_path.read_text(encoding="utf-8", errors="ignore"):
+            return None
+        spec = importlib.util.spec_from_file_location(f"_check_{script_path.stem}", script_path)
+        module = importlib.util.module_from_spec(spec)
+        spec.loader.exec_module(module)
+        return module.file_checker
+    except Exception:
+        return None
+
+def run_in_process(checks: List[dict], project_path: Path,
+                   abort: Optional[threading.Event] = None) -> Dict[str, dict]:
+    """
+    Run checks that have a file_checker in this process, all on one walk and
+    one read of the project. Returns a run_script-style result per check
+    name; setting abort stops the pass between files and cancels the checks
+    not finished yet.
+    """
+    if abort is not None and abort.is_set():
+        return {c["name"]: {"name": c["name"], "passed": True, "skipped": True, "cancelled": True,
+                            "duration": 0} for c in checks}
+    
+    names = ', '.join(c['name'] for c in checks)
+    print_step(f"Running in one pass: {names}" if len(checks) > 1 else f"Running: {names}")
+    try:
+        outcomes = run_checkers(project_path, [c["checker"](str(project_path)) for c in checks],
+                                cancelled=abort.is_set if abort is not None else None)
+    except Exception as e:
+        outcomes = [{"passed": False, "error": f"{type(e).__name__}: {e}", "duration": 0}] * len(checks)
+    
+    results = {}
+    for check, outcome in zip(checks, outcomes):
+        if outcome.get("cancelled"):
+            results[check["name"]] = {"name": check["name"], "passed": True, "skipped": True,
+                                      "cancelled": True, "duration": outcome["duration"]}
+            continue
+        results[check["name"]] = {
+            "name": check["name"],
+            "passed": outcome["passed"],
+            "output": outcome.get("output", ""),
+            "error": outcome.get("error", ""),
+            "skipped": False,
+            "duration": outcome["duration"]
+        }
+    return results
+
+def plan_checks(project_path: Path, url: Optional[str], no_e2e: bool) -> List[dict]:
+    """Flatten VERIFICATION_SUITE into schedulable checks (priority = category order)."""
+    checks = []
+    for priority, suite in enumerate(VERIFICATION_SUITE):
+        # Skip if requires URL and not provided
+        if suite.get("requires_url", False) and not url:
+            continue
+        # Skip E2E if flag set
+        if no_e2e and suite["category"] == "E2E Testing":
+            continue
+        for name, script_path, required in suite["checks"]:
+            script = project_path / script_path
+            checks.append({
+                "name": name,
+                "script": script,
+                "required": required,
+                "category": suite["category"],
+                "priority": priority,
+                "order": len(checks),
+                "checker": load_file_checker(script) if script.exists() else None,
+            })
+    # Dependencies on checks that are not part of this run are dropped
+    names = {c["name"] for c in checks}
+    for check in checks:
+        check["deps"] = [d for d in CHECK_DEPENDENCIES.get(check["name"], []) if d in names]
+    return checks
+
+def batch_in_process(checks: List[dict]) -> List[dict]:
+    """
+    Replace the checks that can run in-process (file_checker, no dependency
+    in either direction) by one schedulable entry holding them as members.
+    Required checks stay out: they fail fast on their own, without waiting
+    for the whole batch.
+    """
+    linked = {d for c in checks for d in c["deps"]} | {c["name"] for c in checks if c["deps"]}
+    members = [c for c in checks
+               if c["checker"] is not None and not c["required"] and c["name"] not in linked]
+    if not members:
+        return checks
+    batch = {
+        "name": "In-process checks",
+        "members": members,
+        "deps": [],
+        "priority": min(c["priority"] for c in members),
+        "order": min(c["order"] for c in members),
+    }
+    return [c for c in checks if c not in members] + [batch]
+
+def run_checks(checks: List[dict], project_path: Path, url: Optional[str],
+               jobs: int, stop_on_fail: bool) -> List[dict]:
+    """
+    Run checks concurrently, up to `jobs` at a time.
+
+    A check starts once its dependencies have finished (it is skipped if one of
+    them failed); among ready checks the highest priority goes first. Optional
+    checks with a file_checker run as one in-process job (batch_in_process). Results
+    are printed as each check finishes. With stop_on_fail, a failed required
+    check cancels everything still running or pending.
+    """
+    pending = sorted(batch_in_process(checks), key=lambda c: (c["priority"], c["order"]))
+    results: Dict[str, dict] = {}
+    running = {}
+    procs: Dict[str, subprocess.Popen] = {}
+    abort = threading.Event()
+    suite_start = time.perf_counter()
+    announced = [None]
+
+    def announce(check: dict):
+        # Section header whenever the category changes (with -j 1, the serial layout)
+        if check["category"] != announced[0]:
+            announced[0] = check["category"]
+            print_header(f"📋 {check['category'].upper()}")
+
+    def finish(check: dict, result: dict):
+        result.update(category=check["category"], required=check["required"],
+                      priority=check["priority"], order=check["order"], deps=check["deps"])
+        results[check["name"]] = result
+
+    def launch_ready(pool) -> bool:
+        launched = False
+        for check in list(pending):
+            if len(running) >= jobs:
+                break
+            if any(d not in results for d in check["deps"]):
+                continue
+            pending.remove(check)
+            launched = True
+            check["started"] = time.perf_counter() - suite_start
+            if "members" in check:
+                running[pool.submit(run_in_process, check["members"], project_path, abort)] = check
+                continue
+            announce(check)
+            failed_deps = [d for d in check["deps"]
+                           if not results[d]["passed"] or results[d].get("cancelled")]
+            if failed_deps:
+                print_warning(f"{check['name']}: skipped ({', '.join(failed_deps)} did not pass)")
+                finish(check, {"name": check["name"], "passed": True, "skipped": True, "duration": 0,
+                               "error": f"Dependency did not pass: {', '.join(failed_deps)}"})
+                continue
+            future = pool.submit(run_script, check["name"], check["script"], str(project_path),
+                                 url, procs, abort)
+            running[future] = check
+        return launched
+
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        while True:
+            while not abort.is_set() and launch_ready(pool):
+                pass
+            if not running:
+                break
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in sorted(done, key=lambda f: running[f]["order"]):
+                job = running.pop(future)
+                if "members" in job:
+                    outcomes = future.result()
+                    for check in job["members"]:
+                        result = outcomes[check["name"]]
+                        if not result.get("skipped"):
+                            announce(check)
+                            print_outcome(check["name"], result)
+                else:
+                    outcomes = {job["name"]: future.result()}
+                
+                for check in job.get("members", [job]):
+                    result = outcomes[check["name"]]
+                    result["started"] = job["started"]
+                    result["finished"] = time.perf_counter() - suite_start
+                    finish(check, result)
+
+                    # Stop on critical failure if flag set
+                    if (stop_on_fail and check["required"] and not result["passed"]
+                            and not result.get("skipped") and not abort.is_set()):
+                        print_error(f"CRITICAL: {check['name']} failed. Stopping verification.")
+                        abort.set()
+                        for proc in list(procs.values()):
+                            proc.terminate()
+
+    for job in pending:
+        for check in job.get("members", [job]):
+            finish(check, {"name": check["name"], "passed": True, "skipped": True, "cancelled": True,
+                           "duration": 0})
+    return sorted(results.values(), key=lambda r: (r["priority"], r["order"]))
+
+def critical_path(results: List[dict]) -> List[dict]:
+    """Longest chain of dependent checks by duration: the wall-time floor with unlimited workers."""
+    by_name = {r["name"]: r for r in results}
+    memo: Dict[str, tuple] = {}
+
+    def longest(name: str) -> tuple:
+        if name not in memo:
+            r = by_name[name]
+            best = max((longest(d) for d in r.get("deps", []) if d in by_name),
+                       key=lambda p: p[0], default=(0.0, []))
+            memo[name] = (best[0] + r.get("duration", 0), best[1] + [r])
+        return memo[name]
+
+    return max((longest(r["name"]) for r in results), key=lambda p: p[0], default=(0.0, []))[1]
+
+def print_timing_summary(results: List[dict], total_duration: float, jobs: int):
+    """Wall time vs serial time, and the critical path through the dependency graph"""
+    ran = [r for r in results if not r.get("skipped")]
+    if not ran:
+        return
+    serial = sum(r.get("duration", 0) for r in ran)
+    print(f"{Colors.BOLD}Timing ({jobs} worker{'s' if jobs != 1 else ''}):{Colors.ENDC}")
+    print(f"  Wall time: {total_duration:.1f}s | serial sum: {serial:.1f}s "
+          f"| speedup: {serial / total_duration if total_duration else 1:.1f}x")
+    path = critical_path(ran)
+    chain = " → ".join(f"{r['name']} ({r['duration']:.1f}s)" for r in path)
+    print(f"  Critical path: {chain} = {sum(r['duration'] for r in path):.1f}s")
+    slowest = sorted(ran, key=lambda r: r.get("duration", 0), reverse=True)[:3]
+    slowest_str = ", ".join(f"{r['name']} ({r['duration']:.1f}s)" for r in slowest)
+    print(f"  Slowest: {slowest_str}")
+    print()
+
+def print_final_report(results: List[dict], start_time: datetime, jobs: int = 1):
     """Print comprehensive final report"""
     total_duration = (datetime.now() - start_time).total_seconds()
     
@@ -217,6 +488,7 @@ def print_final_report(results: List[dict], start_time: datetime):
     print(f"{Colors.RED}❌ Failed: {failed}{Colors.ENDC}")
     print(f"{Colors.YELLOW}⏭️  Skipped: {skipped}{Colors.ENDC}")
     print()
+    print_timing_summary(results, total_duration, jobs)
     
     # Category breakdown
     print(f"{Colors.BOLD}Results by Category:{Colors.ENDC}")
@@ -268,16 +540,20 @@ def main():
 Examples:
   python scripts/verify_all.py . --url http://localhost:3000
   python scripts/verify_all.py . --url https://staging.example.com --no-e2e
+  python scripts/verify_all.py . --url http://localhost:3000 -j 1 --stop-on-fail
         """
     )
     parser.add_argument("project", help="Project path to validate")
     parser.add_argument("--url", required=True, help="URL for performance & E2E checks")
     parser.add_argument("--no-e2e", action="store_true", help="Skip E2E tests")
-    parser.add_argument("--stop-on-fail", action="store_true", help="Stop on first failure")
+    parser.add_argument("--stop-on-fail", action="store_true", help="Stop on first critical failure")
+    parser.add_argument("--jobs", "-j", type=int, default=os.cpu_count() or 1,
+                        help="Checks to run at the same time (default: CPU cores)")
     
     args = parser.parse_args()
     
     project_path = Path(args.project).resolve()
+    args.jobs = max(1, args.jobs)
     
     if not project_path.exists():
         print_error(f"Project path does not exist: {project_path}")
@@ -289,37 +565,13 @@ Examples:
     print(f"Started: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     
     start_time = datetime.now()
-    results = []
+    checks = plan_checks(project_path, args.url, args.no_e2e)
     
-    # Run all verification categories
-    for suite in VERIFICATION_SUITE:
-        category = suite["category"]
-        requires_url = suite.get("requires_url", False)
-        
-        # Skip if requires URL and not provided
-        if requires_url and not args.url:
-            continue
-        
-        # Skip E2E if flag set
-        if args.no_e2e and category == "E2E Testing":
-            continue
-        
-        print_header(f"📋 {category.upper()}")
-        
-        for name, script_path, required in suite["checks"]:
-            script = project_path / script_path
-            result = run_script(name, script, str(project_path), args.url)
-            result["category"] = category
-            results.append(result)
-            
-            # Stop on critical failure if flag set
-            if args.stop_on_fail and required and not result["passed"] and not result.get("skipped"):
-                print_error(f"CRITICAL: {name} failed. Stopping verification.")
-                print_final_report(results, start_time)
-                sys.exit(1)
+    print(f"Checks: {len(checks)} ({args.jobs} parallel)")
+    results = run_checks(checks, project_path, args.url, args.jobs, args.stop_on_fail)
     
     # Print final report
-    all_passed = print_final_report(results, start_time)
+    all_passed = print_final_report(results, start_time, args.jobs)
     
     sys.exit(0 if all_passed else 1)
 
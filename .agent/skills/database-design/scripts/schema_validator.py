@@ -19,6 +19,17 @@ import re
 from pathlib import Path
 from datetime import datetime
 
+# Shared walker/content cache from .agent/scripts; a copy of this skill outside
+# the kit falls back to its own glob
+try:
+    sys.path.append(str(Path(__file__).resolve().parents[3] / "scripts"))
+    from project_scanner import shared_scanner, read_text
+except (ImportError, IndexError):
+    shared_scanner = None
+
+    def read_text(path: Path, errors: str = 'ignore') -> str:
+        return path.read_text(encoding='utf-8', errors=errors)
+
 # Fix Windows console encoding
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -26,8 +37,26 @@ except:
     pass
 
 
+MAX_SCHEMAS = 10
+
+
+def _is_prisma_schema(f: Path) -> bool:
+    return f.name == 'schema.prisma' and f.parent.name == 'prisma'
+
+
+def _is_drizzle_schema(f: Path) -> bool:
+    return (f.suffix == '.ts' and f.parent.name in ('drizzle', 'schema')
+            and ('schema' in f.name.lower() or 'table' in f.name.lower()))
+
+
 def find_schema_files(project_path: Path) -> list:
     """Find database schema files."""
+    if shared_scanner is not None:
+        scanner = shared_scanner(project_path)
+        schemas = [('prisma', f) for f in scanner.files({'.prisma'}, predicate=_is_prisma_schema)]
+        schemas.extend(('drizzle', f) for f in scanner.files({'.ts'}, predicate=_is_drizzle_schema))
+        return schemas[:MAX_SCHEMAS]
+    
     schemas = []
     
     # Prisma schema
@@ -41,15 +70,16 @@ def find_schema_files(project_path: Path) -> list:
         if 'schema' in f.name.lower() or 'table' in f.name.lower():
             schemas.append(('drizzle', f))
     
-    return schemas[:10]  # Limit
+    return schemas[:MAX_SCHEMAS]
 
 
-def validate_prisma_schema(file_path: Path) -> list:
-    """Validate Prisma schema file."""
+def validate_prisma_schema(file_path: Path, content: str = None) -> list:
+    """Validate Prisma schema file (content: the file's text, if already read)."""
     issues = []
     
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        if content is None:
+            content = read_text(file_path)
         
         # Find all models
         models = re.findall(r'model\s+(\w+)\s*{([^}]+)}', content, re.DOTALL)
@@ -91,6 +121,62 @@ def validate_prisma_schema(file_path: Path) -> list:
     return issues
 
 
+def summarize(project_path: Path, schemas_checked: int, all_issues: list) -> dict:
+    """JSON summary of a run; schema issues are warnings, so it always passes."""
+    if not schemas_checked:
+        return {
+            "script": "schema_validator",
+            "project": str(project_path),
+            "schemas_checked": 0,
+            "issues_found": 0,
+            "passed": True,
+            "message": "No schema files found"
+        }
+    return {
+        "script": "schema_validator",
+        "project": str(project_path),
+        "schemas_checked": schemas_checked,
+        "issues_found": sum(len(item["issues"]) for item in all_issues),
+        "passed": True,
+        "issues": all_issues
+    }
+
+
+class SchemaFileChecker:
+    """main() as a project_scanner.run_checkers checker: same schema files, same report."""
+
+    def __init__(self, project_path: Path):
+        self.project_path = Path(project_path).resolve()
+        self.prisma = []  # (path, issues)
+        self.drizzle = []
+
+    def register(self, scanner) -> None:
+        scanner.register("schema_validator", self._on_prisma, {'.prisma'}, predicate=_is_prisma_schema)
+        # Drizzle files are only listed, not read
+        scanner.register("schema_validator:drizzle", None, {'.ts'}, predicate=self._wants_drizzle)
+
+    def _on_prisma(self, file_path: Path, content: str) -> None:
+        self.prisma.append((file_path, validate_prisma_schema(file_path, content)))
+
+    def _wants_drizzle(self, file_path: Path) -> bool:
+        if _is_drizzle_schema(file_path):
+            self.drizzle.append(file_path)
+        return False
+
+    def finish(self) -> dict:
+        # Prisma first, then Drizzle, like find_schema_files
+        schemas = ([('prisma', f, issues) for f, issues in self.prisma]
+                   + [('drizzle', f, []) for f in self.drizzle])[:MAX_SCHEMAS]
+        all_issues = [{"file": str(f.name), "type": schema_type, "issues": issues}
+                      for schema_type, f, issues in schemas if issues]
+        output = summarize(self.project_path, len(schemas), all_issues)
+        return {"passed": output["passed"], "output": json.dumps(output, indent=2)}
+
+
+def file_checker(project_path: Path) -> SchemaFileChecker:
+    return SchemaFileChecker(project_path)
+
+
 def main():
     project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
     
@@ -106,15 +192,7 @@ def main():
     print(f"Found {len(schemas)} schema files")
     
     if not schemas:
-        output = {
-            "script": "schema_validator",
-            "project": str(project_path),
-            "schemas_checked": 0,
-            "issues_found": 0,
-            "passed": True,
-            "message": "No schema files found"
-        }
-        print(json.dumps(output, indent=2))
+        print(json.dumps(summarize(project_path, 0, []), indent=2))
         sys.exit(0)
     
     # Validate each schema
@@ -150,18 +228,7 @@ def main():
     else:
         print("No schema issues found!")
     
-    total_issues = sum(len(item["issues"]) for item in all_issues)
-    # Schema issues are warnings, not failures
-    passed = True
-    
-    output = {
-        "script": "schema_validator",
-        "project": str(project_path),
-        "schemas_checked": len(schemas),
-        "issues_found": total_issues,
-        "passed": passed,
-        "issues": all_issues
-    }
+    output = summarize(project_path, len(schemas), all_issues)
     
     print("\n" + json.dumps(output, indent=2))
     
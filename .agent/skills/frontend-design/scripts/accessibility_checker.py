@@ -20,6 +20,17 @@ import re
 from pathlib import Path
 from datetime import datetime
 
+# Shared walker/content cache from .agent/scripts; a copy of this skill outside
+# the kit falls back to its own glob
+try:
+    sys.path.append(str(Path(__file__).resolve().parents[3] / "scripts"))
+    from project_scanner import shared_scanner, read_text
+except (ImportError, IndexError):
+    shared_scanner = None
+
+    def read_text(path: Path, errors: str = 'ignore') -> str:
+        return path.read_text(encoding='utf-8', errors=errors)
+
 # Fix Windows console encoding
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -27,26 +38,34 @@ except:
     pass
 
 
+SKIP_DIRS = {'node_modules', '.next', 'dist', 'build', '.git'}
+HTML_EXTENSIONS = {'.html', '.jsx', '.tsx'}
+MAX_FILES = 50
+
+
 def find_html_files(project_path: Path) -> list:
     """Find all HTML/JSX/TSX files."""
+    if shared_scanner is not None:
+        return shared_scanner(project_path).files(HTML_EXTENSIONS, SKIP_DIRS)[:MAX_FILES]
+    
     patterns = ['**/*.html', '**/*.jsx', '**/*.tsx']
-    skip_dirs = {'node_modules', '.next', 'dist', 'build', '.git'}
     
     files = []
     for pattern in patterns:
         for f in project_path.glob(pattern):
-            if not any(skip in f.parts for skip in skip_dirs):
+            if not any(skip in f.parts for skip in SKIP_DIRS):
                 files.append(f)
     
-    return files[:50]
+    return files[:MAX_FILES]
 
 
-def check_accessibility(file_path: Path) -> list:
-    """Check a single file for accessibility issues."""
+def check_accessibility(file_path: Path, content: str = None) -> list:
+    """Check a single file for accessibility issues (content: the file's text, if already read)."""
     issues = []
     
     try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        if content is None:
+            content = read_text(file_path)
         
         # Check for form inputs without labels
         inputs = re.findall(r'<input[^>]*>', content, re.IGNORECASE)
@@ -108,6 +127,59 @@ def check_accessibility(file_path: Path) -> list:
     return issues
 
 
+def summarize(project_path: Path, files_checked: int, all_issues: list) -> dict:
+    """JSON summary of a run; fewer than 5 issues in total still passes."""
+    if not files_checked:
+        return {
+            "script": "accessibility_checker",
+            "project": str(project_path),
+            "files_checked": 0,
+            "issues_found": 0,
+            "passed": True,
+            "message": "No HTML files found"
+        }
+    total_issues = sum(len(item["issues"]) for item in all_issues)
+    return {
+        "script": "accessibility_checker",
+        "project": str(project_path),
+        "files_checked": files_checked,
+        "files_with_issues": len(all_issues),
+        "issues_found": total_issues,
+        # Accessibility issues are important but not blocking
+        "passed": total_issues < 5  # Allow minor issues
+    }
+
+
+class AccessibilityFileChecker:
+    """main() as a project_scanner.run_checkers checker: same files, same verdict."""
+
+    def __init__(self, project_path: Path):
+        self.project_path = Path(project_path).resolve()
+        self.files = 0
+        self.all_issues = []
+
+    def register(self, scanner) -> None:
+        scanner.register("accessibility_checker", self._on_file, HTML_EXTENSIONS, SKIP_DIRS, self._wants)
+
+    def _wants(self, file_path: Path) -> bool:
+        # First MAX_FILES in walk order, like find_html_files
+        self.files += 1
+        return self.files <= MAX_FILES
+
+    def _on_file(self, file_path: Path, content: str) -> None:
+        issues = check_accessibility(file_path, content)
+        if issues:
+            self.all_issues.append({"file": str(file_path.name), "issues": issues})
+
+    def finish(self) -> dict:
+        output = summarize(self.project_path, min(self.files, MAX_FILES), self.all_issues)
+        return {"passed": output["passed"], "output": json.dumps(output, indent=2)}
+
+
+def file_checker(project_path: Path) -> AccessibilityFileChecker:
+    return AccessibilityFileChecker(project_path)
+
+
 def main():
     project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
     
@@ -123,15 +195,7 @@ def main():
     print(f"Found {len(files)} HTML/JSX/TSX files")
     
     if not files:
-        output = {
-            "script": "accessibility_checker",
-            "project": str(project_path),
-            "files_checked": 0,
-            "issues_found": 0,
-            "passed": True,
-            "message": "No HTML files found"
-        }
-        print(json.dumps(output, indent=2))
+        print(json.dumps(summarize(project_path, 0, []), indent=2))
         sys.exit(0)
     
     # Check each file
@@ -161,22 +225,11 @@ def main():
     else:
         print("No accessibility issues found!")
     
-    total_issues = sum(len(item["issues"]) for item in all_issues)
-    # Accessibility issues are important but not blocking
-    passed = total_issues < 5  # Allow minor issues
-    
-    output = {
-        "script": "accessibility_checker",
-        "project": str(project_path),
-        "files_checked": len(files),
-        "files_with_issues": len(all_issues),
-        "issues_found": total_issues,
-        "passed": passed
-    }
+    output = summarize(project_path, len(files), all_issues)
     
     print("\n" + json.dumps(output, indent=2))
     
-    sys.exit(0 if passed else 1)
+    sys.exit(0 if output["passed"] else 1)
 
 
 if __name__ == "__main__":
@@ -95,6 +95,17 @@ import re
 import json
 from pathlib import Path
 
+# Shared walker/content cache from .agent/scripts; a copy of this skill outside
+# the kit falls back to its own os.walk
+try:
+    sys.path.append(str(Path(__file__).resolve().parents[3] / "scripts"))
+    from project_scanner import shared_scanner, audit_tree, TreeAudit
+except (ImportError, IndexError):
+    shared_scanner = None
+
+# Files audited by audit_directory
+EXTENSIONS = {'.tsx', '.jsx', '.html', '.vue', '.svelte', '.css'}
+
 class UXAuditor:
     def __init__(self):
         self.issues = []
@@ -102,11 +113,12 @@ class UXAuditor:
         self.passed_count = 0
         self.files_checked = 0
     
-    def audit_file(self, filepath: str) -> None:
-        try:
-            with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
-                content = f.read()
-        except: return
+    def audit_file(self, filepath: str, content: str = None) -> None:
+        if content is None:
+            try:
+                with open(filepath, 'r', encoding='utf-8', errors='replace') as f:
+                    content = f.read()
+            except: return
         
         self.files_checked += 1
         filename = os.path.basename(filepath)
@@ -387,7 +399,7 @@ class UXAuditor:
         if re.search(r'@keyframes|transition:', content):
             expensive_props = re.findall(r'width|height|top|left|right|bottom|margin|padding', content)
             if expensive_props:
-                self.warnings.append(f"[Performance] {filename}: Animating expensive properties ({', '.join(set(expensive_props))}). Use transform/opacity where possible.")
+                self.warnings.append(f"[Performance] {filename}: Animating expensive properties ({', '.join(sorted(set(expensive_props)))}). Use transform/opacity where possible.")
             
             # Reduced Motion
             if not re.search(r'prefers-reduced-motion', content):
@@ -671,13 +683,26 @@ class UXAuditor:
         if re.search(r'<img(?![^>]*alt=)[^>]*>', content):
             self.issues.append(f"[Accessibility] {filename}: Missing img alt text")
 
-    def audit_directory(self, directory: str) -> None:
-        extensions = {'.tsx', '.jsx', '.html', '.vue', '.svelte', '.css'}
+    def audit_directory(self, directory: str, since: str = None, use_cache: bool = False,
+                        jobs: int = 1) -> dict:
+        """
+        Audit every matching file under directory. With the shared scanner,
+        since (git ref) always re-audits the files changed since it, use_cache
+        reuses per-file results of unchanged files and jobs > 1 audits files
+        in a process pool (same report, merged in path order); returns that
+        run's summary.
+        """
+        if shared_scanner is not None:
+            return audit_tree(self, directory, EXTENSIONS, since=since,
+                              use_cache=use_cache, source=__file__, jobs=jobs)
+        if since:
+            print("[!] --since needs .agent/scripts/project_scanner.py, auditing every file", file=sys.stderr)
         for root, dirs, files in os.walk(directory):
             dirs[:] = [d for d in dirs if d not in {'node_modules', '.git', 'dist', 'build', '.next'}]
             for file in files:
-                if Path(file).suffix in extensions:
+                if Path(file).suffix in EXTENSIONS:
                     self.audit_file(os.path.join(root, file))
+        return {}
 
     def get_report(self):
         return {
@@ -688,15 +713,45 @@ class UXAuditor:
             "compliant": len(self.issues) == 0
         }
 
+class UXFileChecker:
+    """
+    main() as a project_scanner.run_checkers checker: the audit rides on the
+    shared pass (incremental through the audit cache, like the CLI) and
+    passes when the report has no issues. Files are audited serially: the
+    runners load this script by path, so its auditor can't go to a pool.
+    """
+
+    def __init__(self, project_path, since: str = None):
+        self.auditor = UXAuditor()
+        self.audit = TreeAudit(self.auditor, EXTENSIONS, since=since, source=__file__)
+
+    def register(self, scanner) -> None:
+        self.audit.register(scanner)
+
+    def finish(self) -> dict:
+        self.audit.finish()
+        report = self.auditor.get_report()
+        return {"passed": report['compliant'], "output": json.dumps(report, indent=2)}
+
+
+def file_checker(project_path, since: str = None) -> UXFileChecker:
+    return UXFileChecker(project_path, since)
+
 def main():
     if len(sys.argv) < 2: sys.exit(1)
     
     path = sys.argv[1]
     is_json = "--json" in sys.argv
+    # Incremental by default: unchanged files reuse cached results (--no-cache to re-audit all)
+    since = sys.argv[sys.argv.index("--since") + 1] if "--since" in sys.argv[:-1] else None
+    use_cache = "--no-cache" not in sys.argv
+    # Files to audit are spread over a process pool (--jobs 1 for a serial run)
+    jobs = int(sys.argv[sys.argv.index("--jobs") + 1]) if "--jobs" in sys.argv[:-1] else os.cpu_count() or 1
     
     auditor = UXAuditor()
+    run = {}
     if os.path.isfile(path): auditor.audit_file(path)
-    else: auditor.audit_directory(path)
+    else: run = auditor.audit_directory(path, since=since, use_cache=use_cache, jobs=jobs)
     
     report = auditor.get_report()
     
@@ -705,6 +760,8 @@ def main():
     else:
         # Use ASCII-safe output for Windows console compatibility
         print(f"\n[UX AUDIT] {report['files_checked']} files checked")
+        if run.get("since"): print(f"Changed since {run['since']}: {run['changed']} of {run['files']} files")
+        if "audited" in run: print(f"Re-audited {run['audited']}, reused {run['fresh'] + run['same_content']} from cache")
         print("-" * 50)
         if report['issues']:
             print(f"[!] ISSUES ({len(report['issues'])}):")
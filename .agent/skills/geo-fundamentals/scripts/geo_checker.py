@@ -21,6 +21,17 @@ import re
 import json
 from pathlib import Path
 
+# Shared walker/content cache from .agent/scripts; a copy of this skill outside
+# the kit falls back to its own glob
+try:
+    sys.path.append(str(Path(__file__).resolve().parents[3] / "scripts"))
+    from project_scanner import shared_scanner, read_text
+except (ImportError, IndexError):
+    shared_scanner = None
+
+    def read_text(path: Path, errors: str = 'ignore') -> str:
+        return path.read_text(encoding='utf-8', errors=errors)
+
 # Fix Windows console encoding
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -43,6 +54,9 @@ SKIP_FILES = {
     'tailwind.config', 'postcss.config', 'next.config'
 }
 
+PAGE_EXTENSIONS = {'.html', '.htm', '.jsx', '.tsx'}
+MAX_PAGES = 30
+
 
 def is_page_file(file_path: Path) -> bool:
     """Check if this file is likely a public-facing page."""
@@ -80,6 +94,10 @@ def is_page_file(file_path: Path) -> bool:
 
 def find_web_pages(project_path: Path) -> list:
     """Find public-facing web pages only."""
+    if shared_scanner is not None:
+        files = shared_scanner(project_path).files(PAGE_EXTENSIONS, SKIP_DIRS, is_page_file)
+        return files[:MAX_PAGES]
+    
     patterns = ['**/*.html', '**/*.htm', '**/*.jsx', '**/*.tsx']
     
     files = []
@@ -93,15 +111,16 @@ def find_web_pages(project_path: Path) -> list:
             if is_page_file(f):
                 files.append(f)
     
-    return files[:30]  # Limit to 30 pages
+    return files[:MAX_PAGES]
 
 
-def check_page(file_path: Path) -> dict:
-    """Check a single web page for GEO elements."""
-    try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
-    except Exception as e:
-        return {'file': str(file_path.name), 'passed': [], 'issues': [f"Error: {e}"], 'score': 0}
+def check_page(file_path: Path, content: str = None) -> dict:
+    """Check a single web page for GEO elements (content: the file's text, if already read)."""
+    if content is None:
+        try:
+            content = read_text(file_path)
+        except Exception as e:
+            return {'file': str(file_path.name), 'passed': [], 'issues': [f"Error: {e}"], 'score': 0}
     
     issues = []
     passed = []
@@ -219,6 +238,54 @@ def check_page(file_path: Path) -> dict:
     }
 
 
+def average_score(results: list) -> float:
+    return sum(r['score'] for r in results) / len(results) if results else 0
+
+
+def summarize(project_path: Path, results: list) -> dict:
+    """JSON summary of a run; passes with an average score of 60% or more (or no pages)."""
+    if not results:
+        return {"script": "geo_checker", "pages_found": 0, "passed": True}
+    avg_score = average_score(results)
+    return {
+        "script": "geo_checker",
+        "project": str(project_path),
+        "pages_checked": len(results),
+        "average_score": round(avg_score),
+        "passed": avg_score >= 60
+    }
+
+
+class GEOFileChecker:
+    """main() as a project_scanner.run_checkers checker: same pages, same verdict."""
+
+    def __init__(self, project_path: Path):
+        self.project_path = Path(project_path).resolve()
+        self.pages = 0
+        self.results = []
+
+    def register(self, scanner) -> None:
+        scanner.register("geo_checker", self._on_page, PAGE_EXTENSIONS, SKIP_DIRS, self._wants)
+
+    def _wants(self, file_path: Path) -> bool:
+        # First MAX_PAGES pages in walk order, like find_web_pages
+        if self.pages >= MAX_PAGES or not is_page_file(file_path):
+            return False
+        self.pages += 1
+        return True
+
+    def _on_page(self, file_path: Path, content: str) -> None:
+        self.results.append(check_page(file_path, content))
+
+    def finish(self) -> dict:
+        output = summarize(self.project_path, self.results)
+        return {"passed": output["passed"], "output": json.dumps(output, indent=2)}
+
+
+def file_checker(project_path: Path) -> GEOFileChecker:
+    return GEOFileChecker(project_path)
+
+
 def main():
     target = sys.argv[1] if len(sys.argv) > 1 else "."
     target_path = Path(target).resolve()
@@ -236,8 +303,7 @@ def main():
         print("\n[!] No public web pages found.")
         print("    Looking for: HTML, JSX, TSX files in pages/app directories")
         print("    Skipping: docs, tests, config files, node_modules")
-        output = {"script": "geo_checker", "pages_found": 0, "passed": True}
-        print("\n" + json.dumps(output, indent=2))
+        print("\n" + json.dumps(summarize(target_path, []), indent=2))
         sys.exit(0)
     
     print(f"Found {len(pages)} public pages to analyze\n")
@@ -256,8 +322,7 @@ def main():
             for issue in result['issues'][:2]:  # Show max 2 issues
                 print(f"    - {issue}")
     
-    # Average score
-    avg_score = sum(r['score'] for r in results) / len(results) if results else 0
+    avg_score = average_score(results)
     
     print("\n" + "=" * 60)
     print(f"AVERAGE GEO SCORE: {avg_score:.0f}%")
@@ -272,17 +337,10 @@ def main():
     else:
         print("[X] Poor - Content needs GEO optimization")
     
-    # JSON output
-    output = {
-        "script": "geo_checker",
-        "project": str(target_path),
-        "pages_checked": len(results),
-        "average_score": round(avg_score),
-        "passed": avg_score >= 60
-    }
+    output = summarize(target_path, results)
     print("\n" + json.dumps(output, indent=2))
     
-    sys.exit(0 if avg_score >= 60 else 1)
+    sys.exit(0 if output["passed"] else 1)
 
 
 if __name__ == "__main__":
@@ -8,6 +8,17 @@ import re
 import json
 from pathlib import Path
 
+# Shared walker/content cache from .agent/scripts; a copy of this skill outside
+# the kit falls back to its own glob
+try:
+    sys.path.append(str(Path(__file__).resolve().parents[3] / "scripts"))
+    from project_scanner import shared_scanner, read_text
+except (ImportError, IndexError):
+    shared_scanner = None
+
+    def read_text(path: Path, errors: str = 'ignore') -> str:
+        return path.read_text(encoding='utf-8', errors=errors)
+
 # Fix Windows console encoding for Unicode output
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -50,8 +61,23 @@ I18N_PATTERNS = [
     r'i18n\.',             # Generic i18n
 ]
 
+LOCALE_DIRS = {'locales', 'translations', 'lang', 'i18n'}
+
+def _is_locale_file(f: Path, project_path: Path) -> bool:
+    """Same files the glob patterns in find_locale_files match."""
+    if f.suffix == '.po':
+        return True
+    if f.suffix != '.json':
+        return False
+    dirs = f.relative_to(project_path).parts[:-1]
+    return bool(LOCALE_DIRS.intersection(dirs)) or (dirs and dirs[-1] == 'messages')
+
 def find_locale_files(project_path: Path) -> list:
     """Find translation/locale files."""
+    if shared_scanner is not None:
+        scanner = shared_scanner(project_path)
+        return scanner.files({'.json', '.po'}, predicate=lambda f: _is_locale_file(f, scanner.root))
+    
     patterns = [
         "**/locales/**/*.json",
         "**/translations/**/*.json",
@@ -67,8 +93,10 @@ def find_locale_files(project_path: Path) -> list:
     
     return [f for f in files if 'node_modules' not in str(f)]
 
-def check_locale_completeness(locale_files: list) -> dict:
-    """Check if all locales have the same keys."""
+def check_locale_completeness(locale_files: list, read=None) -> dict:
+    """Check if all locales have the same keys (read: path -> text, strict UTF-8)."""
+    if read is None:
+        read = lambda f: read_text(f, errors='strict')
     issues = []
     passed = []
     
@@ -81,7 +109,7 @@ def check_locale_completeness(locale_files: list) -> dict:
         if f.suffix == '.json':
             try:
                 lang = f.parent.name
-                content = json.loads(f.read_text(encoding='utf-8'))
+                content = json.loads(read(f))
                 if lang not in locales:
                     locales[lang] = {}
                 locales[lang][f.stem] = set(flatten_keys(content))
@@ -128,73 +156,120 @@ def flatten_keys(d, prefix=''):
             keys.add(new_key)
     return keys
 
-def check_hardcoded_strings(project_path: Path) -> dict:
-    """Check for hardcoded strings in code files."""
+# Code file suffix -> HARDCODED_PATTERNS key
+CODE_EXTENSIONS = {
+    '.tsx': 'jsx', '.jsx': 'jsx', '.ts': 'jsx', '.js': 'jsx',
+    '.vue': 'vue',
+    '.py': 'python'
+}
+CODE_EXCLUDED = ['node_modules', '.git', 'dist', 'build', '__pycache__', 'venv', 'test', 'spec']
+MAX_CODE_FILES = 50
+
+def _is_code_file(f: Path) -> bool:
+    return not any(x in str(f) for x in CODE_EXCLUDED)
+
+def _new_code_stats() -> dict:
+    return {'files': 0, 'with_i18n': 0, 'with_hardcoded': 0, 'examples': []}
+
+def _scan_code_file(stats: dict, file_path: Path, content: str) -> None:
+    file_type = CODE_EXTENSIONS.get(file_path.suffix, 'jsx')
+    
+    # Check for i18n usage
+    has_i18n = any(re.search(p, content) for p in I18N_PATTERNS)
+    if has_i18n:
+        stats['with_i18n'] += 1
+    
+    # Check for hardcoded strings
+    patterns = HARDCODED_PATTERNS.get(file_type, [])
+    hardcoded_found = False
+    
+    for pattern in patterns:
+        matches = re.findall(pattern, content)
+        if matches and not has_i18n:
+            hardcoded_found = True
+            if len(stats['examples']) < 5:
+                stats['examples'].append(f"{file_path.name}: {str(matches[0])[:40]}...")
+    
+    if hardcoded_found:
+        stats['with_hardcoded'] += 1
+
+def _code_result(stats: dict) -> dict:
     issues = []
     passed = []
     
-    # Find code files
-    extensions = {
-        '.tsx': 'jsx', '.jsx': 'jsx', '.ts': 'jsx', '.js': 'jsx',
-        '.vue': 'vue',
-        '.py': 'python'
-    }
+    if not stats['files']:
+        return {'passed': ["[!] No code files found"], 'issues': []}
     
-    code_files = []
-    for ext in extensions:
-        code_files.extend(project_path.rglob(f"*{ext}"))
+    passed.append(f"[OK] Analyzed {stats['files']} code files")
     
-    code_files = [f for f in code_files if not any(x in str(f) for x in 
-                  ['node_modules', '.git', 'dist', 'build', '__pycache__', 'venv', 'test', 'spec'])]
+    if stats['with_i18n'] > 0:
+        passed.append(f"[OK] {stats['with_i18n']} files use i18n")
     
-    if not code_files:
-        return {'passed': ["[!] No code files found"], 'issues': []}
+    if stats['with_hardcoded'] > 0:
+        issues.append(f"[X] {stats['with_hardcoded']} files may have hardcoded strings")
+        for ex in stats['examples']:
+            issues.append(f"   → {ex}")
+    else:
+        passed.append("[OK] No obvious hardcoded strings detected")
     
-    files_with_i18n = 0
-    files_with_hardcoded = 0
-    hardcoded_examples = []
+    return {'passed': passed, 'issues': issues}
+
+def check_hardcoded_strings(project_path: Path) -> dict:
+    """Check for hardcoded strings in code files."""
+    if shared_scanner is not None:
+        code_files = shared_scanner(project_path).files(CODE_EXTENSIONS, predicate=_is_code_file)
+    else:
+        code_files = []
+        for ext in CODE_EXTENSIONS:
+            code_files.extend(project_path.rglob(f"*{ext}"))
+        code_files = [f for f in code_files if _is_code_file(f)]
     
-    for file_path in code_files[:50]:  # Limit
+    stats = _new_code_stats()
+    stats['files'] = len(code_files)
+    for file_path in code_files[:MAX_CODE_FILES]:
         try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
-            ext = file_path.suffix
-            file_type = extensions.get(ext, 'jsx')
-            
-            # Check for i18n usage
-            has_i18n = any(re.search(p, content) for p in I18N_PATTERNS)
-            if has_i18n:
-                files_with_i18n += 1
-            
-            # Check for hardcoded strings
-            patterns = HARDCODED_PATTERNS.get(file_type, [])
-            hardcoded_found = False
-            
-            for pattern in patterns:
-                matches = re.findall(pattern, content)
-                if matches and not has_i18n:
-                    hardcoded_found = True
-                    if len(hardcoded_examples) < 5:
-                        hardcoded_examples.append(f"{file_path.name}: {str(matches[0])[:40]}...")
-            
-            if hardcoded_found:
-                files_with_hardcoded += 1
-                
+            _scan_code_file(stats, file_path, read_text(file_path))
         except:
             continue
     
-    passed.append(f"[OK] Analyzed {len(code_files)} code files")
+    return _code_result(stats)
+
+def critical_issues(*results: dict) -> int:
+    return sum(1 for result in results for i in result['issues'] if i.startswith("[X]"))
+
+class I18nFileChecker:
+    """main() as a project_scanner.run_checkers checker: same files, same verdict."""
     
-    if files_with_i18n > 0:
-        passed.append(f"[OK] {files_with_i18n} files use i18n")
+    def __init__(self, project_path: Path):
+        self.locale_files = []
+        self.locale_raw = {}
+        self.stats = _new_code_stats()
     
-    if files_with_hardcoded > 0:
-        issues.append(f"[X] {files_with_hardcoded} files may have hardcoded strings")
-        for ex in hardcoded_examples:
-            issues.append(f"   → {ex}")
-    else:
-        passed.append("[OK] No obvious hardcoded strings detected")
+    def register(self, scanner) -> None:
+        scanner.register("i18n_checker:locales", self._on_locale, {'.json', '.po'},
+                         predicate=lambda f: _is_locale_file(f, scanner.root), raw=True)
+        scanner.register("i18n_checker:code", lambda f, content: _scan_code_file(self.stats, f, content),
+                         CODE_EXTENSIONS, predicate=self._wants_code)
     
-    return {'passed': passed, 'issues': issues}
+    def _on_locale(self, f: Path, raw: bytes) -> None:
+        self.locale_files.append(f)
+        self.locale_raw[f] = raw
+    
+    def _wants_code(self, f: Path) -> bool:
+        # Every code file is counted, the first MAX_CODE_FILES are read
+        if not _is_code_file(f):
+            return False
+        self.stats['files'] += 1
+        return self.stats['files'] <= MAX_CODE_FILES
+    
+    def finish(self) -> dict:
+        locale_result = check_locale_completeness(self.locale_files, lambda f: self.locale_raw[f].decode('utf-8'))
+        code_result = _code_result(self.stats)
+        lines = locale_result['passed'] + locale_result['issues'] + code_result['passed'] + code_result['issues']
+        return {"passed": critical_issues(locale_result, code_result) == 0, "output": "\n".join(lines)}
+
+def file_checker(project_path: Path) -> I18nFileChecker:
+    return I18nFileChecker(project_path)
 
 def main():
     target = sys.argv[1] if len(sys.argv) > 1 else "."
@@ -227,14 +302,14 @@ def main():
         print(f"  {item}")
     
     # Summary
-    critical_issues = sum(1 for i in locale_result['issues'] + code_result['issues'] if i.startswith("[X]"))
+    critical = critical_issues(locale_result, code_result)
     
     print("\n" + "=" * 60)
-    if critical_issues == 0:
+    if critical == 0:
         print("[OK] i18n CHECK: PASSED")
         sys.exit(0)
     else:
-        print(f"[X] i18n CHECK: {critical_issues} issues found")
+        print(f"[X] i18n CHECK: {critical} issues found")
         sys.exit(1)
 
 if __name__ == "__main__":
@@ -8,6 +8,17 @@ import re
 import subprocess
 from pathlib import Path
 
+# Shared walker/content cache from .agent/scripts; a copy of this skill outside
+# the kit falls back to its own rglob
+try:
+    sys.path.append(str(Path(__file__).resolve().parents[3] / "scripts"))
+    from project_scanner import shared_scanner, read_text
+except (ImportError, IndexError):
+    shared_scanner = None
+
+    def read_text(path: Path, errors: str = 'ignore') -> str:
+        return path.read_text(encoding='utf-8', errors=errors)
+
 # Fix Windows console encoding for Unicode output
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -15,41 +26,39 @@ try:
 except AttributeError:
     pass  # Python < 3.7
 
-def check_typescript_coverage(project_path: Path) -> dict:
-    """Check TypeScript type coverage."""
+MAX_FILES = 30  # per language
+PY_EXCLUDED = ['venv', '__pycache__', '.git', 'node_modules']
+
+def _is_ts_file(file_path: Path) -> bool:
+    return '.d.ts' not in str(file_path)
+
+def _is_py_file(file_path: Path) -> bool:
+    return not any(x in str(file_path) for x in PY_EXCLUDED)
+
+def _scan_typescript(stats: dict, content: str) -> None:
+    # Count 'any' usage
+    any_matches = re.findall(r':\s*any\b', content)
+    stats['any_count'] += len(any_matches)
+    
+    # Find functions without return types
+    # function name(params) { - no return type
+    untyped = re.findall(r'function\s+\w+\s*\([^)]*\)\s*{', content)
+    # Arrow functions without types: const fn = (x) => or (x) =>
+    untyped += re.findall(r'=\s*\([^:)]*\)\s*=>', content)
+    stats['untyped_functions'] += len(untyped)
+    
+    # Count typed functions
+    typed = re.findall(r'function\s+\w+\s*\([^)]*\)\s*:\s*\w+', content)
+    typed += re.findall(r':\s*\([^)]*\)\s*=>\s*\w+', content)
+    stats['total_functions'] += len(typed) + len(untyped)
+
+def _typescript_result(stats: dict, files: int) -> dict:
     issues = []
     passed = []
-    stats = {'any_count': 0, 'untyped_functions': 0, 'total_functions': 0}
-    
-    ts_files = list(project_path.rglob("*.ts")) + list(project_path.rglob("*.tsx"))
-    ts_files = [f for f in ts_files if 'node_modules' not in str(f) and '.d.ts' not in str(f)]
     
-    if not ts_files:
+    if not files:
         return {'type': 'typescript', 'files': 0, 'passed': [], 'issues': ["[!] No TypeScript files found"], 'stats': stats}
     
-    for file_path in ts_files[:30]:  # Limit
-        try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
-            
-            # Count 'any' usage
-            any_matches = re.findall(r':\s*any\b', content)
-            stats['any_count'] += len(any_matches)
-            
-            # Find functions without return types
-            # function name(params) { - no return type
-            untyped = re.findall(r'function\s+\w+\s*\([^)]*\)\s*{', content)
-            # Arrow functions without types: const fn = (x) => or (x) =>
-            untyped += re.findall(r'=\s*\([^:)]*\)\s*=>', content)
-            stats['untyped_functions'] += len(untyped)
-            
-            # Count typed functions
-            typed = re.findall(r'function\s+\w+\s*\([^)]*\)\s*:\s*\w+', content)
-            typed += re.findall(r':\s*\([^)]*\)\s*=>\s*\w+', content)
-            stats['total_functions'] += len(typed) + len(untyped)
-            
-        except Exception:
-            continue
-    
     # Analyze results
     if stats['any_count'] == 0:
         passed.append("[OK] No 'any' types found")
@@ -67,42 +76,49 @@ def check_typescript_coverage(project_path: Path) -> dict:
         else:
             issues.append(f"[X] Type coverage: {typed_ratio:.0f}% (too low)")
     
-    passed.append(f"[OK] Analyzed {len(ts_files)} TypeScript files")
+    passed.append(f"[OK] Analyzed {files} TypeScript files")
     
-    return {'type': 'typescript', 'files': len(ts_files), 'passed': passed, 'issues': issues, 'stats': stats}
+    return {'type': 'typescript', 'files': files, 'passed': passed, 'issues': issues, 'stats': stats}
 
-def check_python_coverage(project_path: Path) -> dict:
-    """Check Python type hints coverage."""
-    issues = []
-    passed = []
-    stats = {'untyped_functions': 0, 'typed_functions': 0, 'any_count': 0}
-    
-    py_files = list(project_path.rglob("*.py"))
-    py_files = [f for f in py_files if not any(x in str(f) for x in ['venv', '__pycache__', '.git', 'node_modules'])]
+def check_typescript_coverage(project_path: Path) -> dict:
+    """Check TypeScript type coverage."""
+    stats = {'any_count': 0, 'untyped_functions': 0, 'total_functions': 0}
     
-    if not py_files:
-        return {'type': 'python', 'files': 0, 'passed': [], 'issues': ["[!] No Python files found"], 'stats': stats}
+    if shared_scanner is not None:
+        ts_files = shared_scanner(project_path).files({'.ts', '.tsx'}, predicate=_is_ts_file)
+    else:
+        ts_files = list(project_path.rglob("*.ts")) + list(project_path.rglob("*.tsx"))
+        ts_files = [f for f in ts_files if 'node_modules' not in str(f) and _is_ts_file(f)]
     
-    for file_path in py_files[:30]:  # Limit
+    for file_path in ts_files[:MAX_FILES]:
         try:
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
-            
-            # Count Any usage
-            any_matches = re.findall(r':\s*Any\b', content)
-            stats['any_count'] += len(any_matches)
-            
-            # Find functions with type hints
-            typed_funcs = re.findall(r'def\s+\w+\s*\([^)]*:[^)]+\)', content)
-            typed_funcs += re.findall(r'def\s+\w+\s*\([^)]*\)\s*->', content)
-            stats['typed_functions'] += len(typed_funcs)
-            
-            # Find functions without type hints
-            all_funcs = re.findall(r'def\s+\w+\s*\(', content)
-            stats['untyped_functions'] += len(all_funcs) - len(typed_funcs)
-            
+            _scan_typescript(stats, read_text(file_path))
         except Exception:
             continue
     
+    return _typescript_result(stats, len(ts_files))
+
+def _scan_python(stats: dict, content: str) -> None:
+    # Count Any usage
+    any_matches = re.findall(r':\s*Any\b', content)
+    stats['any_count'] += len(any_matches)
+    
+    # Find functions with type hints
+    typed_funcs = re.findall(r'def\s+\w+\s*\([^)]*:[^)]+\)', content)
+    typed_funcs += re.findall(r'def\s+\w+\s*\([^)]*\)\s*->', content)
+    stats['typed_functions'] += len(typed_funcs)
+    
+    # Find functions without type hints
+    all_funcs = re.findall(r'def\s+\w+\s*\(', content)
+    stats['untyped_functions'] += len(all_funcs) - len(typed_funcs)
+
+def _python_result(stats: dict, files: int) -> dict:
+    issues = []
+    passed = []
+    
+    if not files:
+        return {'type': 'python', 'files': 0, 'passed': [], 'issues': ["[!] No Python files found"], 'stats': stats}
+    
     total = stats['typed_functions'] + stats['untyped_functions']
     
     if total > 0:
@@ -121,9 +137,68 @@ def check_python_coverage(project_path: Path) -> dict:
     else:
         issues.append(f"[X] {stats['any_count']} 'Any' types found")
     
-    passed.append(f"[OK] Analyzed {len(py_files)} Python files")
+    passed.append(f"[OK] Analyzed {files} Python files")
     
-    return {'type': 'python', 'files': len(py_files), 'passed': passed, 'issues': issues, 'stats': stats}
+    return {'type': 'python', 'files': files, 'passed': passed, 'issues': issues, 'stats': stats}
+
+def check_python_coverage(project_path: Path) -> dict:
+    """Check Python type hints coverage."""
+    stats = {'untyped_functions': 0, 'typed_functions': 0, 'any_count': 0}
+    
+    if shared_scanner is not None:
+        py_files = shared_scanner(project_path).files({'.py'}, predicate=_is_py_file)
+    else:
+        py_files = list(project_path.rglob("*.py"))
+        py_files = [f for f in py_files if _is_py_file(f)]
+    
+    for file_path in py_files[:MAX_FILES]:
+        try:
+            _scan_python(stats, read_text(file_path))
+        except Exception:
+            continue
+    
+    return _python_result(stats, len(py_files))
+
+def critical_issues(results: list) -> int:
+    """Number of [X] issues across the language results that found files."""
+    return sum(1 for result in results if result['files'] > 0
+               for item in result['issues'] if item.startswith("[X]"))
+
+class TypeCoverageFileChecker:
+    """main() as a project_scanner.run_checkers checker: same files, same verdict."""
+    
+    def __init__(self, project_path: Path):
+        self.ts_stats = {'any_count': 0, 'untyped_functions': 0, 'total_functions': 0}
+        self.py_stats = {'untyped_functions': 0, 'typed_functions': 0, 'any_count': 0}
+        self.ts_files = 0
+        self.py_files = 0
+    
+    def register(self, scanner) -> None:
+        scanner.register("type_coverage:ts", lambda f, content: _scan_typescript(self.ts_stats, content),
+                         {'.ts', '.tsx'}, predicate=self._wants_ts)
+        scanner.register("type_coverage:py", lambda f, content: _scan_python(self.py_stats, content),
+                         {'.py'}, predicate=self._wants_py)
+    
+    # Every matching file is counted, the first MAX_FILES are read
+    def _wants_ts(self, file_path: Path) -> bool:
+        if not _is_ts_file(file_path):
+            return False
+        self.ts_files += 1
+        return self.ts_files <= MAX_FILES
+    
+    def _wants_py(self, file_path: Path) -> bool:
+        if not _is_py_file(file_path):
+            return False
+        self.py_files += 1
+        return self.py_files <= MAX_FILES
+    
+    def finish(self) -> dict:
+        results = [_typescript_result(self.ts_stats, self.ts_files), _python_result(self.py_stats, self.py_files)]
+        lines = [f"[{r['type'].upper()}] " + "; ".join(r['passed'] + r['issues']) for r in results if r['files'] > 0]
+        return {"passed": critical_issues(results) == 0, "output": "\n".join(lines)}
+
+def file_checker(project_path: Path) -> TypeCoverageFileChecker:
+    return TypeCoverageFileChecker(project_path)
 
 def main():
     target = sys.argv[1] if len(sys.argv) > 1 else "."
@@ -150,7 +225,6 @@ def main():
         sys.exit(0)
     
     # Print results
-    critical_issues = 0
     for result in results:
         print(f"\n[{result['type'].upper()}]")
         print("-" * 40)
@@ -158,15 +232,14 @@ def main():
             print(f"  {item}")
         for item in result['issues']:
             print(f"  {item}")
-            if item.startswith("[X]"):
-                critical_issues += 1
     
+    critical = critical_issues(results)
     print("\n" + "=" * 60)
-    if critical_issues == 0:
+    if critical == 0:
         print("[OK] TYPE COVERAGE: ACCEPTABLE")
         sys.exit(0)
     else:
-        print(f"[X] TYPE COVERAGE: {critical_issues} critical issues")
+        print(f"[X] TYPE COVERAGE: {critical} critical issues")
         sys.exit(1)
 
 if __name__ == "__main__":
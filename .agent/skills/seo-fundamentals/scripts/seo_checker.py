@@ -23,6 +23,17 @@ import re
 from pathlib import Path
 from datetime import datetime
 
+# Shared walker/content cache from .agent/scripts; a copy of this skill outside
+# the kit falls back to its own glob
+try:
+    sys.path.append(str(Path(__file__).resolve().parents[3] / "scripts"))
+    from project_scanner import shared_scanner, read_text
+except (ImportError, IndexError):
+    shared_scanner = None
+
+    def read_text(path: Path, errors: str = 'ignore') -> str:
+        return path.read_text(encoding='utf-8', errors=errors)
+
 # Fix Windows console encoding
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -44,6 +55,9 @@ SKIP_PATTERNS = [
     '.test.', '.spec.', '_test.', '_spec.'
 ]
 
+PAGE_EXTENSIONS = {'.html', '.htm', '.jsx', '.tsx'}
+MAX_PAGES = 50
+
 
 def is_page_file(file_path: Path) -> bool:
     """Check if this file is likely a public-facing page."""
@@ -77,6 +91,10 @@ def is_page_file(file_path: Path) -> bool:
 
 def find_pages(project_path: Path) -> list:
     """Find page files to check."""
+    if shared_scanner is not None:
+        files = shared_scanner(project_path).files(PAGE_EXTENSIONS, SKIP_DIRS, is_page_file)
+        return files[:MAX_PAGES]
+    
     patterns = ['**/*.html', '**/*.htm', '**/*.jsx', '**/*.tsx']
     
     files = []
@@ -90,17 +108,18 @@ def find_pages(project_path: Path) -> list:
             if is_page_file(f):
                 files.append(f)
     
-    return files[:50]  # Limit to 50 files
+    return files[:MAX_PAGES]
 
 
-def check_page(file_path: Path) -> dict:
-    """Check a single page for SEO issues."""
+def check_page(file_path: Path, content: str = None) -> dict:
+    """Check a single page for SEO issues (content: the file's text, if already read)."""
     issues = []
     
-    try:
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
-    except Exception as e:
-        return {"file": str(file_path.name), "issues": [f"Error: {e}"]}
+    if content is None:
+        try:
+            content = read_text(file_path)
+        except Exception as e:
+            return {"file": str(file_path.name), "issues": [f"Error: {e}"]}
     
     # Detect if this is a layout/template file (has Head component)
     is_layout = 'Head>' in content or '<head' in content.lower()
@@ -145,6 +164,53 @@ def check_page(file_path: Path) -> dict:
     }
 
 
+def summarize(project_path: Path, pages_checked: int, all_issues: list) -> dict:
+    """JSON summary of a run; passes only without any issue."""
+    if not pages_checked:
+        return {"script": "seo_checker", "files_checked": 0, "passed": True}
+    total_issues = sum(len(item["issues"]) for item in all_issues)
+    return {
+        "script": "seo_checker",
+        "project": str(project_path),
+        "files_checked": pages_checked,
+        "files_with_issues": len(all_issues),
+        "issues_found": total_issues,
+        "passed": total_issues == 0
+    }
+
+
+class SEOFileChecker:
+    """main() as a project_scanner.run_checkers checker: same pages, same verdict."""
+
+    def __init__(self, project_path: Path):
+        self.project_path = Path(project_path).resolve()
+        self.pages = 0
+        self.all_issues = []
+
+    def register(self, scanner) -> None:
+        scanner.register("seo_checker", self._on_page, PAGE_EXTENSIONS, SKIP_DIRS, self._wants)
+
+    def _wants(self, file_path: Path) -> bool:
+        # First MAX_PAGES pages in walk order, like find_pages
+        if self.pages >= MAX_PAGES or not is_page_file(file_path):
+            return False
+        self.pages += 1
+        return True
+
+    def _on_page(self, file_path: Path, content: str) -> None:
+        result = check_page(file_path, content)
+        if result["issues"]:
+            self.all_issues.append(result)
+
+    def finish(self) -> dict:
+        output = summarize(self.project_path, self.pages, self.all_issues)
+        return {"passed": output["passed"], "output": json.dumps(output, indent=2)}
+
+
+def file_checker(project_path: Path) -> SEOFileChecker:
+    return SEOFileChecker(project_path)
+
+
 def main():
     project_path = Path(sys.argv[1] if len(sys.argv) > 1 else ".").resolve()
     
@@ -161,8 +227,7 @@ def main():
     if not pages:
         print("\n[!] No page files found.")
         print("    Looking for: HTML, JSX, TSX in pages/app/routes directories")
-        output = {"script": "seo_checker", "files_checked": 0, "passed": True}
-        print("\n" + json.dumps(output, indent=2))
+        print("\n" + json.dumps(summarize(project_path, 0, []), indent=2))
         sys.exit(0)
     
     print(f"Found {len(pages)} page files to analyze\n")
@@ -198,21 +263,11 @@ def main():
     else:
         print("\n[OK] No SEO issues found!")
     
-    total_issues = sum(len(item["issues"]) for item in all_issues)
-    passed = total_issues == 0
-    
-    output = {
-        "script": "seo_checker",
-        "project": str(project_path),
-        "files_checked": len(pages),
-        "files_with_issues": len(all_issues),
-        "issues_found": total_issues,
-        "passed": passed
-    }
+    output = summarize(project_path, len(pages), all_issues)
     
     print("\n" + json.dumps(output, indent=2))
     
-    sys.exit(0 if passed else 1)
+    sys.exit(0 if output["passed"] else 1)
 
 
 if __name__ == "__main__":
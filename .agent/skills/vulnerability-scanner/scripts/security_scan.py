@@ -22,6 +22,14 @@ from pathlib import Path
 from typing import Dict, List, Any
 from datetime import datetime
 
+# Shared walker/content cache from .agent/scripts; a copy of this skill outside
+# the kit falls back to its own os.walk
+try:
+    sys.path.append(str(Path(__file__).resolve().parents[3] / "scripts"))
+    from project_scanner import shared_scanner
+except (ImportError, IndexError):
+    shared_scanner = None
+
 # Fix Windows console encoding for Unicode output
 try:
     sys.stdout.reconfigure(encoding='utf-8', errors='replace')
@@ -88,6 +96,92 @@ DANGEROUS_PATTERNS = [
 SKIP_DIRS = {'node_modules', '.git', 'dist', 'build', '__pycache__', '.venv', 'venv', '.next'}
 CODE_EXTENSIONS = {'.js', '.ts', '.jsx', '.tsx', '.py', '.go', '.java', '.rb', '.php'}
 CONFIG_EXTENSIONS = {'.json', '.yaml', '.yml', '.toml', '.env', '.env.local', '.env.development'}
+CONFIG_FILES = {'next.config.js', 'webpack.config.js', '.eslintrc.js'}
+
+CONFIG_ISSUES = [
+    (r'"DEBUG"\s*:\s*true', "Debug mode enabled", "high"),
+    (r'debug\s*=\s*True', "Debug mode enabled", "high"),
+    (r'NODE_ENV.*development', "Development mode in config", "medium"),
+    (r'"CORS_ALLOW_ALL".*true', "CORS allow all origins", "high"),
+    (r'"Access-Control-Allow-Origin".*\*', "CORS wildcard", "high"),
+    (r'allowCredentials.*true.*origin.*\*', "Dangerous CORS combo", "critical"),
+]
+
+
+# Literal text every match of a pattern contains (lowercase; any one of them).
+# A file - or line - with none of a pattern's literals can't match it, so its
+# regex is never run there. Patterns missing from these maps are always run.
+SECRET_LITERALS = {
+    "API Key": ("api",),
+    "Token": ("token",),
+    "Bearer Token": ("bearer",),
+    "AWS Access Key": ("akia",),
+    "AWS Secret": ("aws",),
+    "Azure Credential": ("azure",),
+    "GCP Credential": ("google",),
+    "Password": ("password",),
+    "Database Connection String": ("://",),
+    "Private Key": ("-----begin",),
+    "SSH Key": ("ssh-rsa",),
+    "JWT Token": ("eyj",),
+}
+
+DANGEROUS_LITERALS = {
+    "eval() usage": ("eval",),
+    "exec() usage": ("exec",),
+    "Function constructor": ("function",),
+    "child_process.exec": ("child_process",),
+    "subprocess with shell=True": ("subprocess.call",),
+    "dangerouslySetInnerHTML": ("dangerouslysetinnerhtml",),
+    "innerHTML assignment": (".innerhtml",),
+    "document.write": ("document.write",),
+    "SQL String Concat": ("select", "insert", "update", "delete"),
+    "SQL f-string": ('f"',),
+    "SSL Verify Disabled": ("verify",),
+    "Insecure flag": ("--insecure",),
+    "SSL Disabled": ("disable",),
+    "pickle usage": ("pickle.load",),
+    "Unsafe YAML load": ("yaml.load",),
+}
+
+# Characters IGNORECASE matches to an ASCII letter that str.lower() doesn't map to it
+_CASE_FOLD = str.maketrans({"\u0130": "i", "\u0131": "i", "\u017f": "s", "\u212a": "k"})
+
+
+def _fold(text: str) -> str:
+    """Lowercase text for the literal prefilter (agrees with re.IGNORECASE on ASCII letters)."""
+    return text.lower() if text.isascii() else text.translate(_CASE_FOLD).lower()
+
+
+class PatternSet:
+    """
+    Patterns compiled once, with a literal prefilter.
+
+    candidates(folded) keeps only the rules whose literals occur in the text;
+    gate(candidates) is one alternation of those rules, so a line costs a
+    single regex search unless something in it can actually match.
+    """
+
+    def __init__(self, rules: List[tuple], literals: Dict[str, tuple]):
+        self.rules = rules
+        self.compiled = [re.compile(rule[0], re.IGNORECASE) for rule in rules]
+        self.literals = [literals.get(rule[1]) for rule in rules]
+        self._gates: Dict[tuple, Any] = {}
+
+    def candidates(self, folded: str) -> tuple:
+        return tuple(i for i, lits in enumerate(self.literals)
+                     if lits is None or any(lit in folded for lit in lits))
+
+    def gate(self, candidates: tuple):
+        if candidates not in self._gates:
+            self._gates[candidates] = re.compile(
+                "|".join(f"(?:{self.rules[i][0]})" for i in candidates), re.IGNORECASE)
+        return self._gates[candidates]
+
+
+SECRET_RULES = PatternSet(SECRET_PATTERNS, SECRET_LITERALS)
+DANGEROUS_RULES = PatternSet(DANGEROUS_PATTERNS, DANGEROUS_LITERALS)
+CONFIG_RULES = [(re.compile(pattern, re.IGNORECASE), issue, severity) for pattern, issue, severity in CONFIG_ISSUES]
 
 
 # ============================================================================
@@ -178,48 +272,75 @@ def scan_dependencies(project_path: str) -> Dict[str, Any]:
     return results
 
 
-def scan_secrets(project_path: str) -> Dict[str, Any]:
-    """
-    Validate no hardcoded secrets (OWASP A04).
-    Checks: API keys, tokens, passwords, cloud credentials.
-    """
-    results = {
-        "tool": "secret_scanner",
-        "findings": [],
-        "status": "[OK] No secrets detected",
-        "scanned_files": 0,
-        "by_severity": {"critical": 0, "high": 0, "medium": 0}
-    }
-    
+def _is_secret_target(path: Path) -> bool:
+    ext = path.suffix.lower()
+    return ext in CODE_EXTENSIONS or ext in CONFIG_EXTENSIONS
+
+
+def _is_code_file(path: Path) -> bool:
+    return path.suffix.lower() in CODE_EXTENSIONS
+
+
+def _is_config_file(path: Path) -> bool:
+    return path.suffix.lower() in CONFIG_EXTENSIONS or path.name in CONFIG_FILES
+
+
+def iter_project_files(project_path: str, accept) -> Any:
+    """(path, content) for every file accepted by accept(path), skipping SKIP_DIRS."""
+    if shared_scanner is not None:
+        scanner = shared_scanner(project_path)
+        for filepath in scanner.files(predicate=accept):
+            try:
+                yield filepath, scanner.read_text(filepath)
+            except OSError:
+                pass
+        return
+
     for root, dirs, files in os.walk(project_path):
         dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-        
         for file in files:
-            ext = Path(file).suffix.lower()
-            if ext not in CODE_EXTENSIONS and ext not in CONFIG_EXTENSIONS:
-                continue
-                
             filepath = Path(root) / file
-            results["scanned_files"] += 1
-            
+            if not accept(filepath):
+                continue
             try:
                 with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    
-                    for pattern, secret_type, severity in SECRET_PATTERNS:
-                        matches = re.findall(pattern, content, re.IGNORECASE)
-                        if matches:
-                            results["findings"].append({
-                                "file": str(filepath.relative_to(project_path)),
-                                "type": secret_type,
-                                "severity": severity,
-                                "count": len(matches)
-                            })
-                            results["by_severity"][severity] += len(matches)
-                            
+                    yield filepath, f.read()
             except Exception:
                 pass
-    
+
+
+def _relative(filepath: Path, project_path: str) -> str:
+    return os.path.relpath(os.path.abspath(filepath), os.path.abspath(project_path))
+
+
+# --- Secrets (OWASP A04) ---
+
+def _new_secret_results() -> Dict[str, Any]:
+    return {
+        "tool": "secret_scanner",
+        "findings": [],
+        "status": "[OK] No secrets detected",
+        "scanned_files": 0,
+        "by_severity": {"critical": 0, "high": 0, "medium": 0}
+    }
+
+
+def _scan_secrets_file(results: Dict[str, Any], project_path: str, filepath: Path, content: str) -> None:
+    results["scanned_files"] += 1
+    for i in SECRET_RULES.candidates(_fold(content)):
+        _, secret_type, severity = SECRET_PATTERNS[i]
+        matches = SECRET_RULES.compiled[i].findall(content)
+        if matches:
+            results["findings"].append({
+                "file": _relative(filepath, project_path),
+                "type": secret_type,
+                "severity": severity,
+                "count": len(matches)
+            })
+            results["by_severity"][severity] += len(matches)
+
+
+def _finish_secret_results(results: Dict[str, Any], project_path: str) -> Dict[str, Any]:
     if results["by_severity"]["critical"] > 0:
         results["status"] = "[!!] CRITICAL: Secrets exposed!"
     elif results["by_severity"]["high"] > 0:
@@ -233,50 +354,56 @@ def scan_secrets(project_path: str) -> Dict[str, Any]:
     return results
 
 
-def scan_code_patterns(project_path: str) -> Dict[str, Any]:
+def scan_secrets(project_path: str) -> Dict[str, Any]:
     """
-    Validate dangerous code patterns (OWASP A05).
-    Checks: Injection risks, XSS, unsafe deserialization.
+    Validate no hardcoded secrets (OWASP A04).
+    Checks: API keys, tokens, passwords, cloud credentials.
     """
-    results = {
+    results = _new_secret_results()
+    for filepath, content in iter_project_files(project_path, _is_secret_target):
+        _scan_secrets_file(results, project_path, filepath, content)
+    return _finish_secret_results(results, project_path)
+
+
+# --- Dangerous code patterns (OWASP A05) ---
+
+def _new_pattern_results() -> Dict[str, Any]:
+    return {
         "tool": "pattern_scanner",
         "findings": [],
         "status": "[OK] No dangerous patterns",
         "scanned_files": 0,
         "by_category": {}
     }
-    
-    for root, dirs, files in os.walk(project_path):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-        
-        for file in files:
-            ext = Path(file).suffix.lower()
-            if ext not in CODE_EXTENSIONS:
-                continue
-                
-            filepath = Path(root) / file
-            results["scanned_files"] += 1
-            
-            try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    lines = f.readlines()
-                    
-                    for line_num, line in enumerate(lines, 1):
-                        for pattern, name, severity, category in DANGEROUS_PATTERNS:
-                            if re.search(pattern, line, re.IGNORECASE):
-                                results["findings"].append({
-                                    "file": str(filepath.relative_to(project_path)),
-                                    "line": line_num,
-                                    "pattern": name,
-                                    "severity": severity,
-                                    "category": category,
-                                    "snippet": line.strip()[:80]
-                                })
-                                results["by_category"][category] = results["by_category"].get(category, 0) + 1
-                                
-            except Exception:
-                pass
-    
+
+
+def _scan_patterns_file(results: Dict[str, Any], project_path: str, filepath: Path, content: str) -> None:
+    results["scanned_files"] += 1
+    candidates = DANGEROUS_RULES.candidates(_fold(content))
+    if not candidates:
+        return
+    gate = DANGEROUS_RULES.gate(candidates)
+    # Only "\n" ends a line: splitlines() also breaks on \f, \x1c-\x1e, \x85,
+    # \u2028... and would shift the reported line numbers
+    for line_num, line in enumerate(content.split("\n"), 1):
+        line = line.rstrip("\r")
+        if not gate.search(line):
+            continue
+        for i in DANGEROUS_RULES.candidates(_fold(line)):
+            _, name, severity, category = DANGEROUS_PATTERNS[i]
+            if DANGEROUS_RULES.compiled[i].search(line):
+                results["findings"].append({
+                    "file": _relative(filepath, project_path),
+                    "line": line_num,
+                    "pattern": name,
+                    "severity": severity,
+                    "category": category,
+                    "snippet": line.strip()[:80]
+                })
+                results["by_category"][category] = results["by_category"].get(category, 0) + 1
+
+
+def _finish_pattern_results(results: Dict[str, Any], project_path: str) -> Dict[str, Any]:
     critical_count = sum(1 for f in results["findings"] if f["severity"] == "critical")
     high_count = sum(1 for f in results["findings"] if f["severity"] == "high")
     
@@ -293,53 +420,39 @@ def scan_code_patterns(project_path: str) -> Dict[str, Any]:
     return results
 
 
-def scan_configuration(project_path: str) -> Dict[str, Any]:
+def scan_code_patterns(project_path: str) -> Dict[str, Any]:
     """
-    Validate security configuration (OWASP A02).
-    Checks: Security headers, CORS, debug modes.
+    Validate dangerous code patterns (OWASP A05).
+    Checks: Injection risks, XSS, unsafe deserialization.
     """
-    results = {
+    results = _new_pattern_results()
+    for filepath, content in iter_project_files(project_path, _is_code_file):
+        _scan_patterns_file(results, project_path, filepath, content)
+    return _finish_pattern_results(results, project_path)
+
+
+# --- Configuration (OWASP A02) ---
+
+def _new_config_results() -> Dict[str, Any]:
+    return {
         "tool": "config_scanner",
         "findings": [],
         "status": "[OK] Configuration secure",
         "checks": {}
     }
-    
-    # Check common config files for issues
-    config_issues = [
-        (r'"DEBUG"\s*:\s*true', "Debug mode enabled", "high"),
-        (r'debug\s*=\s*True', "Debug mode enabled", "high"),
-        (r'NODE_ENV.*development', "Development mode in config", "medium"),
-        (r'"CORS_ALLOW_ALL".*true', "CORS allow all origins", "high"),
-        (r'"Access-Control-Allow-Origin".*\*', "CORS wildcard", "high"),
-        (r'allowCredentials.*true.*origin.*\*', "Dangerous CORS combo", "critical"),
-    ]
-    
-    for root, dirs, files in os.walk(project_path):
-        dirs[:] = [d for d in dirs if d not in SKIP_DIRS]
-        
-        for file in files:
-            ext = Path(file).suffix.lower()
-            if ext not in CONFIG_EXTENSIONS and file not in ['next.config.js', 'webpack.config.js', '.eslintrc.js']:
-                continue
-                
-            filepath = Path(root) / file
-            
-            try:
-                with open(filepath, 'r', encoding='utf-8', errors='ignore') as f:
-                    content = f.read()
-                    
-                    for pattern, issue, severity in config_issues:
-                        if re.search(pattern, content, re.IGNORECASE):
-                            results["findings"].append({
-                                "file": str(filepath.relative_to(project_path)),
-                                "issue": issue,
-                                "severity": severity
-                            })
-                            
-            except Exception:
-                pass
-    
+
+
+def _scan_config_file(results: Dict[str, Any], project_path: str, filepath: Path, content: str) -> None:
+    for regex, issue, severity in CONFIG_RULES:
+        if regex.search(content):
+            results["findings"].append({
+                "file": _relative(filepath, project_path),
+                "issue": issue,
+                "severity": severity
+            })
+
+
+def _finish_config_results(results: Dict[str, Any], project_path: str) -> Dict[str, Any]:
     # Check for security header configurations
     header_files = ["next.config.js", "next.config.mjs", "middleware.ts", "nginx.conf"]
     for hf in header_files:
@@ -365,12 +478,72 @@ def scan_configuration(project_path: str) -> Dict[str, Any]:
     return results
 
 
+def scan_configuration(project_path: str) -> Dict[str, Any]:
+    """
+    Validate security configuration (OWASP A02).
+    Checks: Security headers, CORS, debug modes.
+    """
+    results = _new_config_results()
+    for filepath, content in iter_project_files(project_path, _is_config_file):
+        _scan_config_file(results, project_path, filepath, content)
+    return _finish_config_results(results, project_path)
+
+
+# Scanners that look at file contents: (result factory, file filter, per-file check, finisher).
+# With the shared scanner, run_full_scan feeds all of them from a single pass over the tree.
+FILE_SCANNERS = {
+    "secrets": (_new_secret_results, _is_secret_target, _scan_secrets_file, _finish_secret_results),
+    "patterns": (_new_pattern_results, _is_code_file, _scan_patterns_file, _finish_pattern_results),
+    "config": (_new_config_results, _is_config_file, _scan_config_file, _finish_config_results),
+}
+
+
+def run_file_scans(project_path: str, keys: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Run the FILE_SCANNERS in keys, reading each file once."""
+    if shared_scanner is None:
+        single = {"secrets": scan_secrets, "patterns": scan_code_patterns, "config": scan_configuration}
+        return {key: single[key](project_path) for key in keys}
+
+    scanner = shared_scanner(project_path)
+    results = _register_file_scans(scanner, project_path, keys)
+    scanner.run()
+    return {key: FILE_SCANNERS[key][3](results[key], project_path) for key in keys}
+
+
+def _register_file_scans(scanner, project_path: str, keys: List[str]) -> Dict[str, Dict[str, Any]]:
+    """Register the FILE_SCANNERS in keys on scanner; returns their (still unfinished) results."""
+    results = {}
+    for key in keys:
+        new_results, accept, check_file, _ = FILE_SCANNERS[key]
+        results[key] = new_results()
+        scanner.register(key, lambda path, content, r=results[key], check=check_file: check(r, project_path, path, content),
+                         predicate=accept)
+    return results
+
+
 # ============================================================================
 #  MAIN
 # ============================================================================
 
+# scan_type key -> (report name, standalone scanner)
+SCANS = {
+    "deps": ("dependencies", scan_dependencies),
+    "secrets": ("secrets", scan_secrets),
+    "patterns": ("code_patterns", scan_code_patterns),
+    "config": ("configuration", scan_configuration),
+}
+
+
 def run_full_scan(project_path: str, scan_type: str = "all") -> Dict[str, Any]:
     """Execute security validation scans."""
+    selected = [key for key in SCANS if scan_type == "all" or scan_type == key]
+    file_results = run_file_scans(project_path, [key for key in selected if key in FILE_SCANNERS])
+    return build_report(project_path, scan_type, selected, file_results)
+
+
+def build_report(project_path: str, scan_type: str, selected: List[str],
+                 file_results: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+    """Report for the selected scans; the ones missing from file_results are run here."""
     
     report = {
         "project": project_path,
@@ -385,27 +558,20 @@ def run_full_scan(project_path: str, scan_type: str = "all") -> Dict[str, Any]:
         }
     }
     
-    scanners = {
-        "deps": ("dependencies", scan_dependencies),
-        "secrets": ("secrets", scan_secrets),
-        "patterns": ("code_patterns", scan_code_patterns),
-        "config": ("configuration", scan_configuration),
-    }
-    
-    for key, (name, scanner) in scanners.items():
-        if scan_type == "all" or scan_type == key:
-            result = scanner(project_path)
-            report["scans"][name] = result
-            
-            findings_count = len(result.get("findings", []))
-            report["summary"]["total_findings"] += findings_count
-            
-            for finding in result.get("findings", []):
-                sev = finding.get("severity", "low")
-                if sev == "critical":
-                    report["summary"]["critical"] += 1
-                elif sev == "high":
-                    report["summary"]["high"] += 1
+    for key in selected:
+        name, scanner = SCANS[key]
+        result = file_results[key] if key in file_results else scanner(project_path)
+        report["scans"][name] = result
+        
+        findings_count = len(result.get("findings", []))
+        report["summary"]["total_findings"] += findings_count
+        
+        for finding in result.get("findings", []):
+            sev = finding.get("severity", "low")
+            if sev == "critical":
+                report["summary"]["critical"] += 1
+            elif sev == "high":
+                report["summary"]["high"] += 1
     
     # Determine overall status
     if report["summary"]["critical"] > 0:
@@ -418,6 +584,31 @@ def run_full_scan(project_path: str, scan_type: str = "all") -> Dict[str, Any]:
     return report
 
 
+class SecurityFileChecker:
+    """
+    `security_scan.py <project>` as a project_scanner.run_checkers checker:
+    the file scans ride on the shared pass, the dependency scan runs in
+    finish(). Like the CLI, the scan reports findings without failing.
+    """
+
+    def __init__(self, project_path: str):
+        self.project_path = str(project_path)
+        self.results: Dict[str, Dict[str, Any]] = {}
+
+    def register(self, scanner) -> None:
+        self.results = _register_file_scans(scanner, self.project_path, list(FILE_SCANNERS))
+
+    def finish(self) -> Dict[str, Any]:
+        file_results = {key: FILE_SCANNERS[key][3](results, self.project_path)
+                        for key, results in self.results.items()}
+        report = build_report(self.project_path, "all", list(SCANS), file_results)
+        return {"passed": True, "output": json.dumps(report, indent=2)}
+
+
+def file_checker(project_path: str) -> SecurityFileChecker:
+    return SecurityFileChecker(project_path)
+
+
 def main():
     parser = argparse.ArgumentParser(
         description="Validate security principles from vulnerability-scanner skill"
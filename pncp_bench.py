@@ -0,0 +1,239 @@
+#!/usr/bin/env python3
+"""
+Benchmark de coleta do PNCP contra o servidor local (pncp_mock_server).
+
+Mede listagem (pncp_harvester), itens (pncp_items) e arquivos
+(pncp_downloader) para cada combinação de concorrência e tamanhoPagina:
+registros/s, bytes/s, histograma de latência das requisições e pico de
+memória. Substitui a varredura manual de test_pagesize_limit.py.
+
+Uso:
+    python pncp_bench.py                                         # grade padrão
+    python pncp_bench.py --concurrency 4 8 16 32 --page-sizes 20 50 --latency-ms 120 -o bench_pncp.json
+    python pncp_bench.py --compare bench_pncp.json               # roda de novo e mostra as diferenças
+
+Cada etapa de cada combinação roda num processo filho novo, então o pico de
+RSS (ru_maxrss, que só cresce) é o daquela etapa, interpretador incluído; o
+servidor local roda no processo pai.
+"""
+import argparse
+import asyncio
+import json
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+from datetime import datetime
+from pathlib import Path
+
+DEFAULT_CONCURRENCY = [1, 4, 8, 16]
+DEFAULT_PAGE_SIZES = [10, 50]
+STAGES = ["listing", "items", "arquivos"]
+
+
+# ============ MEASUREMENT ============
+def _peak_rss_mb():
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reporta KiB, macOS bytes
+    return round(peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024, 2)
+
+
+def _histogram_percentile(histogram, pct):
+    """Limite superior do balde que contém o percentil (aproximação do histograma)."""
+    total = sum(histogram.values())
+    if not total:
+        return 0.0
+    target = total * pct / 100
+    seen = 0
+    for label, count in histogram.items():
+        seen += count
+        if seen >= target:
+            return label
+    return label
+
+
+def _stage_result(records, wall, metrics):
+    return {
+        "records": records,
+        "wall_s": round(wall, 3),
+        "records_per_s": round(records / wall, 1) if wall else 0.0,
+        "bytes": metrics["bytes"],
+        "mb_per_s": round(metrics["bytes"] / wall / (1024 * 1024), 2) if wall else 0.0,
+        "requests": metrics["requests"],
+        "retries": metrics["retries"],
+        "errors": metrics["errors"],
+        "latency_avg_ms": metrics["latency_avg_ms"],
+        "latency_p50": _histogram_percentile(metrics["latency_histogram"], 50),
+        "latency_p95": _histogram_percentile(metrics["latency_histogram"], 95),
+        "latency_histogram": metrics["latency_histogram"],
+        "peak_rss_mb": _peak_rss_mb(),
+    }
+
+
+def run_stage(server_url, concurrency, page_size, stage, numeros, args):
+    """
+    Roda uma etapa para uma combinação (no processo filho). Retorna
+    (resultado, numeros): a listagem devolve os numeroControlePNCP que as
+    etapas seguintes usam.
+    """
+    from pncp_client import PNCPClient, compra_key
+
+    consulta_url = f"{server_url}/api/consulta/v1"
+    pncp_url = f"{server_url}/api/pncp/v1"
+    client = PNCPClient(rate=args.rate, pool_size=concurrency, cache=False)
+
+    if stage == "listing":
+        # Listagem: coleta completa da janela, guardando só os numeroControlePNCP
+        from pncp_harvester import PNCPHarvester, listing_params
+        harvester = PNCPHarvester(consulta_url, concurrency, page_size, client=client)
+        params = listing_params(args.data_inicial, args.data_final, args.modalidade)
+        numeros = []
+
+        async def harvest():
+            count = 0
+            async for record in harvester.harvest(params):
+                count += 1
+                if len(numeros) < max(args.item_compras, args.arquivo_compras):
+                    numeros.append(record["numeroControlePNCP"])
+            return count
+
+        start = time.perf_counter()
+        count = asyncio.run(harvest())
+        return _stage_result(count, time.perf_counter() - start, client.metrics.snapshot()), numeros
+
+    if stage == "items":
+        # Itens: fan-out sobre as primeiras compras
+        from pncp_items import ItemsFetcher
+        fetcher = ItemsFetcher(client, pncp_url, concurrency, page_size)
+
+        async def fetch_items():
+            return sum([1 async for _ in fetcher.stream(numeros[:args.item_compras])])
+
+        start = time.perf_counter()
+        count = asyncio.run(fetch_items())
+        return _stage_result(count, time.perf_counter() - start, client.metrics.snapshot()), numeros
+
+    # Arquivos: download para um acervo temporário
+    from pncp_downloader import ArquivosDownloader
+    with tempfile.TemporaryDirectory(prefix="pncp-bench-") as store:
+        downloader = ArquivosDownloader(store, client, pncp_url, concurrency)
+        start = time.perf_counter()
+        stats = downloader.run([compra_key(n) for n in numeros[:args.arquivo_compras]])
+        wall = time.perf_counter() - start
+        downloader.close()
+    metrics = client.metrics.snapshot()
+    metrics["bytes"] += stats["bytes"]  # corpos em stream não entram nas métricas do cliente
+    return _stage_result(stats["documents"], wall, metrics), numeros
+
+
+# ============ REPORTING ============
+def _key(result):
+    return f"c={result['concurrency']} p={result['page_size']}"
+
+
+def _pct_change(old, new):
+    if not old:
+        return "n/a"
+    return f"{(new - old) / old * 100:+.1f}%"
+
+
+def print_report(report, baseline=None):
+    base = {_key(r): r for r in (baseline or {}).get("results", [])}
+    for stage in STAGES:
+        print(f"\n## {stage}")
+        print(f"   {'config':<12}{'rec/s':>10}{'MB/s':>8}{'reqs':>7}{'retry':>7}{'avg ms':>9}"
+              f"{'p50':>10}{'p95':>10}{'RSS MB':>9}{'Δrec/s':>9}")
+        for result in report["results"]:
+            s = result["stages"][stage]
+            delta = ""
+            old = base.get(_key(result))
+            if old:
+                delta = f"{_pct_change(old['stages'][stage]['records_per_s'], s['records_per_s']):>9}"
+            print(f"   {_key(result):<12}{s['records_per_s']:>10.1f}{s['mb_per_s']:>8.2f}{s['requests']:>7}"
+                  f"{s['retries']:>7}{s['latency_avg_ms']:>9.1f}{s['latency_p50']:>10}{s['latency_p95']:>10}"
+                  f"{s['peak_rss_mb']:>9.1f}{delta}")
+        best = max(report["results"], key=lambda r: r["stages"][stage]["records_per_s"])
+        print(f"   ⭐ melhor: {_key(best)} ({best['stages'][stage]['records_per_s']:.1f} rec/s)")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark de coleta do PNCP contra servidor local")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=DEFAULT_CONCURRENCY, help="Concorrências (padrão: 1 4 8 16)")
+    parser.add_argument("--page-sizes", type=int, nargs="+", default=DEFAULT_PAGE_SIZES, help="tamanhoPagina (padrão: 10 50)")
+    parser.add_argument("--data-inicial", default="20250106")
+    parser.add_argument("--data-final", default="20250107")
+    parser.add_argument("--modalidade", type=int, default=8)
+    parser.add_argument("--records-per-day", type=int, default=1000, help="Registros por dia no servidor local")
+    parser.add_argument("--item-compras", type=int, default=200, help="Compras na etapa de itens")
+    parser.add_argument("--arquivo-compras", type=int, default=30, help="Compras na etapa de arquivos")
+    parser.add_argument("--file-kb", type=int, default=128, help="Tamanho base dos arquivos simulados")
+    parser.add_argument("--latency-ms", type=float, default=50.0, help="Latência injetada por requisição")
+    parser.add_argument("--jitter-ms", type=float, default=20.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0, help="Fração de 429 injetados")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Fração de 5xx injetados")
+    parser.add_argument("--rate", type=float, default=0, help="Rate limit do cliente, req/s (padrão: sem limite)")
+    parser.add_argument("--output", "-o", default=None, help="Grava os resultados em JSON")
+    parser.add_argument("--compare", default=None, help="JSON anterior para comparar")
+    parser.add_argument("--child", nargs=4, default=None, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        # numeros da listagem chegam pelo stdin
+        server_url, concurrency, page_size, stage = args.child
+        numeros = [] if stage == "listing" else json.load(sys.stdin)
+        result, numeros = run_stage(server_url, int(concurrency), int(page_size), stage, numeros, args)
+        print(json.dumps({"result": result, "numeros": numeros}))
+        return 0
+
+    from pncp_mock_server import MockConfig, MockPNCPServer
+    config = MockConfig(records_per_day=args.records_per_day, file_kb=args.file_kb,
+                        latency_ms=args.latency_ms, jitter_ms=args.jitter_ms,
+                        throttle_rate=args.throttle_rate, error_rate=args.error_rate, retry_after=0)
+    report = {
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "python": sys.version.split()[0],
+        "server": config.__dict__,
+        "window": [args.data_inicial, args.data_final, args.modalidade],
+        "results": [],
+    }
+    forwarded = []
+    for name in ("data_inicial", "data_final", "modalidade", "item_compras", "arquivo_compras", "rate"):
+        forwarded += [f"--{name.replace('_', '-')}", str(getattr(args, name))]
+
+    env = dict(os.environ)
+    env.pop("PNCP_CACHE", None)
+    with MockPNCPServer(config) as server:
+        for concurrency in args.concurrency:
+            for page_size in args.page_sizes:
+                print(f"Rodando c={concurrency} p={page_size} ...", file=sys.stderr)
+                stages, numeros = {}, []
+                for stage in STAGES:
+                    cmd = [sys.executable, str(Path(__file__).resolve()), "--child", server.url,
+                           str(concurrency), str(page_size), stage] + forwarded
+                    out = subprocess.run(cmd, input=json.dumps(numeros), capture_output=True, text=True, env=env)
+                    if out.returncode != 0:
+                        print(out.stderr, file=sys.stderr)
+                        return out.returncode
+                    child = json.loads(out.stdout.strip().splitlines()[-1])
+                    stages[stage], numeros = child["result"], child["numeros"]
+                report["results"].append({"concurrency": concurrency, "page_size": page_size, "stages": stages})
+        report["server_stats"] = server.stats
+
+    baseline = None
+    if args.compare:
+        with open(args.compare, "r", encoding="utf-8") as f:
+            baseline = json.load(f)
+    print_report(report, baseline)
+
+    if args.output:
+        Path(args.output).parent.mkdir(parents=True, exist_ok=True)
+        with open(args.output, "w", encoding="utf-8") as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"\n💾 Resultados salvos em {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Cache local de respostas da API do PNCP (SQLite).
+
+Chave: URL + parâmetros normalizados. Cada entrada guarda corpo, status,
+ETag/Last-Modified e validade. Dentro do TTL a resposta sai do cache sem
+rede; depois dele a requisição vai com If-None-Match/If-Modified-Since e
+um 304 só renova a validade.
+
+TTL por classe de endpoint:
+    referencia  /modalidades, /orgaos/{cnpj}, tabelas de domínio   1 dia
+    compra      /orgaos/.../compras/..., /itens, /arquivos          1 hora
+    listagem    /contratacoes/...                                   5 minutos
+
+Ativação: PNCPClient(cache=ResponseCache(...)) ou PNCP_CACHE=/caminho/cache.db
+(vale para todo PNCPClient criado sem cache explícito, inclusive nos probes).
+
+Uso:
+    python pncp_cache.py              # entradas, frescas e tamanho
+    python pncp_cache.py --prune
+"""
+import argparse
+import json
+import os
+import re
+import sqlite3
+import sys
+import threading
+import time
+from urllib.parse import urlencode
+
+CACHE_PATH = os.environ.get("PNCP_CACHE", "")
+
+# (classe, padrão do caminho, TTL em segundos): o primeiro padrão que casar vale
+TTL_CLASSES = [
+    ("listagem", re.compile(r"/contratacoes(/|$)"), 300),
+    ("compra", re.compile(r"/orgaos/\d+/compras/"), 3600),
+    ("referencia", re.compile(r"/(modalidades|orgaos|amparos-legais|tipos-|fontes-|unidades|instrumentos|criterios|situacoes|categorias)"), 86400),
+]
+DEFAULT_TTL = 600
+CACHED_HEADERS = ("Content-Type", "ETag", "Last-Modified")
+
+
+def endpoint_class(url):
+    """(classe, ttl) do endpoint pela URL."""
+    for name, pattern, ttl in TTL_CLASSES:
+        if pattern.search(url):
+            return name, ttl
+    return "outro", DEFAULT_TTL
+
+
+def cache_key(url, params=None):
+    """URL + parâmetros em ordem estável (None descartado)."""
+    items = sorted((str(k), str(v)) for k, v in (params or {}).items() if v is not None)
+    return f"{url}?{urlencode(items)}" if items else url
+
+
+class ResponseCache:
+    """Respostas GET em SQLite, seguro para várias threads."""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS responses (
+            key TEXT PRIMARY KEY,
+            url TEXT NOT NULL,
+            status INTEGER NOT NULL,
+            headers TEXT NOT NULL,
+            body BLOB NOT NULL,
+            fetched_at REAL NOT NULL,
+            expires_at REAL NOT NULL
+        )
+    """
+
+    def __init__(self, path=CACHE_PATH or "pncp_cache.db", ttls=None):
+        self.path = path
+        self.ttls = ttls or {}
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute("PRAGMA journal_mode=WAL")
+        self.conn.execute(self.SCHEMA)
+        self.conn.commit()
+        self._lock = threading.Lock()
+        self.stats = {"hits": 0, "revalidated": 0, "misses": 0, "stores": 0}
+
+    def ttl_for(self, url):
+        name, ttl = endpoint_class(url)
+        return self.ttls.get(name, ttl)
+
+    def get(self, key):
+        """Entrada (fresca ou não) ou None."""
+        with self._lock:
+            row = self.conn.execute(
+                "SELECT url, status, headers, body, fetched_at, expires_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+        if row is None:
+            return None
+        url, status, headers, body, fetched_at, expires_at = row
+        return {"url": url, "status": status, "headers": json.loads(headers), "body": body,
+                "fetched_at": fetched_at, "expires_at": expires_at, "fresh": expires_at > time.time()}
+
+    def put(self, key, url, status, headers, body):
+        now = time.time()
+        kept = {h: headers[h] for h in CACHED_HEADERS if h in headers}
+        with self._lock:
+            self.conn.execute(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (key, url, status, json.dumps(kept), body, now, now + self.ttl_for(url)),
+            )
+            self.conn.commit()
+        self.count("stores")
+
+    def touch(self, key, url):
+        """304: a entrada continua válida por mais um TTL."""
+        now = time.time()
+        with self._lock:
+            self.conn.execute("UPDATE responses SET fetched_at = ?, expires_at = ? WHERE key = ?",
+                              (now, now + self.ttl_for(url), key))
+            self.conn.commit()
+
+    def validators(self, entry):
+        """Cabeçalhos de requisição condicional a partir de uma entrada vencida."""
+        headers = {}
+        if entry["headers"].get("ETag"):
+            headers["If-None-Match"] = entry["headers"]["ETag"]
+        if entry["headers"].get("Last-Modified"):
+            headers["If-Modified-Since"] = entry["headers"]["Last-Modified"]
+        return headers
+
+    def count(self, name):
+        with self._lock:
+            self.stats[name] += 1
+
+    def prune(self):
+        """Remove entradas vencidas sem validadores (não dá para revalidá-las)."""
+        with self._lock:
+            cursor = self.conn.execute(
+                "DELETE FROM responses WHERE expires_at < ? AND headers NOT LIKE '%ETag%' AND headers NOT LIKE '%Last-Modified%'",
+                (time.time(),),
+            )
+            self.conn.commit()
+            return cursor.rowcount
+
+    def summary(self):
+        now = time.time()
+        with self._lock:
+            total, fresh, size = self.conn.execute(
+                "SELECT COUNT(*), SUM(expires_at > ?), COALESCE(SUM(LENGTH(body)), 0) FROM responses", (now,)
+            ).fetchone()
+        return {"entries": total, "fresh": fresh or 0, "bytes": size, **self.stats}
+
+    def close(self):
+        self.conn.close()
+
+
+def default_cache():
+    """ResponseCache de PNCP_CACHE, ou None se a variável não estiver definida."""
+    return ResponseCache(CACHE_PATH) if CACHE_PATH else None
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cache de respostas do PNCP")
+    parser.add_argument("--db", default=CACHE_PATH or "pncp_cache.db", help="Banco do cache (padrão: $PNCP_CACHE ou pncp_cache.db)")
+    parser.add_argument("--prune", action="store_true", help="Remove entradas vencidas sem ETag/Last-Modified")
+    args = parser.parse_args()
+
+    cache = ResponseCache(args.db)
+    if args.prune:
+        print(f"🧹 {cache.prune()} entradas removidas")
+    summary = cache.summary()
+    print(f"📦 {summary['entries']} entradas ({summary['fresh']} frescas), {summary['bytes'] / 1024:.0f} KiB em {args.db}")
+    cache.close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+Cliente HTTP compartilhado para a API do PNCP.
+
+- Sessão requests com pool de conexões (keep-alive HTTP/1.1): o handshake
+  TCP/TLS é feito uma vez por conexão, não por chamada.
+- Backoff exponencial com jitter em 429/5xx e erros de conexão, respeitando
+  Retry-After quando o servidor envia.
+- Token bucket: rate limit da API é 5 requisições/segundo.
+- Métricas de requisições, retries e latência (histograma).
+- Cache opcional de respostas com revalidação condicional (pncp_cache).
+
+Uso:
+    client = PNCPClient()
+    modalidades = client.get_json(f"{PNCP_URL}/modalidades")
+    print(client.metrics.snapshot())
+"""
+import json
+import random
+import re
+import threading
+import time
+
+import requests
+from requests.adapters import HTTPAdapter
+from requests.structures import CaseInsensitiveDict
+
+from pncp_cache import cache_key, default_cache
+
+CONSULTA_URL = "https://pncp.gov.br/api/consulta/v1"
+PNCP_URL = "https://pncp.gov.br/api/pncp/v1"
+
+DEFAULT_RATE = 5.0          # requisições/segundo (limite documentado da API)
+DEFAULT_BURST = 5
+DEFAULT_MAX_RETRIES = 5
+DEFAULT_BACKOFF_BASE = 0.5  # segundos
+DEFAULT_BACKOFF_MAX = 30.0
+DEFAULT_POOL_SIZE = 16
+DEFAULT_TIMEOUT = 30
+
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000)
+
+DEFAULT_HEADERS = {
+    "Accept": "application/json",
+    "User-Agent": "Mabus-Platform/1.0",
+}
+
+
+class PNCPError(RuntimeError):
+    """Resposta inesperada da API do PNCP."""
+
+    def __init__(self, status, url, detail=""):
+        super().__init__(f"PNCP {status} em {url}: {detail[:200]}")
+        self.status = status
+        self.url = url
+
+
+class TokenBucket:
+    """Rate limiter thread-safe: rate fichas/segundo, até burst acumuladas."""
+
+    def __init__(self, rate=DEFAULT_RATE, burst=DEFAULT_BURST):
+        self.rate = rate
+        self.capacity = max(1, burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self):
+        """Bloqueia até haver uma ficha; retorna o tempo esperado em segundos."""
+        if not self.rate:
+            return 0.0
+        waited = 0.0
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+                self.updated = now
+                if self.tokens >= 1:
+                    self.tokens -= 1
+                    return waited
+                delay = (1 - self.tokens) / self.rate
+            time.sleep(delay)
+            waited += delay
+
+
+class ClientMetrics:
+    """Contadores e histograma de latência, compartilhados entre threads."""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self):
+        with self._lock:
+            self.requests = 0
+            self.retries = 0
+            self.errors = 0
+            self.bytes = 0
+            self.throttled_s = 0.0
+            self.statuses = {}
+            self.latency_sum = 0.0
+            self.latency_max = 0.0
+            self.histogram = [0] * (len(LATENCY_BUCKETS_MS) + 1)
+
+    def record(self, status, elapsed, size=0):
+        ms = elapsed * 1000
+        bucket = next((i for i, edge in enumerate(LATENCY_BUCKETS_MS) if ms <= edge), len(LATENCY_BUCKETS_MS))
+        with self._lock:
+            self.requests += 1
+            self.bytes += size
+            self.statuses[status] = self.statuses.get(status, 0) + 1
+            self.latency_sum += elapsed
+            self.latency_max = max(self.latency_max, elapsed)
+            self.histogram[bucket] += 1
+
+    def count(self, name, value=1):
+        with self._lock:
+            setattr(self, name, getattr(self, name) + value)
+
+    def snapshot(self):
+        with self._lock:
+            labels = [f"<={edge}ms" for edge in LATENCY_BUCKETS_MS] + [f">{LATENCY_BUCKETS_MS[-1]}ms"]
+            return {
+                "requests": self.requests,
+                "retries": self.retries,
+                "errors": self.errors,
+                "bytes": self.bytes,
+                "throttled_s": round(self.throttled_s, 3),
+                "statuses": {str(k): v for k, v in sorted(self.statuses.items(), key=lambda kv: str(kv[0]))},
+                "latency_avg_ms": round(self.latency_sum / self.requests * 1000, 2) if self.requests else 0.0,
+                "latency_max_ms": round(self.latency_max * 1000, 2),
+                "latency_histogram": dict(zip(labels, self.histogram)),
+            }
+
+
+_NUMERO_CONTROLE_RE = re.compile(r"^(\d{14})-\d+-(\d+)/(\d{4})$")
+
+
+def parse_numero_controle(numero):
+    """'05995955000140-1-000001/2024' -> ('05995955000140', 2024, 1)."""
+    match = _NUMERO_CONTROLE_RE.match(str(numero).strip())
+    if not match:
+        raise ValueError(f"numeroControlePNCP inválido: {numero}")
+    cnpj, sequencial, ano = match.groups()
+    return cnpj, int(ano), int(sequencial)
+
+
+def compra_key(record):
+    """(cnpj, ano, sequencial) de um registro de contratação ou de um numeroControlePNCP."""
+    if isinstance(record, str):
+        return parse_numero_controle(record)
+    cnpj = (record.get("orgaoEntidade") or {}).get("cnpj") or record.get("cnpj")
+    if cnpj and record.get("anoCompra") and record.get("sequencialCompra"):
+        return cnpj, int(record["anoCompra"]), int(record["sequencialCompra"])
+    return parse_numero_controle(record.get("numeroControlePNCP", ""))
+
+
+def compra_url(cnpj, ano, sequencial, base=PNCP_URL):
+    """Raiz da compra na API PNCP: /orgaos/{cnpj}/compras/{ano}/{sequencial}."""
+    return f"{base}/orgaos/{cnpj}/compras/{ano}/{sequencial}"
+
+
+def read_compras(path):
+    """
+    Lê compras de um arquivo: NDJSON de contratações (um registro por linha)
+    ou uma linha por numeroControlePNCP. Gera (cnpj, ano, sequencial).
+    """
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            yield compra_key(json.loads(line) if line.startswith("{") else line)
+
+
+def _cached_response(key, entry):
+    """Response montada a partir de uma entrada do cache."""
+    response = requests.Response()
+    response.status_code = entry["status"]
+    response.headers = CaseInsensitiveDict(entry["headers"])
+    response._content = entry["body"]
+    response.url = key
+    response.encoding = requests.utils.get_encoding_from_headers(response.headers) or "utf-8"
+    return response
+
+
+def _retry_after(response):
+    """Segundos pedidos pelo servidor em Retry-After (só o formato numérico)."""
+    value = response.headers.get("Retry-After") if response is not None else None
+    try:
+        return max(0.0, float(value)) if value is not None else None
+    except ValueError:
+        return None
+
+
+class PNCPClient:
+    """Sessão HTTP com pool, retries com backoff e rate limit para o PNCP."""
+
+    def __init__(self, rate=DEFAULT_RATE, burst=DEFAULT_BURST, max_retries=DEFAULT_MAX_RETRIES,
+                 backoff_base=DEFAULT_BACKOFF_BASE, backoff_max=DEFAULT_BACKOFF_MAX,
+                 pool_size=DEFAULT_POOL_SIZE, timeout=DEFAULT_TIMEOUT, session=None, cache=None):
+        self.max_retries = max_retries
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.timeout = timeout
+        self.bucket = TokenBucket(rate, burst)
+        self.metrics = ClientMetrics()
+        self.session = session or self._new_session(pool_size)
+        # cache=None usa PNCP_CACHE (se definido); cache=False desliga
+        self.cache = default_cache() if cache is None else (cache or None)
+
+    @staticmethod
+    def _new_session(pool_size):
+        # Sessão compartilhada: keep-alive, retries com backoff e rate limit.
+        # Accept é JSON por padrão; downloads de arquivos passam Accept: */*
+        session = requests.Session()
+        session.headers.update(DEFAULT_HEADERS)
+        # Retries ficam a cargo do cliente (com jitter e métricas), não do urllib3
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=pool_size, max_retries=0)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    def backoff(self, attempt, response=None):
+        """Espera antes da próxima tentativa: Retry-After ou exponencial com full jitter."""
+        server_delay = _retry_after(response)
+        if server_delay is not None:
+            return min(server_delay, self.backoff_max)
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** attempt)))
+
+    def request(self, method, url, params=None, timeout=None, **kwargs):
+        """
+        Requisição com rate limit e retries; retorna a última Response.
+        Erros de conexão/timeout são relançados depois de esgotar as tentativas.
+        """
+        attempt = 0
+        while True:
+            self.metrics.count("throttled_s", self.bucket.acquire())
+            start = time.perf_counter()
+            try:
+                response = self.session.request(method, url, params=params,
+                                                timeout=timeout or self.timeout, **kwargs)
+            except (requests.ConnectionError, requests.Timeout):
+                self.metrics.record("error", time.perf_counter() - start)
+                if attempt >= self.max_retries:
+                    self.metrics.count("errors")
+                    raise
+                response = None
+            else:
+                size = 0 if kwargs.get("stream") else len(response.content)
+                self.metrics.record(response.status_code, time.perf_counter() - start, size)
+                if response.status_code not in RETRY_STATUSES or attempt >= self.max_retries:
+                    if response.status_code >= 400:
+                        self.metrics.count("errors")
+                    return response
+                response.close()
+
+            self.metrics.count("retries")
+            time.sleep(self.backoff(attempt, response))
+            attempt += 1
+
+    def get(self, url, params=None, **kwargs):
+        """GET, passando pelo cache de respostas quando houver (exceto streams e Range)."""
+        headers = dict(kwargs.pop("headers", None) or {})
+        if self.cache is None or kwargs.get("stream") or "Range" in headers:
+            return self.request("GET", url, params=params, headers=headers, **kwargs)
+
+        key = cache_key(url, params)
+        entry = self.cache.get(key)
+        if entry and entry["fresh"]:
+            self.cache.count("hits")
+            return _cached_response(key, entry)
+        if entry:
+            headers.update(self.cache.validators(entry))
+
+        response = self.request("GET", url, params=params, headers=headers, **kwargs)
+        if response.status_code == 304 and entry:
+            self.cache.touch(key, url)
+            self.cache.count("revalidated")
+            return _cached_response(key, entry)
+        self.cache.count("misses")
+        if response.status_code in (200, 204):
+            self.cache.put(key, url, response.status_code, response.headers, response.content)
+        return response
+
+    def get_json(self, url, params=None, empty=None, **kwargs):
+        """GET que devolve o JSON; 204 devolve `empty`, outros status levantam PNCPError."""
+        response = self.get(url, params=params, **kwargs)
+        if response.status_code == 204:
+            return empty
+        if response.status_code != 200:
+            raise PNCPError(response.status_code, response.url, response.text)
+        return response.json()
+
+    def close(self):
+        self.session.close()
@@ -0,0 +1,311 @@
+#!/usr/bin/env python3
+"""
+Downloader paralelo e retomável dos arquivos (editais, avisos, termos) das
+compras do PNCP: /orgaos/{cnpj}/compras/{ano}/{seq}/arquivos/{seqDoc}.
+
+- Corpo gravado em disco em blocos, sem bufferizar o arquivo inteiro.
+- N downloads simultâneos entre compras diferentes.
+- Arquivos .part são retomados com HTTP Range após queda.
+- Tamanho verificado contra Content-Length/Content-Range (pedido com
+  Accept-Encoding: identity e lido sem descompressão, para que bytes
+  gravados, offsets de Range e tamanhos anunciados sejam a mesma medida).
+- Armazenamento por conteúdo (sha256): o mesmo edital anexado a várias
+  compras é gravado uma vez só; o manifesto (SQLite) liga cada documento
+  ao seu blob.
+
+Layout do diretório:
+    <store>/blobs/ab/abcdef...   conteúdo, nome = sha256
+    <store>/partial/*.part       downloads em andamento
+    <store>/manifest.db          documento -> sha256, tamanho, título
+
+Uso:
+    python pncp_downloader.py --compras contratacoes.ndjson --store arquivos/ -w 8
+    python pncp_downloader.py --compra 05995955000140 2024 1 --store arquivos/
+"""
+import argparse
+import hashlib
+import os
+import sqlite3
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime
+
+import requests
+
+from pncp_client import PNCPClient, PNCPError, PNCP_URL, DEFAULT_RATE, compra_url, read_compras
+
+CHUNK_SIZE = 64 * 1024  # blocos pequenos: numa queda, perde-se no máximo um bloco
+DEFAULT_WORKERS = 8
+DEFAULT_ATTEMPTS = 3
+
+
+# Arquivos são gravados byte a byte como o servidor os tem: sem gzip de transporte
+DOWNLOAD_HEADERS = {"Accept": "*/*", "Accept-Encoding": "identity"}
+
+
+class DownloadError(RuntimeError):
+    """Download incompleto ou inconsistente (o .part é descartado)."""
+
+
+class Manifest:
+    """Documento (cnpj, ano, sequencial, sequencialDocumento) -> blob."""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS documents (
+            cnpj TEXT NOT NULL,
+            ano INTEGER NOT NULL,
+            sequencial INTEGER NOT NULL,
+            sequencial_documento INTEGER NOT NULL,
+            titulo TEXT,
+            tipo_documento TEXT,
+            content_type TEXT,
+            sha256 TEXT NOT NULL,
+            size INTEGER NOT NULL,
+            downloaded_at TEXT,
+            PRIMARY KEY (cnpj, ano, sequencial, sequencial_documento)
+        )
+    """
+
+    def __init__(self, path):
+        self.conn = sqlite3.connect(path, check_same_thread=False)
+        self.conn.execute(self.SCHEMA)
+        self.conn.commit()
+        self._lock = threading.Lock()
+
+    def has(self, cnpj, ano, sequencial, sequencial_documento):
+        with self._lock:
+            return self.conn.execute(
+                "SELECT 1 FROM documents WHERE cnpj = ? AND ano = ? AND sequencial = ? AND sequencial_documento = ?",
+                (cnpj, ano, sequencial, sequencial_documento),
+            ).fetchone() is not None
+
+    def add(self, **row):
+        row.setdefault("downloaded_at", datetime.now().isoformat(timespec="seconds"))
+        columns = ", ".join(row)
+        with self._lock:
+            self.conn.execute(
+                f"INSERT OR REPLACE INTO documents ({columns}) VALUES ({', '.join('?' for _ in row)})",
+                tuple(row.values()),
+            )
+            self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+
+def _content_range(response):
+    """(início, total) de Content-Range: 'bytes 100-199/200' ou 'bytes */200'; None se ausente."""
+    value = response.headers.get("Content-Range", "")
+    unit, _, spec = value.partition(" ")
+    if unit != "bytes" or "/" not in spec:
+        return None
+    span, total = spec.split("/", 1)
+    try:
+        start = None if span == "*" else int(span.split("-", 1)[0])
+        return start, (None if total == "*" else int(total))
+    except ValueError:
+        return None
+
+
+def _expected_size(response, offset):
+    """Tamanho total esperado a partir de Content-Range (206) ou Content-Length."""
+    content_range = response.headers.get("Content-Range", "")
+    if "/" in content_range and not content_range.endswith("/*"):
+        return int(content_range.rsplit("/", 1)[1])
+    length = response.headers.get("Content-Length")
+    if length is None:
+        return None
+    return int(length) + (offset if response.status_code == 206 else 0)
+
+
+class ArquivosDownloader:
+    """Lista e baixa os arquivos de várias compras em paralelo."""
+
+    def __init__(self, store, client=None, base_url=PNCP_URL, workers=DEFAULT_WORKERS,
+                 attempts=DEFAULT_ATTEMPTS, chunk_size=CHUNK_SIZE):
+        self.store = store
+        self.client = client or PNCPClient(pool_size=workers)
+        self.base_url = base_url.rstrip("/")
+        self.workers = max(1, workers)
+        self.attempts = max(1, attempts)
+        self.chunk_size = chunk_size
+        self.blob_dir = os.path.join(store, "blobs")
+        self.partial_dir = os.path.join(store, "partial")
+        os.makedirs(self.blob_dir, exist_ok=True)
+        os.makedirs(self.partial_dir, exist_ok=True)
+        self.manifest = Manifest(os.path.join(store, "manifest.db"))
+        self.stats = {"documents": 0, "downloaded": 0, "deduplicated": 0, "skipped": 0,
+                      "resumed": 0, "failed": 0, "bytes": 0}
+        self._stats_lock = threading.Lock()
+
+    def _count(self, name, value=1):
+        with self._stats_lock:
+            self.stats[name] += value
+
+    # ============ LISTING ============
+    def list_arquivos(self, cnpj, ano, sequencial):
+        """Arquivos ativos da compra; 404 (sem arquivos publicados) vira lista vazia."""
+        try:
+            arquivos = self.client.get_json(f"{compra_url(cnpj, ano, sequencial, self.base_url)}/arquivos", empty=[])
+        except PNCPError as e:
+            if e.status == 404:
+                return []
+            raise
+        return [a for a in arquivos or [] if a.get("statusAtivo", True)]
+
+    # ============ DOWNLOAD ============
+    def blob_path(self, sha256):
+        return os.path.join(self.blob_dir, sha256[:2], sha256)
+
+    def _hash_existing(self, path):
+        digest = hashlib.sha256()
+        with open(path, "rb") as f:
+            for block in iter(lambda: f.read(self.chunk_size), b""):
+                digest.update(block)
+        return digest
+
+    def _fetch(self, url, part):
+        """Baixa url em part (retomando com Range); retorna (sha256, tamanho, content-type)."""
+        offset = os.path.getsize(part) if os.path.exists(part) else 0
+        headers = dict(DOWNLOAD_HEADERS, Range=f"bytes={offset}-") if offset else DOWNLOAD_HEADERS
+        response = self.client.get(url, headers=headers, stream=True, allow_redirects=True)
+        with response:
+            if response.status_code == 416 and offset:
+                # Nada a partir do offset: o .part só está completo se tiver o tamanho total
+                content_range = _content_range(response)
+                if content_range and content_range[1] == offset:
+                    digest = self._hash_existing(part)
+                    return digest.hexdigest(), offset, None
+                os.remove(part)
+                return self._fetch(url, part)
+            if response.status_code not in (200, 206):
+                raise PNCPError(response.status_code, url, response.text if not offset else "")
+
+            if response.status_code == 206 and offset:
+                content_range = _content_range(response)
+                if not content_range or content_range[0] != offset:
+                    raise DownloadError(f"{url}: Content-Range {response.headers.get('Content-Range')!r} "
+                                        f"não começa em {offset}")
+                self._count("resumed")
+                digest, mode = self._hash_existing(part), "ab"
+            else:
+                digest, mode, offset = hashlib.sha256(), "wb", 0
+            expected = _expected_size(response, offset)
+
+            written = offset
+            with open(part, mode) as f:
+                # Bytes como vieram no fio: é o que Content-Length/Range medem
+                for block in response.raw.stream(self.chunk_size, decode_content=False):
+                    f.write(block)
+                    digest.update(block)
+                    written += len(block)
+                    self._count("bytes", len(block))
+            if expected is not None and written != expected:
+                raise DownloadError(f"{url}: {written} de {expected} bytes")
+            return digest.hexdigest(), written, response.headers.get("Content-Type")
+
+    def download(self, cnpj, ano, sequencial, arquivo):
+        """Baixa um documento (com retomada) e registra no manifesto. Retorna o status."""
+        seq_doc = int(arquivo["sequencialDocumento"])
+        if self.manifest.has(cnpj, ano, sequencial, seq_doc):
+            self._count("skipped")
+            return "skipped"
+        url = f"{compra_url(cnpj, ano, sequencial, self.base_url)}/arquivos/{seq_doc}"
+        part = os.path.join(self.partial_dir, f"{cnpj}-{ano}-{sequencial}-{seq_doc}.part")
+
+        for attempt in range(1, self.attempts + 1):
+            try:
+                sha256, size, content_type = self._fetch(url, part)
+                break
+            except (DownloadError, requests.RequestException) as e:
+                # Queda de conexão: o .part é retomado; conteúdo inconsistente: recomeça do zero
+                if isinstance(e, DownloadError) and os.path.exists(part):
+                    os.remove(part)
+                if attempt == self.attempts:
+                    raise
+
+        blob = self.blob_path(sha256)
+        if os.path.exists(blob):
+            os.remove(part)
+            status = "deduplicated"
+        else:
+            os.makedirs(os.path.dirname(blob), exist_ok=True)
+            os.replace(part, blob)
+            status = "downloaded"
+        self.manifest.add(cnpj=cnpj, ano=ano, sequencial=sequencial, sequencial_documento=seq_doc,
+                          titulo=arquivo.get("titulo"), tipo_documento=arquivo.get("tipoDocumentoNome"),
+                          content_type=content_type, sha256=sha256, size=size)
+        self._count(status)
+        return status
+
+    def _list_compra(self, compra):
+        cnpj, ano, sequencial = compra
+        arquivos = self.list_arquivos(cnpj, ano, sequencial)
+        self._count("documents", len(arquivos))
+        return [(compra, arquivo) for arquivo in arquivos]
+
+    def run(self, compras, on_error=None):
+        """Lista e baixa todos os arquivos das compras com `workers` threads."""
+        with ThreadPoolExecutor(max_workers=self.workers) as pool:
+            listings = [pool.submit(self._list_compra, compra) for compra in compras]
+            downloads = {}
+            for future in as_completed(listings):
+                try:
+                    for compra, arquivo in future.result():
+                        downloads[pool.submit(self.download, *compra, arquivo)] = (compra, arquivo)
+                except Exception as e:
+                    self._count("failed")
+                    if on_error:
+                        on_error(None, e)
+            for future in as_completed(downloads):
+                try:
+                    future.result()
+                except Exception as e:
+                    self._count("failed")
+                    if on_error:
+                        on_error(downloads[future], e)
+        return self.stats
+
+    def close(self):
+        self.manifest.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Downloader paralelo de arquivos do PNCP")
+    parser.add_argument("--compras", default=None, help="NDJSON de contratações ou lista de numeroControlePNCP")
+    parser.add_argument("--compra", nargs=3, metavar=("CNPJ", "ANO", "SEQ"), default=None, help="Uma compra só")
+    parser.add_argument("--store", required=True, help="Diretório do acervo (blobs + manifesto)")
+    parser.add_argument("--workers", "-w", type=int, default=DEFAULT_WORKERS, help="Downloads simultâneos (padrão: 8)")
+    parser.add_argument("--rate", type=float, default=DEFAULT_RATE, help="Requisições/segundo (0 = sem limite; padrão: 5)")
+    parser.add_argument("--base-url", default=PNCP_URL, help="Raiz da API PNCP (útil para servidor local)")
+    args = parser.parse_args()
+
+    if args.compra:
+        compras = [(args.compra[0], int(args.compra[1]), int(args.compra[2]))]
+    elif args.compras:
+        compras = list(dict.fromkeys(read_compras(args.compras)))
+    else:
+        parser.error("informe --compras ou --compra")
+
+    def report(item, error):
+        print(f"❌ {item[0] if item else 'listagem'}: {error}", file=sys.stderr)
+
+    client = PNCPClient(rate=args.rate, pool_size=args.workers)
+    downloader = ArquivosDownloader(args.store, client, args.base_url, args.workers)
+    start = time.perf_counter()
+    try:
+        stats = downloader.run(compras, on_error=report)
+    finally:
+        downloader.close()
+    elapsed = time.perf_counter() - start
+    print(f"✅ {len(compras)} compras, {stats['documents']} documentos em {elapsed:.1f}s")
+    print(f"   📥 {stats['downloaded']} baixados | ♻️  {stats['deduplicated']} duplicados | "
+          f"⏭️  {stats['skipped']} já no acervo | 🔁 {stats['resumed']} retomados | ❌ {stats['failed']} falhas")
+    print(f"   💾 {stats['bytes'] / (1024 * 1024):.1f} MB transferidos")
+    return 1 if stats["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
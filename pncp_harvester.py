@@ -0,0 +1,186 @@
+#!/usr/bin/env python3
+"""
+Harvester concorrente da listagem de contratações do PNCP
+(/api/consulta/v1/contratacoes/publicacao).
+
+Lê a página 1 para descobrir totalPaginas e busca as demais em paralelo,
+numa janela de `concurrency` páginas, entregando os registros à medida que
+chegam.
+
+Uso:
+    python pncp_harvester.py --data-inicial 20250108 --data-final 20250108 --modalidade 8 -o dispensa.ndjson
+    python pncp_harvester.py ... --base-url http://127.0.0.1:8765/api/consulta/v1   # servidor local
+
+Como módulo:
+    harvester = PNCPHarvester(concurrency=8)
+    async for registro in harvester.harvest({"dataInicial": "20250108", ...}):
+        ...
+"""
+import argparse
+import asyncio
+import sys
+import time
+
+from pncp_client import PNCPClient, PNCPError, CONSULTA_URL, DEFAULT_RATE
+from pncp_sink import add_sink_arguments, sink_from_args
+
+BASE_URL = CONSULTA_URL
+LISTING_PATH = "/contratacoes/publicacao"
+
+# test_pagesize_limit.py: a API recusa (400) qualquer tamanhoPagina acima de 50
+PAGE_SIZE_CANDIDATES = (50, 40, 30, 20, 10)
+DEFAULT_CONCURRENCY = 8
+DEFAULT_TIMEOUT = 30
+
+
+class PNCPHarvester:
+    """Busca todas as páginas de uma consulta de contratações em paralelo."""
+
+    def __init__(self, base_url=BASE_URL, concurrency=DEFAULT_CONCURRENCY,
+                 tamanho_pagina=None, timeout=DEFAULT_TIMEOUT, client=None, path=LISTING_PATH):
+        self.base_url = base_url.rstrip("/")
+        self.path = path
+        self.concurrency = max(1, concurrency)
+        self.tamanho_pagina = tamanho_pagina
+        self.timeout = timeout
+        self.client = client or PNCPClient(pool_size=self.concurrency, timeout=timeout)
+        self.stats = {"requests": 0, "pages": 0, "records": 0}
+
+    # ============ HTTP ============
+    def _get(self, params):
+        """GET bloqueante de uma página; 204 vira página vazia."""
+        self.stats["requests"] += 1
+        return self.client.get_json(self.base_url + self.path, params, timeout=self.timeout,
+                                    empty={"data": [], "totalRegistros": 0, "totalPaginas": 0, "empty": True})
+
+    def fetch_page(self, params, pagina, tamanho_pagina):
+        """Busca uma página (síncrono)."""
+        return self._get(dict(params, pagina=pagina, tamanhoPagina=tamanho_pagina))
+
+    def discover_page_size(self, params):
+        """
+        Descobre o maior tamanhoPagina aceito, do maior para o menor candidato.
+        Retorna (tamanho, payload da página 1) para não repetir a primeira chamada.
+        """
+        if self.tamanho_pagina:
+            return self.tamanho_pagina, self.fetch_page(params, 1, self.tamanho_pagina)
+        last_error = None
+        for size in PAGE_SIZE_CANDIDATES:
+            try:
+                payload = self.fetch_page(params, 1, size)
+            except PNCPError as e:
+                if e.status != 400:
+                    raise
+                last_error = e
+                continue
+            self.tamanho_pagina = size
+            return size, payload
+        raise last_error
+
+    # ============ HARVEST ============
+    async def _fetch_async(self, params, pagina, tamanho_pagina):
+        payload = await asyncio.to_thread(self.fetch_page, params, pagina, tamanho_pagina)
+        return pagina, payload
+
+    async def pages(self, params, first=None, start_page=1):
+        """
+        Gera (número da página, payload) na ordem em que as respostas chegam.
+        first: página start_page já buscada (com self.tamanho_pagina), evita repetir a chamada.
+        start_page: retoma a partir desta página (exige tamanho_pagina igual ao da coleta original).
+
+        Só `concurrency` páginas ficam em voo (ou prontas, esperando o
+        consumidor) de cada vez: a memória não cresce com totalPaginas.
+        """
+        if self.tamanho_pagina:
+            size = self.tamanho_pagina
+            if first is None:
+                first = await asyncio.to_thread(self.fetch_page, params, start_page, size)
+        else:
+            size, first = await asyncio.to_thread(self.discover_page_size, params)
+            if start_page > 1:
+                first = await asyncio.to_thread(self.fetch_page, params, start_page, size)
+        self.stats["pages"] += 1
+        yield start_page, first
+
+        total_paginas = first.get("totalPaginas") or 0
+        remaining = iter(range(start_page + 1, total_paginas + 1))
+        in_flight = set()
+        try:
+            while True:
+                # Repõe a janela à medida que as páginas são consumidas
+                for pagina in remaining:
+                    in_flight.add(asyncio.ensure_future(self._fetch_async(params, pagina, size)))
+                    if len(in_flight) >= self.concurrency:
+                        break
+                if not in_flight:
+                    return
+                done, in_flight = await asyncio.wait(in_flight, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    pagina, payload = task.result()
+                    self.stats["pages"] += 1
+                    yield pagina, payload
+        finally:
+            for task in in_flight:
+                task.cancel()
+
+    async def harvest(self, params, first=None):
+        """Gera os registros de todas as páginas da consulta."""
+        async for _, payload in self.pages(params, first):
+            records = payload.get("data") or []
+            self.stats["records"] += len(records)
+            for record in records:
+                yield record
+
+    def harvest_all(self, params):
+        """Versão síncrona: retorna a lista completa de registros."""
+        async def collect():
+            return [record async for record in self.harvest(params)]
+        return asyncio.run(collect())
+
+
+def listing_params(data_inicial, data_final, modalidade, **extra):
+    """Parâmetros da consulta de contratações por data de publicação."""
+    params = {
+        "dataInicial": data_inicial,
+        "dataFinal": data_final,
+        "codigoModalidadeContratacao": modalidade,
+    }
+    params.update({k: v for k, v in extra.items() if v is not None})
+    return params
+
+
+async def _run_cli(args):
+    client = PNCPClient(rate=args.rate, pool_size=args.concurrency, timeout=args.timeout)
+    harvester = PNCPHarvester(args.base_url, args.concurrency, args.tamanho_pagina, args.timeout, client)
+    params = listing_params(args.data_inicial, args.data_final, args.modalidade, uf=args.uf)
+    start = time.perf_counter()
+    with sink_from_args(args) as sink:
+        async for record in harvester.harvest(params):
+            sink.write(record)
+    elapsed = time.perf_counter() - start
+    stats = harvester.stats
+    print(f"✅ {stats['records']} registros em {stats['pages']} páginas "
+          f"(tamanhoPagina={harvester.tamanho_pagina}) em {elapsed:.1f}s | "
+          f"{client.metrics.retries} retries", file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Harvester concorrente de contratações do PNCP")
+    parser.add_argument("--data-inicial", required=True, help="AAAAMMDD")
+    parser.add_argument("--data-final", required=True, help="AAAAMMDD")
+    parser.add_argument("--modalidade", type=int, required=True, help="codigoModalidadeContratacao (ex.: 8 = Dispensa)")
+    parser.add_argument("--uf", default=None, help="Filtra por UF (opcional)")
+    parser.add_argument("--concurrency", "-c", type=int, default=DEFAULT_CONCURRENCY, help="Páginas em paralelo (padrão: 8)")
+    parser.add_argument("--tamanho-pagina", type=int, default=None, help="Fixa o tamanhoPagina (padrão: descobre o máximo)")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT)
+    parser.add_argument("--rate", type=float, default=DEFAULT_RATE, help="Requisições/segundo (0 = sem limite; padrão: 5)")
+    parser.add_argument("--base-url", default=BASE_URL, help="Raiz da API de consulta (útil para servidor local)")
+    parser.add_argument("--output", "-o", default=None, help="Arquivo NDJSON de saída (padrão: stdout)")
+    add_sink_arguments(parser)
+    args = parser.parse_args()
+    asyncio.run(_run_cli(args))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Coleta em massa dos itens das compras do PNCP
+(/api/pncp/v1/orgaos/{cnpj}/compras/{ano}/{seq}/itens).
+
+Recebe um fluxo de numeroControlePNCP (arquivo, stdin ou NDJSON de
+contratações), busca os itens de N compras em paralelo (paginando cada
+uma) e grava linhas normalizadas por numeroControlePNCP, no formato que
+alimenta a tabela task_items (original_id, description, max_price, quantity).
+
+Uso:
+    python pncp_items.py --input numeros.txt -o itens.ndjson -c 16
+    python pncp_harvester.py ... | python pncp_items.py --input - --sink itens/ --format parquet
+"""
+import argparse
+import asyncio
+import json
+import sys
+import time
+
+from pncp_client import PNCPClient, PNCPError, PNCP_URL, DEFAULT_RATE, compra_key, compra_url
+from pncp_sink import add_sink_arguments, sink_from_args
+
+DEFAULT_CONCURRENCY = 8
+ITEM_PAGE_SIZE = 100
+
+
+def _number(value, default=0):
+    try:
+        return float(value) if value is not None else default
+    except (TypeError, ValueError):
+        return default
+
+
+def normalize_item(numero_controle, item):
+    """Linha de item com os mesmos fallbacks do importador (licitacoes_importer.js)."""
+    numero_item = item.get("numeroItem") or item.get("numero")
+    quantidade = _number(item.get("quantidade"))
+    valor_unitario = _number(item.get("valorUnitarioEstimado") or item.get("valorUnitario"))
+    valor_total = item.get("valorTotal")
+    catalogo = item.get("catalogoSelecionado") or {}
+    return {
+        "numero_controle_pncp": numero_controle,
+        "original_id": str(numero_item) if numero_item is not None else None,
+        "description": item.get("descricao"),
+        "max_price": valor_unitario,
+        "quantity": quantidade,
+        "unit": item.get("unidadeMedida") or "UN",
+        "total_price": _number(valor_total) if valor_total is not None else quantidade * valor_unitario,
+        "material_ou_servico": item.get("materialOuServico"),
+        "codigo_catmat": catalogo.get("codigo") or item.get("itemCatalogo") or item.get("codigoCatmat"),
+        "situacao": item.get("situacaoCompraItemNome"),
+    }
+
+
+def read_numeros(stream):
+    """numeroControlePNCP únicos, um por linha, ou de registros de contratação em NDJSON."""
+    seen = set()
+    for numero in _read_numeros(stream):
+        if numero not in seen:
+            seen.add(numero)
+            yield numero
+
+
+def _read_numeros(stream):
+    for line in stream:
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith("{"):
+            record = json.loads(line)
+            numero = record.get("numeroControlePNCP")
+            if numero:
+                yield numero
+        else:
+            yield line
+
+
+class ItemsFetcher:
+    """Busca e normaliza os itens de muitas compras com concorrência limitada."""
+
+    def __init__(self, client=None, base_url=PNCP_URL, concurrency=DEFAULT_CONCURRENCY,
+                 page_size=ITEM_PAGE_SIZE):
+        self.client = client or PNCPClient(pool_size=concurrency)
+        self.base_url = base_url.rstrip("/")
+        self.concurrency = max(1, concurrency)
+        self.page_size = page_size
+        self.stats = {"compras": 0, "items": 0, "pages": 0, "empty": 0, "failed": 0}
+
+    def fetch_compra(self, numero_controle):
+        """Todos os itens de uma compra (síncrono), página a página."""
+        cnpj, ano, sequencial = compra_key(numero_controle)
+        url = f"{compra_url(cnpj, ano, sequencial, self.base_url)}/itens"
+        items, seen = [], set()
+        pagina = 1
+        while True:
+            try:
+                page = self.client.get_json(url, {"pagina": pagina, "tamanhoPagina": self.page_size}, empty=[])
+            except PNCPError as e:
+                if e.status == 404:  # Compra sem itens publicados (comum)
+                    break
+                raise
+            self.stats["pages"] += 1
+            page = page if isinstance(page, list) else []
+            # Servidor que ignora a paginação devolve a mesma página de novo
+            fresh = [i for i in page if (i.get("numeroItem") or i.get("numero")) not in seen]
+            seen.update(i.get("numeroItem") or i.get("numero") for i in fresh)
+            items.extend(fresh)
+            if len(page) < self.page_size or not fresh:
+                break
+            pagina += 1
+        if not items:
+            self.stats["empty"] += 1
+        return [normalize_item(numero_controle, item) for item in items]
+
+    async def stream(self, numeros, on_error=None):
+        """
+        Gera as linhas normalizadas à medida que cada compra termina. A entrada é
+        consumida sob demanda (fila limitada), então pode ser um fluxo infinito.
+        """
+        pending = asyncio.Queue(maxsize=self.concurrency * 2)
+        results = asyncio.Queue(maxsize=self.concurrency * 2)
+        done_marker = object()
+
+        async def produce():
+            # A entrada (stdin, pipe) bloqueia: cada leitura roda numa thread para
+            # não parar o event loop nem os workers
+            source = iter(numeros)
+            cancelled = False
+            try:
+                while True:
+                    numero = await asyncio.to_thread(next, source, done_marker)
+                    if numero is done_marker:
+                        break
+                    await pending.put(numero)
+            except asyncio.CancelledError:
+                cancelled = True
+                raise
+            finally:
+                # Também se a entrada falhar (ex.: linha JSON inválida): os workers
+                # terminam o que já está na fila e stream() relança o erro
+                if not cancelled:
+                    for _ in range(self.concurrency):
+                        await pending.put(None)
+
+        async def work():
+            while True:
+                numero = await pending.get()
+                if numero is None:
+                    await results.put(done_marker)
+                    return
+                try:
+                    rows = await asyncio.to_thread(self.fetch_compra, numero)
+                except Exception as e:
+                    self.stats["failed"] += 1
+                    if on_error:
+                        on_error(numero, e)
+                    continue
+                self.stats["compras"] += 1
+                self.stats["items"] += len(rows)
+                await results.put(rows)
+
+        tasks = [asyncio.ensure_future(produce())] + [asyncio.ensure_future(work()) for _ in range(self.concurrency)]
+        finished = 0
+        try:
+            while finished < self.concurrency:
+                rows = await results.get()
+                if rows is done_marker:
+                    finished += 1
+                    continue
+                for row in rows:
+                    yield row
+            await tasks[0]  # relança a exceção da leitura da entrada, se houver
+        finally:
+            for task in tasks:
+                task.cancel()
+
+
+async def _run_cli(args):
+    client = PNCPClient(rate=args.rate, pool_size=args.concurrency)
+    fetcher = ItemsFetcher(client, args.base_url, args.concurrency, args.page_size)
+    source = sys.stdin if args.input == "-" else open(args.input, "r", encoding="utf-8")
+
+    def report(numero, error):
+        print(f"❌ {numero}: {error}", file=sys.stderr)
+
+    start = time.perf_counter()
+    try:
+        with sink_from_args(args) as sink:
+            async for row in fetcher.stream(read_numeros(source), on_error=report):
+                sink.write(row)
+    finally:
+        if source is not sys.stdin:
+            source.close()
+    stats = fetcher.stats
+    print(f"✅ {stats['items']} itens de {stats['compras']} compras ({stats['empty']} sem itens, "
+          f"{stats['failed']} falhas) em {time.perf_counter() - start:.1f}s", file=sys.stderr)
+    return 1 if stats["failed"] else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Coleta em massa de itens de compras do PNCP")
+    parser.add_argument("--input", "-i", required=True, help="numeroControlePNCP por linha ou NDJSON de contratações ('-' = stdin)")
+    parser.add_argument("--concurrency", "-c", type=int, default=DEFAULT_CONCURRENCY, help="Compras em paralelo (padrão: 8)")
+    parser.add_argument("--page-size", type=int, default=ITEM_PAGE_SIZE, help="tamanhoPagina dos itens (padrão: 100)")
+    parser.add_argument("--rate", type=float, default=DEFAULT_RATE, help="Requisições/segundo (0 = sem limite; padrão: 5)")
+    parser.add_argument("--base-url", default=PNCP_URL, help="Raiz da API PNCP (útil para servidor local)")
+    parser.add_argument("--output", "-o", default=None, help="Arquivo NDJSON de saída (padrão: stdout)")
+    add_sink_arguments(parser)
+    parser.set_defaults(prefix="itens")
+    args = parser.parse_args()
+    return asyncio.run(_run_cli(args))
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,395 @@
+#!/usr/bin/env python3
+"""
+Servidor local que imita a API do PNCP para testes de desempenho offline.
+
+Reaproveita as respostas gravadas (pncp_SUCCESS.json, arquivos_list.json)
+como modelos e sintetiza quantas páginas/registros forem pedidos, com o
+mesmo formato da API real:
+
+    /api/consulta/v1/contratacoes/publicacao    listagem paginada (máx. 50; 400 acima, 204 vazio)
+    /api/consulta/v1/contratacoes/atualizacao
+    /api/pncp/v1/modalidades
+    /api/pncp/v1/orgaos/{cnpj}/compras/{ano}/{seq}/itens        (pagina/tamanhoPagina)
+    /api/pncp/v1/orgaos/{cnpj}/compras/{ano}/{seq}/arquivos
+    /api/pncp/v1/orgaos/{cnpj}/compras/{ano}/{seq}/arquivos/{n} binário com suporte a Range
+    /__stats                                                    contadores do servidor
+
+Os dados são determinísticos (mesma consulta, mesma resposta) e as
+respostas JSON têm ETag. Latência, 429 e 5xx podem ser injetados em taxas
+configuráveis.
+
+Uso:
+    python pncp_mock_server.py --port 8765 --records-per-day 2000 --latency-ms 80 --throttle-rate 0.02
+    python pncp_harvester.py ... --base-url http://127.0.0.1:8765/api/consulta/v1
+
+Como módulo:
+    with MockPNCPServer(MockConfig(records_per_day=500)) as server:
+        PNCPHarvester(base_url=server.consulta_url) ...
+"""
+import argparse
+import copy
+import hashlib
+import json
+import math
+import os
+import random
+import re
+import sys
+import threading
+import time
+import zlib
+from dataclasses import dataclass, asdict
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+LISTING_FIXTURE = os.path.join(ROOT, "pncp_SUCCESS.json")
+ARQUIVOS_FIXTURE = os.path.join(ROOT, "arquivos_list.json")
+MAX_PAGE_SIZE = 50
+MIN_PAGE_SIZE = 10
+
+MODALIDADES = [
+    {"id": 1, "nome": "Leilão - Eletrônico"},
+    {"id": 2, "nome": "Diálogo Competitivo"},
+    {"id": 3, "nome": "Concurso"},
+    {"id": 4, "nome": "Concorrência - Eletrônica"},
+    {"id": 5, "nome": "Concorrência - Presencial"},
+    {"id": 6, "nome": "Pregão - Eletrônico"},
+    {"id": 7, "nome": "Pregão - Presencial"},
+    {"id": 8, "nome": "Dispensa"},
+    {"id": 9, "nome": "Inexigibilidade"},
+    {"id": 10, "nome": "Manifestação de Interesse"},
+    {"id": 11, "nome": "Pré-qualificação"},
+    {"id": 12, "nome": "Credenciamento"},
+    {"id": 13, "nome": "Leilão - Presencial"},
+]
+
+UNIDADES = ["UN", "CX", "KG", "L", "M", "PCT", "SV"]
+
+
+@dataclass
+class MockConfig:
+    records_per_day: int = 200      # por modalidade
+    max_items: int = 40             # itens por compra: 1..max_items
+    file_kb: int = 256              # tamanho base dos arquivos
+    latency_ms: float = 0.0         # latência média por requisição
+    jitter_ms: float = 0.0          # +- uniforme sobre a latência
+    throttle_rate: float = 0.0      # fração de respostas 429 (com Retry-After)
+    error_rate: float = 0.0         # fração de respostas 5xx
+    retry_after: float = 1.0
+    seed: int = 42
+
+
+def _load_json(path, default):
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return default
+
+
+def _stable(*parts):
+    """Inteiro determinístico a partir das partes (independe de PYTHONHASHSEED)."""
+    return zlib.crc32("|".join(str(p) for p in parts).encode())
+
+
+class MockData:
+    """Gera registros, itens e arquivos a partir dos modelos gravados."""
+
+    def __init__(self, config):
+        self.config = config
+        listing = _load_json(LISTING_FIXTURE, {})
+        self.templates = listing.get("data") or [{"orgaoEntidade": {"cnpj": "00000000000191"}, "objetoCompra": "Compra"}]
+        self.arquivo_templates = _load_json(ARQUIVOS_FIXTURE, []) or [{"titulo": "Edital.pdf", "tipoDocumentoId": 2, "tipoDocumentoNome": "Edital"}]
+        self._blobs = {}
+        self._lock = threading.Lock()
+
+    # ============ LISTAGEM ============
+    def listing(self, data_inicial, data_final, modalidade, pagina, tamanho):
+        start = datetime.strptime(data_inicial, "%Y%m%d")
+        end = datetime.strptime(data_final, "%Y%m%d")
+        days = max(0, (end - start).days + 1)
+        per_day = self.config.records_per_day
+        total = days * per_day
+        first = (pagina - 1) * tamanho
+        data = [self.record(start + timedelta(days=g // per_day), modalidade, g % per_day)
+                for g in range(first, min(first + tamanho, total))]
+        total_paginas = math.ceil(total / tamanho) if total else 0
+        return {
+            "data": data,
+            "totalRegistros": total,
+            "totalPaginas": total_paginas,
+            "numeroPagina": pagina,
+            "paginasRestantes": max(0, total_paginas - pagina),
+            "empty": not data,
+        }
+
+    def record(self, day, modalidade, index):
+        """Registro index do dia/modalidade, copiado de um modelo gravado."""
+        template = self.templates[(index + modalidade) % len(self.templates)]
+        record = copy.deepcopy(template)
+        cnpj = (template.get("orgaoEntidade") or {}).get("cnpj") or "00000000000191"
+        sequencial = (day.timetuple().tm_yday * 100 + modalidade) * self.config.records_per_day + index + 1
+        published = day + timedelta(seconds=index * 86400 // self.config.records_per_day)
+        stamp = published.isoformat(timespec="seconds")
+        rng = random.Random(_stable(self.config.seed, stamp, modalidade, index))
+        record.update({
+            "anoCompra": day.year,
+            "sequencialCompra": sequencial,
+            "numeroCompra": f"{sequencial:03d}",
+            "numeroControlePNCP": f"{cnpj}-1-{sequencial:06d}/{day.year}",
+            "dataPublicacaoPncp": stamp,
+            "dataInclusao": stamp,
+            "dataAtualizacao": stamp,
+            "dataAtualizacaoGlobal": stamp,
+            "modalidadeId": modalidade,
+            "modalidadeNome": MODALIDADES[(modalidade - 1) % len(MODALIDADES)]["nome"],
+            "valorTotalEstimado": round(rng.uniform(500, 500000), 2),
+        })
+        return record
+
+    # ============ COMPRA ============
+    def items(self, cnpj, ano, sequencial, pagina, tamanho):
+        count = 1 + _stable(self.config.seed, cnpj, ano, sequencial) % self.config.max_items
+        first = (pagina - 1) * tamanho
+        out = []
+        for numero in range(first + 1, min(first + tamanho, count) + 1):
+            rng = random.Random(_stable(cnpj, ano, sequencial, numero))
+            quantidade = rng.randint(1, 500)
+            unitario = round(rng.uniform(1, 5000), 2)
+            out.append({
+                "numeroItem": numero,
+                "descricao": f"Item {numero} da compra {sequencial}/{ano}",
+                "materialOuServico": rng.choice(["M", "S"]),
+                "quantidade": quantidade,
+                "unidadeMedida": rng.choice(UNIDADES),
+                "valorUnitarioEstimado": unitario,
+                "valorTotal": round(quantidade * unitario, 2),
+                "situacaoCompraItemNome": "Em andamento",
+                "orcamentoSigiloso": False,
+            })
+        return out
+
+    def arquivos(self, cnpj, ano, sequencial):
+        count = 1 + _stable("arquivos", cnpj, ano, sequencial) % len(self.arquivo_templates)
+        out = []
+        for n in range(1, count + 1):
+            arquivo = dict(self.arquivo_templates[(n - 1) % len(self.arquivo_templates)])
+            url = f"/api/pncp/v1/orgaos/{cnpj}/compras/{ano}/{sequencial}/arquivos/{n}"
+            arquivo.update({"sequencialDocumento": n, "cnpj": cnpj, "anoCompra": ano,
+                            "sequencialCompra": sequencial, "statusAtivo": True, "url": url, "uri": url})
+            out.append(arquivo)
+        return out
+
+    def blob(self, cnpj, ano, sequencial, n):
+        """
+        Conteúdo do arquivo. O documento 1 (aviso/edital padrão) é igual para
+        todas as compras do órgão: simula o mesmo anexo publicado várias vezes.
+        """
+        key = (cnpj, 1) if n == 1 else (cnpj, ano, sequencial, n)
+        with self._lock:
+            if key not in self._blobs:
+                if len(self._blobs) > 256:
+                    self._blobs.clear()
+                rng = random.Random(_stable(self.config.seed, *key))
+                size = self.config.file_kb * 1024 + rng.randrange(self.config.file_kb * 512 + 1)
+                self._blobs[key] = rng.randbytes(size)
+            return self._blobs[key]
+
+
+class _Stats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.values = {"requests": 0, "throttled": 0, "errors": 0, "not_modified": 0, "bytes": 0}
+
+    def add(self, name, value=1):
+        with self._lock:
+            self.values[name] += value
+
+    def snapshot(self):
+        with self._lock:
+            return dict(self.values)
+
+
+_ITENS_RE = re.compile(r"^/api/pncp/v1/orgaos/(\d+)/compras/(\d+)/(\d+)/itens$")
+_ARQUIVOS_RE = re.compile(r"^/api/pncp/v1/orgaos/(\d+)/compras/(\d+)/(\d+)/arquivos(?:/(\d+))?$")
+_LISTING_RE = re.compile(r"^/api/consulta/v1/contratacoes/(publicacao|atualizacao)$")
+
+
+class _Handler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "MockPNCP/1.0"
+
+    def log_message(self, *args):
+        pass
+
+    # ============ RESPOSTAS ============
+    def _send(self, status, body=b"", content_type="application/json", headers=None):
+        self.send_response(status)
+        if body or status not in (204, 304):
+            self.send_header("Content-Type", content_type)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        if body:
+            self.wfile.write(body)
+        self.server.stats.add("bytes", len(body))
+
+    def _json(self, payload):
+        body = json.dumps(payload, ensure_ascii=False).encode("utf-8")
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        if self.headers.get("If-None-Match") == etag:
+            self.server.stats.add("not_modified")
+            return self._send(304, headers={"ETag": etag})
+        self._send(200, body, "application/json; charset=utf-8", {"ETag": etag})
+
+    def _error(self, status, message, headers=None):
+        body = json.dumps({"status": status, "message": message}, ensure_ascii=False).encode("utf-8")
+        self._send(status, body, headers=headers)
+
+    def _inject(self):
+        """Latência e falhas configuradas; True se a resposta já foi enviada."""
+        config, rng = self.server.config, self.server.rng
+        if config.latency_ms or config.jitter_ms:
+            delay = config.latency_ms + rng.uniform(-config.jitter_ms, config.jitter_ms)
+            time.sleep(max(0.0, delay) / 1000)
+        roll = rng.random()
+        if roll < config.throttle_rate:
+            self.server.stats.add("throttled")
+            self._error(429, "Too Many Requests", {"Retry-After": f"{config.retry_after:g}"})
+            return True
+        if roll < config.throttle_rate + config.error_rate:
+            self.server.stats.add("errors")
+            self._error(rng.choice([500, 502, 503]), "Erro interno simulado")
+            return True
+        return False
+
+    # ============ ROTAS ============
+    def do_GET(self):
+        url = urlparse(self.path)
+        query = {k: v[0] for k, v in parse_qs(url.query).items()}
+        if url.path == "/__stats":
+            return self._json(self.server.stats.snapshot())
+        self.server.stats.add("requests")
+        if self._inject():
+            return
+        try:
+            if url.path == "/api/pncp/v1/modalidades":
+                return self._json(MODALIDADES)
+            match = _LISTING_RE.match(url.path)
+            if match:
+                return self._listing(query)
+            match = _ITENS_RE.match(url.path)
+            if match:
+                cnpj, ano, seq = match.group(1), int(match.group(2)), int(match.group(3))
+                pagina, tamanho = int(query.get("pagina", 1)), int(query.get("tamanhoPagina", 10))
+                return self._json(self.server.data.items(cnpj, ano, seq, pagina, tamanho))
+            match = _ARQUIVOS_RE.match(url.path)
+            if match:
+                cnpj, ano, seq = match.group(1), int(match.group(2)), int(match.group(3))
+                if match.group(4) is None:
+                    return self._json(self.server.data.arquivos(cnpj, ano, seq))
+                return self._blob(self.server.data.blob(cnpj, ano, seq, int(match.group(4))))
+        except (KeyError, ValueError) as e:
+            return self._error(400, f"Parâmetro inválido: {e}")
+        self._error(404, "Não encontrado")
+
+    def _listing(self, query):
+        for required in ("dataInicial", "dataFinal", "codigoModalidadeContratacao"):
+            if required not in query:
+                return self._error(400, f"Parâmetro obrigatório: {required}")
+        tamanho = int(query.get("tamanhoPagina", MIN_PAGE_SIZE))
+        if not MIN_PAGE_SIZE <= tamanho <= MAX_PAGE_SIZE:
+            return self._error(400, f"Tamanho de página deve estar entre {MIN_PAGE_SIZE} e {MAX_PAGE_SIZE}")
+        payload = self.server.data.listing(query["dataInicial"], query["dataFinal"],
+                                           int(query["codigoModalidadeContratacao"]),
+                                           int(query.get("pagina", 1)), tamanho)
+        if not payload["totalRegistros"]:
+            return self._send(204)
+        self._json(payload)
+
+    def _blob(self, body):
+        content_range = self.headers.get("Range")
+        if not content_range:
+            return self._send(200, body, "application/pdf")
+        start = int(re.match(r"bytes=(\d+)-", content_range).group(1))
+        if start >= len(body):
+            return self._send(416, headers={"Content-Range": f"bytes */{len(body)}"})
+        self._send(206, body[start:], "application/pdf",
+                   {"Content-Range": f"bytes {start}-{len(body) - 1}/{len(body)}"})
+
+
+class MockPNCPServer:
+    """ThreadingHTTPServer em background; use como context manager."""
+
+    def __init__(self, config=None, host="127.0.0.1", port=0):
+        self.config = config or MockConfig()
+        self.httpd = ThreadingHTTPServer((host, port), _Handler)
+        self.httpd.daemon_threads = True
+        self.httpd.config = self.config
+        self.httpd.data = MockData(self.config)
+        self.httpd.stats = _Stats()
+        self.httpd.rng = random.Random(self.config.seed)
+        self._thread = None
+
+    @property
+    def url(self):
+        host, port = self.httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def consulta_url(self):
+        return f"{self.url}/api/consulta/v1"
+
+    @property
+    def pncp_url(self):
+        return f"{self.url}/api/pncp/v1"
+
+    @property
+    def stats(self):
+        return self.httpd.stats.snapshot()
+
+    def start(self):
+        self._thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Servidor local que imita a API do PNCP")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    defaults = MockConfig()
+    for name, value in asdict(defaults).items():
+        parser.add_argument(f"--{name.replace('_', '-')}", type=type(value), default=value)
+    args = parser.parse_args()
+
+    config = MockConfig(**{name: getattr(args, name) for name in asdict(defaults)})
+    server = MockPNCPServer(config, args.host, args.port)
+    print(f"🧪 Mock PNCP em {server.url}")
+    print(f"   consulta: {server.consulta_url}")
+    print(f"   pncp:     {server.pncp_url}")
+    print(f"   {json.dumps(asdict(config))}")
+    try:
+        server.httpd.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.httpd.server_close()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
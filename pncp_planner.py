@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+Planejador de janelas para consultas grandes no PNCP.
+
+Uma única consulta dataInicial/dataFinal pode ter centenas de páginas
+(test_date_behavior.py). O planejador sonda totalRegistros de cada janela
+e divide recursivamente o período (por modalidade) até que cada shard
+caiba em max_registros; os shards são buscados em paralelo e os registros
+saem em fluxo, mesclados por dataPublicacaoPncp. Na memória ficam só os
+shards já buscados à frente (shard_workers por modalidade), não o backfill.
+
+Uso:
+    python pncp_planner.py --data-inicial 20250101 --data-final 20250331 --modalidades 6 8 --plan
+    python pncp_planner.py --data-inicial 20250101 --data-final 20250331 --modalidades 6 8 -o backfill.ndjson
+"""
+import argparse
+import asyncio
+import heapq
+import json
+import sys
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+
+from pncp_client import PNCPClient, DEFAULT_RATE
+from pncp_harvester import PNCPHarvester, BASE_URL, DEFAULT_CONCURRENCY, listing_params
+from pncp_sink import add_sink_arguments, sink_from_args
+
+DATE_FORMAT = "%Y%m%d"
+DEFAULT_MAX_REGISTROS = 1000   # 20 páginas de 50
+DEFAULT_SHARD_WORKERS = 4
+
+
+@dataclass
+class Shard:
+    """Janela (dataInicial..dataFinal, modalidade) pequena o bastante para um worker."""
+    data_inicial: str
+    data_final: str
+    modalidade: int
+    total_registros: int = 0
+    first_page: dict = field(default=None, repr=False, compare=False)
+
+    @property
+    def params(self):
+        return listing_params(self.data_inicial, self.data_final, self.modalidade)
+
+    def to_dict(self):
+        return {
+            "dataInicial": self.data_inicial,
+            "dataFinal": self.data_final,
+            "codigoModalidadeContratacao": self.modalidade,
+            "totalRegistros": self.total_registros,
+        }
+
+
+def _parse(day):
+    return datetime.strptime(str(day), DATE_FORMAT).date()
+
+
+def _format(day):
+    return day.strftime(DATE_FORMAT)
+
+
+def _publication_key(record):
+    return record.get("dataPublicacaoPncp") or ""
+
+
+class PNCPPlanner:
+    """Divide e busca um backfill de vários dias/modalidades em shards paralelos."""
+
+    def __init__(self, harvester=None, max_registros=DEFAULT_MAX_REGISTROS,
+                 shard_workers=DEFAULT_SHARD_WORKERS):
+        self.harvester = harvester or PNCPHarvester()
+        self.max_registros = max(1, max_registros)
+        self.shard_workers = max(1, shard_workers)
+        self.probes = 0
+
+    # ============ PLAN ============
+    async def _probe(self, shard):
+        """Busca a página 1 da janela; o payload é reaproveitado na coleta."""
+        _, payload = await asyncio.to_thread(self.harvester.discover_page_size, shard.params)
+        self.probes += 1
+        shard.total_registros = payload.get("totalRegistros") or 0
+        shard.first_page = payload
+        return shard
+
+    async def _split(self, shard):
+        await self._probe(shard)
+        start, end = _parse(shard.data_inicial), _parse(shard.data_final)
+        # Um único dia não se divide mais: fica como está e é paginado
+        if shard.total_registros <= self.max_registros or start == end:
+            return [shard] if shard.total_registros else []
+
+        middle = start + timedelta(days=(end - start).days // 2)
+        halves = [
+            Shard(shard.data_inicial, _format(middle), shard.modalidade),
+            Shard(_format(middle + timedelta(days=1)), shard.data_final, shard.modalidade),
+        ]
+        shard.first_page = None
+        parts = await asyncio.gather(*(self._split(h) for h in halves))
+        return [s for part in parts for s in part]
+
+    async def plan(self, data_inicial, data_final, modalidades):
+        """Shards não vazios, em ordem de (modalidade, dataInicial)."""
+        roots = [Shard(str(data_inicial), str(data_final), m) for m in modalidades]
+        parts = await asyncio.gather(*(self._split(root) for root in roots))
+        return [s for part in parts for s in part]
+
+    # ============ FETCH ============
+    async def _collect(self, semaphore, shard):
+        async with semaphore:
+            records = [r async for r in self.harvester.harvest(shard.params, shard.first_page)]
+        shard.first_page = None
+        records.sort(key=_publication_key)
+        return records
+
+    async def _modalidade_stream(self, semaphore, shards):
+        """
+        Registros de uma modalidade, shard a shard em ordem de janela. As janelas
+        são disjuntas, então a sequência já sai ordenada por dataPublicacaoPncp;
+        até shard_workers shards são buscados à frente enquanto o atual é consumido.
+        """
+        upcoming = iter(sorted(shards, key=lambda s: _parse(s.data_inicial)))
+        ahead = deque()
+
+        def schedule():
+            shard = next(upcoming, None)
+            if shard is not None:
+                ahead.append(asyncio.create_task(self._collect(semaphore, shard)))
+
+        for _ in range(self.shard_workers):
+            schedule()
+        try:
+            while ahead:
+                records = await ahead.popleft()
+                schedule()
+                for record in records:
+                    yield record
+        finally:
+            for task in ahead:
+                task.cancel()
+
+    async def fetch(self, shards):
+        """Busca os shards em paralelo e gera os registros em ordem de dataPublicacaoPncp."""
+        semaphore = asyncio.Semaphore(self.shard_workers)
+        by_modalidade = {}
+        for shard in shards:
+            by_modalidade.setdefault(shard.modalidade, []).append(shard)
+        streams = [self._modalidade_stream(semaphore, group) for group in by_modalidade.values()]
+
+        # Merge k-way: um registro na frente de cada modalidade
+        heap = []
+
+        async def advance(i):
+            try:
+                record = await streams[i].__anext__()
+            except StopAsyncIteration:
+                return
+            heapq.heappush(heap, (_publication_key(record), i, record))
+
+        try:
+            await asyncio.gather(*(advance(i) for i in range(len(streams))))
+            while heap:
+                _, i, record = heapq.heappop(heap)
+                yield record
+                await advance(i)
+        finally:
+            for stream in streams:
+                await stream.aclose()
+
+    async def backfill(self, data_inicial, data_final, modalidades):
+        shards = await self.plan(data_inicial, data_final, modalidades)
+        async for record in self.fetch(shards):
+            yield record
+
+
+async def _run_cli(args):
+    client = PNCPClient(rate=args.rate, pool_size=args.concurrency * args.shard_workers)
+    harvester = PNCPHarvester(args.base_url, args.concurrency, args.tamanho_pagina, client=client)
+    planner = PNCPPlanner(harvester, args.max_registros, args.shard_workers)
+    start = time.perf_counter()
+    shards = await planner.plan(args.data_inicial, args.data_final, args.modalidades)
+    print(f"🧭 {len(shards)} shards ({sum(s.total_registros for s in shards)} registros, "
+          f"{planner.probes} sondagens) em {time.perf_counter() - start:.1f}s", file=sys.stderr)
+    if args.plan:
+        for shard in shards:
+            print(json.dumps(shard.to_dict()))
+        return
+
+    with sink_from_args(args) as sink:
+        async for record in planner.fetch(shards):
+            sink.write(record)
+    print(f"✅ {sink.records} registros em {time.perf_counter() - start:.1f}s", file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Backfill do PNCP dividido em shards paralelos")
+    parser.add_argument("--data-inicial", required=True, help="AAAAMMDD")
+    parser.add_argument("--data-final", required=True, help="AAAAMMDD")
+    parser.add_argument("--modalidades", type=int, nargs="+", required=True, help="Códigos de modalidade")
+    parser.add_argument("--max-registros", type=int, default=DEFAULT_MAX_REGISTROS, help="Registros máximos por shard (padrão: 1000)")
+    parser.add_argument("--shard-workers", type=int, default=DEFAULT_SHARD_WORKERS, help="Shards buscados em paralelo (padrão: 4)")
+    parser.add_argument("--concurrency", "-c", type=int, default=DEFAULT_CONCURRENCY, help="Páginas em paralelo por shard (padrão: 8)")
+    parser.add_argument("--tamanho-pagina", type=int, default=None)
+    parser.add_argument("--rate", type=float, default=DEFAULT_RATE, help="Requisições/segundo (0 = sem limite; padrão: 5)")
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--plan", action="store_true", help="Só imprime os shards planejados")
+    parser.add_argument("--output", "-o", default=None, help="Arquivo NDJSON de saída (padrão: stdout)")
+    add_sink_arguments(parser)
+    args = parser.parse_args()
+    asyncio.run(_run_cli(args))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
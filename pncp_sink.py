@@ -0,0 +1,404 @@
+#!/usr/bin/env python3
+"""
+Sinks em streaming para registros do PNCP.
+
+Cada registro é gravado assim que chega (NDJSON, opcionalmente gzip/zstd)
+ou acumulado em row groups de Parquet; a memória fica limitada a um row
+group, qualquer que seja o tamanho da coleta. Os arquivos giram por tamanho
+e por dia:
+
+    <dir>/<prefixo>-AAAAMMDD-0001.ndjson.gz
+
+Dependências opcionais: zstandard (ndjson.zst) e pyarrow (parquet).
+
+flush() garante no disco tudo o que já foi escrito (antes de salvar um
+checkpoint, por exemplo); no Parquet isso fecha o arquivo atual, porque um
+arquivo sem rodapé não é legível. checkpoint_pages sugere de quantas em
+quantas páginas da API vale chamar flush() (Parquet: um row group cheio).
+
+Uso:
+    with open_sink("saida/", "ndjson.gz", rotate_mb=256) as sink:
+        for registro in registros:
+            sink.write(registro)
+"""
+import gzip
+import io
+import json
+import os
+import sys
+from datetime import date
+
+FORMATS = ("ndjson", "ndjson.gz", "ndjson.zst", "parquet")
+DEFAULT_ROTATE_MB = 256
+DEFAULT_ROW_GROUP = 10000
+
+
+class RotatingSink:
+    """Base: nomes de arquivo, rotação por tamanho/dia e contadores."""
+
+    extension = ""
+    checkpoint_pages = 1
+
+    def __init__(self, directory, prefix="contratacoes", rotate_mb=DEFAULT_ROTATE_MB):
+        self.directory = directory
+        self.prefix = prefix
+        self.max_bytes = int(rotate_mb * 1024 * 1024) if rotate_mb else 0
+        self.files = []
+        self.records = 0
+        self._day = None
+        self._sequence = 0
+        self._bytes = 0
+        self._needs_file = False  # arquivo atual já fechado por flush()
+        os.makedirs(directory, exist_ok=True)
+
+    def _next_path(self):
+        today = date.today().strftime("%Y%m%d")
+        if today != self._day:
+            self._day, self._sequence = today, 0
+        while True:
+            self._sequence += 1
+            path = os.path.join(self.directory, f"{self.prefix}-{self._day}-{self._sequence:04d}.{self.extension}")
+            if not os.path.exists(path):
+                return path
+
+    def _should_rotate(self):
+        if not self.files or self._needs_file:
+            return True
+        if self.max_bytes and self._bytes >= self.max_bytes:
+            return True
+        return date.today().strftime("%Y%m%d") != self._day
+
+    def _rotate(self):
+        self._close_current()
+        path = self._next_path()
+        self._open(path)
+        self.files.append(path)
+        self._bytes = 0
+        self._needs_file = False
+
+    def write(self, record):
+        if self._should_rotate():
+            self._rotate()
+        self._write(record)
+        self.records += 1
+
+    def write_many(self, records):
+        for record in records:
+            self.write(record)
+
+    def flush(self):
+        """Grava no disco (com fsync) todos os registros já recebidos por write()."""
+        if self.files:
+            self._flush_current()
+
+    def close(self):
+        self._close_current()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    # Subclasses
+    def _open(self, path):
+        raise NotImplementedError
+
+    def _write(self, record):
+        raise NotImplementedError
+
+    def _flush_current(self):
+        raise NotImplementedError
+
+    def _close_current(self):
+        raise NotImplementedError
+
+
+class NDJSONSink(RotatingSink):
+    """Uma linha JSON por registro; max_bytes conta bytes não comprimidos."""
+
+    def __init__(self, directory, prefix="contratacoes", rotate_mb=DEFAULT_ROTATE_MB, compression=None):
+        if compression not in (None, "gzip", "zstd"):
+            raise ValueError(f"Compressão inválida: {compression}")
+        if compression == "zstd":
+            try:
+                import zstandard
+            except ImportError:
+                raise ImportError("ndjson.zst requer o pacote zstandard (pip install zstandard)")
+            self._zstd = zstandard
+        self.compression = compression
+        self.extension = {None: "ndjson", "gzip": "ndjson.gz", "zstd": "ndjson.zst"}[compression]
+        self._file = None
+        self._raw = None
+        super().__init__(directory, prefix, rotate_mb)
+
+    def _open(self, path):
+        # _raw é o arquivo em disco (para o fsync); _file é a camada de texto por cima
+        self._raw = open(path, "wb")
+        if self.compression == "gzip":
+            writer = gzip.GzipFile(fileobj=self._raw, mode="wb")
+        elif self.compression == "zstd":
+            writer = self._zstd.ZstdCompressor().stream_writer(self._raw, closefd=False)
+        else:
+            writer = self._raw
+        self._file = io.TextIOWrapper(writer, encoding="utf-8")
+
+    def _write(self, record):
+        line = json.dumps(record, ensure_ascii=False) + "\n"
+        self._file.write(line)
+        self._bytes += len(line)
+
+    def _flush_current(self):
+        # gzip/zstd fecham o bloco atual (sync flush): o que já foi escrito é descomprimível
+        self._file.flush()
+        self._raw.flush()
+        os.fsync(self._raw.fileno())
+
+    def _close_current(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+        if self._raw is not None:
+            self._raw.close()
+            self._raw = None
+
+
+def _row_size(row):
+    """Tamanho aproximado de uma linha (texto), antes da compressão do Parquet."""
+    return sum(len(key) + len(str(value)) for key, value in row.items() if value is not None)
+
+
+def _flatten(record):
+    """Colunas de topo; objetos/listas aninhados viram texto JSON."""
+    return {
+        key: json.dumps(value, ensure_ascii=False) if isinstance(value, (dict, list)) else value
+        for key, value in record.items()
+    }
+
+
+def _kind(value):
+    """Tipo de um valor já achatado: null, bool, int, float ou string."""
+    if value is None:
+        return "null"
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, int):
+        return "int" if -2 ** 63 <= value < 2 ** 63 else "string"
+    if isinstance(value, float):
+        return "float"
+    return "string"
+
+
+def _widen(old, new):
+    """Menor tipo que comporta os dois: nulo cede, int vira float, o resto vira texto."""
+    if old == new or new == "null":
+        return old
+    if old == "null":
+        return new
+    if {old, new} == {"int", "float"}:
+        return "float"
+    return "string"
+
+
+class ParquetSink(RotatingSink):
+    """
+    Registros em row groups de Parquet. O schema é um só para o sink inteiro:
+    começa do schema explícito (se houver) e só alarga, a cada row group, com
+    o que os registros trazem: colunas novas entram, nulo cede a qualquer
+    tipo, int vira double e tipos misturados viram texto. Nenhum valor é
+    descartado. Como o schema de um arquivo Parquet é fixo, quando ele alarga
+    o arquivo atual é fechado e o row group vai para um arquivo novo; os
+    arquivos seguintes nunca voltam a um tipo mais estreito.
+
+    Para a rotação, o row group ainda em memória conta pelo seu tamanho
+    estimado, na proporção de compressão dos row groups já gravados. flush()
+    grava o row group pendente e fecha o arquivo; o próximo write abre outro.
+    """
+
+    extension = "parquet"
+
+    def __init__(self, directory, prefix="contratacoes", rotate_mb=DEFAULT_ROTATE_MB,
+                 row_group_size=DEFAULT_ROW_GROUP, schema=None):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError("parquet requer o pacote pyarrow (pip install pyarrow)")
+        self._pa = pyarrow
+        self._pq = pyarrow.parquet
+        self.row_group_size = max(1, row_group_size)
+        # Cada flush() fecha um arquivo: checkpoints a cada row group cheio
+        # (páginas da API de consulta têm até 50 registros)
+        self.checkpoint_pages = max(1, self.row_group_size // 50)
+        self._path = None
+        self._writer = None
+        self._kinds = {}         # coluna -> tipo, em ordem de chegada; vale para todos os arquivos
+        for f in schema or []:
+            self._kinds[f.name] = self._kind_of(f.type)
+        self._buffer = []
+        self._buffer_bytes = 0   # tamanho estimado (texto) do row group pendente
+        self._file_bytes = 0     # bytes já gravados no arquivo atual
+        self._ratio = 1.0        # bytes em disco / tamanho estimado, dos row groups gravados
+        super().__init__(directory, prefix, rotate_mb)
+
+    def _kind_of(self, arrow_type):
+        types = self._pa.types
+        if types.is_null(arrow_type):
+            return "null"
+        if types.is_boolean(arrow_type):
+            return "bool"
+        if types.is_integer(arrow_type):
+            return "int"
+        if types.is_floating(arrow_type):
+            return "float"
+        return "string"
+
+    def _open(self, path):
+        self._path = path
+        self._writer = None
+        self._file_bytes = 0
+
+    def _write(self, record):
+        row = _flatten(record)
+        self._buffer.append(row)
+        self._buffer_bytes += _row_size(row)
+        self._bytes = self._file_bytes + int(self._buffer_bytes * self._ratio)
+        if len(self._buffer) >= self.row_group_size:
+            self._flush()
+
+    def _schema(self):
+        pa = self._pa
+        arrow = {"null": pa.null(), "bool": pa.bool_(), "int": pa.int64(),
+                 "float": pa.float64(), "string": pa.string()}
+        return pa.schema([pa.field(name, arrow[kind]) for name, kind in self._kinds.items()])
+
+    def _coerce(self, rows):
+        """Converte cada valor para o tipo (já alargado) da sua coluna."""
+        out = []
+        for row in rows:
+            fixed = {}
+            for name, kind in self._kinds.items():
+                value = row.get(name)
+                if value is not None:
+                    if kind == "string" and not isinstance(value, str):
+                        value = json.dumps(value, ensure_ascii=False)
+                    elif kind == "float":
+                        value = float(value)
+                fixed[name] = value
+            out.append(fixed)
+        return out
+
+    def _flush(self):
+        if not self._buffer:
+            return
+        kinds = dict(self._kinds)
+        for row in self._buffer:
+            for name, value in row.items():
+                kinds[name] = _widen(kinds.get(name, "null"), _kind(value))
+        if kinds != self._kinds:
+            self._kinds = kinds
+            if self._writer is not None:
+                # Schema alargou: o arquivo atual fica como está e o row group vai para outro
+                self._writer.close()
+                self._writer = None
+                self._sync_file()
+                self._open(self._next_path())
+                self.files.append(self._path)
+        schema = self._schema()
+        if self._writer is None:
+            self._writer = self._pq.ParquetWriter(self._path, schema)
+        table = self._pa.Table.from_pylist(self._coerce(self._buffer), schema=schema)
+        self._writer.write_table(table)
+        size = os.path.getsize(self._path)
+        if self._buffer_bytes and size > self._file_bytes:
+            self._ratio = (size - self._file_bytes) / self._buffer_bytes
+        self._bytes = self._file_bytes = size
+        self._buffer = []
+        self._buffer_bytes = 0
+
+    def _sync_file(self):
+        with open(self._path, "rb") as f:
+            os.fsync(f.fileno())
+
+    def _flush_current(self):
+        # Sem rodapé o arquivo é ilegível: fechar é o único jeito de torná-lo durável
+        self._close_current()
+        self._needs_file = True
+
+    def _close_current(self):
+        self._flush()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+            self._sync_file()
+
+
+def open_sink(directory, fmt="ndjson", prefix="contratacoes", rotate_mb=DEFAULT_ROTATE_MB):
+    """Sink pelo nome do formato: ndjson, ndjson.gz, ndjson.zst ou parquet."""
+    if fmt == "parquet":
+        return ParquetSink(directory, prefix, rotate_mb)
+    compression = {"ndjson": None, "ndjson.gz": "gzip", "ndjson.zst": "zstd"}.get(fmt, "")
+    if compression == "":
+        raise ValueError(f"Formato inválido: {fmt} (use {', '.join(FORMATS)})")
+    return NDJSONSink(directory, prefix, rotate_mb, compression)
+
+
+class StdoutSink:
+    """Mesmo contrato dos sinks, escrevendo NDJSON num arquivo já aberto (ex.: stdout)."""
+
+    checkpoint_pages = 1
+
+    def __init__(self, stream):
+        self.stream = stream
+        self.files = []
+        self.records = 0
+
+    def write(self, record):
+        self.stream.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.records += 1
+
+    def write_many(self, records):
+        for record in records:
+            self.write(record)
+
+    def flush(self):
+        self.stream.flush()
+
+    def close(self):
+        self.stream.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class _FileSink(StdoutSink):
+    def __init__(self, path, mode):
+        super().__init__(open(path, mode, encoding="utf-8"))
+        self.files = [path]
+
+    def flush(self):
+        self.stream.flush()
+        os.fsync(self.stream.fileno())
+
+    def close(self):
+        self.stream.close()
+
+
+def add_sink_arguments(parser):
+    """Opções de saída comuns aos CLIs de coleta."""
+    parser.add_argument("--sink", default=None, help="Diretório de saída com rotação (em vez de -o)")
+    parser.add_argument("--format", choices=FORMATS, default="ndjson", help="Formato do --sink (padrão: ndjson)")
+    parser.add_argument("--rotate-mb", type=float, default=DEFAULT_ROTATE_MB, help="Gira arquivos a cada N MB (padrão: 256)")
+    parser.add_argument("--prefix", default="contratacoes", help="Prefixo dos arquivos do --sink")
+
+
+def sink_from_args(args, mode="w"):
+    """--sink DIR -> sink com rotação; senão -o arquivo (ou stdout) em NDJSON."""
+    if args.sink:
+        return open_sink(args.sink, args.format, args.prefix, args.rotate_mb)
+    if args.output:
+        return _FileSink(args.output, mode)
+    return StdoutSink(sys.stdout)
@@ -0,0 +1,252 @@
+#!/usr/bin/env python3
+"""
+Sincronização incremental do PNCP com checkpoints em SQLite.
+
+Para cada (endpoint, modalidade) guarda o high-water mark (maior data vista),
+os numeroControlePNCP já entregues com essa mesma data e a última página
+concluída da janela em andamento. Cada execução busca só a janela [dia do
+high-water .. hoje] e descarta o que já foi entregue (data anterior ao mark,
+ou igual e já visto: as datas têm resolução de segundos); se a execução cair
+no meio, a próxima retoma da página seguinte ao checkpoint.
+
+Entrega é at-least-once: o checkpoint de uma página só avança depois que
+todos os registros dela foram consumidos e o sink foi descarregado no disco
+(sink.flush()). Com Parquet cada flush fecha um arquivo, então por padrão o
+checkpoint sai a cada row group cheio (sink.checkpoint_pages); use
+--checkpoint-pages para outro intervalo.
+
+Uso:
+    python pncp_sync.py --modalidades 6 8 --desde 20250101 -o contratacoes.ndjson   # primeira carga
+    python pncp_sync.py --modalidades 6 8 -o contratacoes.ndjson                    # incremental (cron)
+    python pncp_sync.py --status
+"""
+import argparse
+import asyncio
+import json
+import os
+import sqlite3
+import sys
+import time
+from datetime import date, datetime
+
+from pncp_client import PNCPClient, DEFAULT_RATE
+from pncp_harvester import PNCPHarvester, BASE_URL, DEFAULT_CONCURRENCY, listing_params
+from pncp_sink import add_sink_arguments, sink_from_args
+
+SYNC_DB = os.environ.get("PNCP_SYNC_DB", "pncp_sync.db")
+DATE_FORMAT = "%Y%m%d"
+
+# endpoint -> (caminho na API de consulta, campo usado como high-water mark)
+ENDPOINTS = {
+    "publicacao": ("/contratacoes/publicacao", "dataPublicacaoPncp"),
+    "atualizacao": ("/contratacoes/atualizacao", "dataAtualizacao"),
+}
+
+
+class CheckpointStore:
+    """Checkpoints por (endpoint, modalidade) em SQLite."""
+
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS checkpoints (
+            endpoint TEXT NOT NULL,
+            modalidade INTEGER NOT NULL,
+            since TEXT,
+            since_ids TEXT,
+            high_water TEXT,
+            high_water_ids TEXT,
+            window_start TEXT,
+            window_end TEXT,
+            tamanho_pagina INTEGER,
+            last_page INTEGER NOT NULL DEFAULT 0,
+            status TEXT NOT NULL DEFAULT 'done',
+            records INTEGER NOT NULL DEFAULT 0,
+            updated_at TEXT,
+            PRIMARY KEY (endpoint, modalidade)
+        )
+    """
+
+    def __init__(self, path=SYNC_DB):
+        self.path = path
+        self.conn = sqlite3.connect(path)
+        self.conn.row_factory = sqlite3.Row
+        self.conn.execute(self.SCHEMA)
+        self.conn.commit()
+
+    def get(self, endpoint, modalidade):
+        row = self.conn.execute(
+            "SELECT * FROM checkpoints WHERE endpoint = ? AND modalidade = ?", (endpoint, modalidade)
+        ).fetchone()
+        return dict(row) if row else None
+
+    def all(self):
+        return [dict(r) for r in self.conn.execute("SELECT * FROM checkpoints ORDER BY endpoint, modalidade")]
+
+    def save(self, endpoint, modalidade, **fields):
+        fields["updated_at"] = datetime.now().isoformat(timespec="seconds")
+        current = self.get(endpoint, modalidade) or {"endpoint": endpoint, "modalidade": modalidade}
+        current.update(fields)
+        columns = ", ".join(current)
+        placeholders = ", ".join("?" for _ in current)
+        self.conn.execute(f"INSERT OR REPLACE INTO checkpoints ({columns}) VALUES ({placeholders})",
+                          tuple(current.values()))
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+
+def _day(timestamp):
+    """'2025-01-08T14:03:00' -> '20250108'."""
+    return timestamp[:10].replace("-", "")
+
+
+def _load_ids(text):
+    return set(json.loads(text)) if text else set()
+
+
+def _dump_ids(ids):
+    return json.dumps(sorted(ids)) if ids else None
+
+
+class PNCPSync:
+    """Sincroniza (endpoint, modalidade) a partir do último checkpoint."""
+
+    def __init__(self, store, harvester_factory, endpoint="publicacao", sink=None, checkpoint_pages=None):
+        if endpoint not in ENDPOINTS:
+            raise ValueError(f"Endpoint desconhecido: {endpoint} (use {', '.join(ENDPOINTS)})")
+        self.store = store
+        self.harvester_factory = harvester_factory
+        self.endpoint = endpoint
+        self.path, self.field = ENDPOINTS[endpoint]
+        # Onde o consumidor grava os registros: flush() antes de cada checkpoint
+        self.sink = sink
+        if checkpoint_pages is None:
+            checkpoint_pages = getattr(sink, "checkpoint_pages", 1)
+        self.checkpoint_pages = max(1, checkpoint_pages)
+
+    def _flush(self):
+        if self.sink is not None:
+            self.sink.flush()
+
+    def _window(self, modalidade, desde, ate):
+        """(janela, página inicial, tamanho_pagina, since, IDs já entregues em since) para esta execução."""
+        checkpoint = self.store.get(self.endpoint, modalidade)
+        if checkpoint and checkpoint["status"] == "running":
+            window = (checkpoint["window_start"], checkpoint["window_end"])
+            return (window, checkpoint["last_page"] + 1, checkpoint["tamanho_pagina"],
+                    checkpoint["since"], _load_ids(checkpoint["since_ids"]))
+        since = checkpoint["high_water"] if checkpoint else None
+        since_ids = _load_ids(checkpoint["high_water_ids"]) if checkpoint else set()
+        start = _day(since) if since else desde
+        return (start, ate), 1, None, since, since_ids
+
+    async def sync(self, modalidade, desde, ate):
+        """Gera os registros novos/alterados desde o high-water mark da modalidade."""
+        (start, end), start_page, tamanho_pagina, since, since_ids = self._window(modalidade, desde, ate)
+        harvester = self.harvester_factory(path=self.path, tamanho_pagina=tamanho_pagina)
+        checkpoint = self.store.get(self.endpoint, modalidade) or {}
+        high_water = checkpoint.get("high_water") or since
+        # IDs entregues com stamp == high_water (retomada: os do checkpoint)
+        if start_page > 1:
+            high_water_ids = _load_ids(checkpoint.get("high_water_ids"))
+        else:
+            high_water_ids = set(since_ids)
+        records = (checkpoint.get("records") or 0) if start_page > 1 else 0
+
+        done, last_page = set(), start_page - 1
+        saved_page = last_page
+        params = listing_params(start, end, modalidade)
+        async for pagina, payload in harvester.pages(params, start_page=start_page):
+            for record in payload.get("data") or []:
+                stamp = record.get(self.field) or ""
+                numero = record.get("numeroControlePNCP")
+                if since and (stamp < since or (stamp == since and numero in since_ids)):
+                    continue
+                if stamp > (high_water or ""):
+                    high_water, high_water_ids = stamp, set()
+                if stamp == high_water and numero:
+                    high_water_ids.add(numero)
+                records += 1
+                yield record
+
+            # Checkpoint avança só sobre páginas contíguas já consumidas
+            done.add(pagina)
+            while last_page + 1 in done:
+                last_page += 1
+                done.discard(last_page)
+            if last_page - saved_page < self.checkpoint_pages:
+                continue
+            saved_page = last_page
+            self._flush()
+            self.store.save(self.endpoint, modalidade, since=since, since_ids=_dump_ids(since_ids),
+                            high_water=high_water, high_water_ids=_dump_ids(high_water_ids),
+                            window_start=start, window_end=end, tamanho_pagina=harvester.tamanho_pagina,
+                            last_page=last_page, status="running", records=records)
+
+        self._flush()
+        self.store.save(self.endpoint, modalidade, since=None, since_ids=None,
+                        high_water=high_water, high_water_ids=_dump_ids(high_water_ids),
+                        window_start=start, window_end=end, tamanho_pagina=None,
+                        last_page=0, status="done", records=records)
+
+
+async def _run_cli(args):
+    store = CheckpointStore(args.db)
+    client = PNCPClient(rate=args.rate, pool_size=args.concurrency)
+
+    def harvester_factory(**kwargs):
+        return PNCPHarvester(args.base_url, args.concurrency, client=client, **kwargs)
+
+    ate = args.ate or date.today().strftime(DATE_FORMAT)
+    sink = sink_from_args(args, mode="a")
+    syncer = PNCPSync(store, harvester_factory, args.endpoint, sink, args.checkpoint_pages)
+    start = time.perf_counter()
+    try:
+        for modalidade in args.modalidades:
+            count = 0
+            async for record in syncer.sync(modalidade, args.desde, ate):
+                sink.write(record)
+                count += 1
+            checkpoint = store.get(args.endpoint, modalidade)
+            print(f"✅ modalidade {modalidade}: {count} novos (high-water {checkpoint['high_water']})", file=sys.stderr)
+    finally:
+        sink.close()
+        store.close()
+    print(f"⏱️  {time.perf_counter() - start:.1f}s | {client.metrics.requests} requisições", file=sys.stderr)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Sincronização incremental do PNCP")
+    parser.add_argument("--modalidades", type=int, nargs="+", help="Códigos de modalidade")
+    parser.add_argument("--endpoint", choices=list(ENDPOINTS), default="publicacao")
+    parser.add_argument("--desde", default=None, help="AAAAMMDD da primeira carga (padrão: hoje)")
+    parser.add_argument("--ate", default=None, help="AAAAMMDD final (padrão: hoje)")
+    parser.add_argument("--db", default=SYNC_DB, help=f"Banco de checkpoints (padrão: {SYNC_DB})")
+    parser.add_argument("--concurrency", "-c", type=int, default=DEFAULT_CONCURRENCY)
+    parser.add_argument("--rate", type=float, default=DEFAULT_RATE, help="Requisições/segundo (0 = sem limite; padrão: 5)")
+    parser.add_argument("--base-url", default=BASE_URL)
+    parser.add_argument("--output", "-o", default=None, help="NDJSON de saída, em modo append (padrão: stdout)")
+    add_sink_arguments(parser)
+    parser.add_argument("--checkpoint-pages", type=int, default=None,
+                        help="Salva o checkpoint a cada N páginas (padrão: 1; com --format parquet, um row group: "
+                             "cada checkpoint fecha um arquivo)")
+    parser.add_argument("--status", action="store_true", help="Mostra os checkpoints e sai")
+    args = parser.parse_args()
+
+    if args.status:
+        store = CheckpointStore(args.db)
+        try:
+            for checkpoint in store.all():
+                print(json.dumps(checkpoint, ensure_ascii=False))
+        finally:
+            store.close()
+        return 0
+    if not args.modalidades:
+        parser.error("--modalidades é obrigatório")
+    args.desde = args.desde or date.today().strftime(DATE_FORMAT)
+    asyncio.run(_run_cli(args))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,10 +2,12 @@
 """
 Investigação PROFUNDA: Como baixar os arquivos REAIS (PDF/ZIP) do PNCP
 """
-import requests
+from pncp_client import PNCPClient
 import json
 import os
 
+client = PNCPClient()
+
 print("🔬 INVESTIGAÇÃO PROFUNDA: Download de Arquivos PNCP\n")
 
 # Dados de teste
@@ -24,7 +26,7 @@ url_list = f"https://pncp.gov.br/api/pncp/v1/orgaos/{cnpj}/compras/{ano}/{seq}/a
 print(f"\nURL: {url_list}\n")
 
 try:
-    r = requests.get(url_list, timeout=10)
+    r = client.get(url_list, timeout=10)
     if r.status_code == 200:
         arquivos = r.json()
         print(f"✅ {len(arquivos)} arquivo(s) encontrado(s)\n")
@@ -64,7 +66,7 @@ url_arquivo = f"https://pncp.gov.br/api/pncp/v1/orgaos/{cnpj}/compras/{ano}/{seq
 print(f"\nURL do arquivo: {url_arquivo}\n")
 
 try:
-    r = requests.get(url_arquivo, timeout=10, allow_redirects=True)
+    r = client.get(url_arquivo, timeout=10, allow_redirects=True, headers={"Accept": "*/*"})
     print(f"Status: {r.status_code}")
     print(f"Content-Type: {r.headers.get('Content-Type')}")
     print(f"Content-Length: {r.headers.get('Content-Length')} bytes")
@@ -116,7 +118,7 @@ endpoints_testar = [
 for url_test in endpoints_testar:
     print(f"\n📍 Testando: {url_test}")
     try:
-        r = requests.get(url_test, timeout=10, allow_redirects=True)
+        r = client.get(url_test, timeout=10, allow_redirects=True, headers={"Accept": "*/*"})
         print(f"   Status: {r.status_code}")
         
         if r.status_code == 200:
@@ -154,7 +156,7 @@ print("="*70)
 
 url_json = f"https://pncp.gov.br/api/pncp/v1/orgaos/{cnpj}/compras/{ano}/{seq}/arquivos/{seq_doc}"
 try:
-    r = requests.get(url_json, timeout=10)
+    r = client.get(url_json, timeout=10)
     if r.status_code == 200 and 'application/json' in r.headers.get('Content-Type', ''):
         data = r.json()
         
@@ -2,9 +2,11 @@
 """
 Descobrir se API tem endpoint para ITENS das licitações
 """
-import requests
+from pncp_client import PNCPClient
 import json
 
+client = PNCPClient()
+
 print("🔍 INVESTIGAÇÃO: Endpoint de ITENS\n")
 
 # Usar uma licitação do nosso JSON de sucesso
@@ -40,7 +42,7 @@ for test in test_cases:
     print(f"   URL: {test['url']}")
     
     try:
-        response = requests.get(test['url'], timeout=10, headers={'Accept': 'application/json'})
+        response = client.get(test['url'], timeout=10, headers={'Accept': 'application/json'})
         print(f"   Status: {response.status_code}")
         
         if response.status_code == 200:
@@ -88,7 +90,7 @@ url = f"{base_api_pncp}/orgaos/05995955000140/compras/2024/1"
 print(f"\nBuscando: {url}\n")
 
 try:
-    response = requests.get(url, timeout=10)
+    response = client.get(url, timeout=10)
     if response.status_code == 200:
         data = response.json()
         
@@ -3,9 +3,12 @@
 Script de teste para descobrir os endpoints corretos da API PNCP
 """
 import requests
+from pncp_client import PNCPClient
 import json
 from datetime import datetime
 
+client = PNCPClient()
+
 print("🔍 Testando API do PNCP - Portal Nacional de Contratações Públicas\n")
 
 # Configurações de teste
@@ -34,7 +37,7 @@ def test_endpoint(base_url, endpoint, params=None):
     
     try:
         print(f"   Testando: {url}")
-        response = requests.get(
+        response = client.get(
             url,
             params=params,
             timeout=10,
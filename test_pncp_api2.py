@@ -4,8 +4,11 @@ Script de teste COMPLETO para API PNCP
 Baseado na documentação real: a API requer CNPJ do órgão
 """
 import requests
+from pncp_client import PNCPClient
 import json
 
+client = PNCPClient()
+
 print("🔍 Teste API PNCP - Descoberta de Estrutura Real\n")
 
 BASE_URL = "https://pncp.gov.br/api/pncp/v1"
@@ -14,7 +17,7 @@ print("="*70)
 print("TESTE 1: Listar modalidades (confirmação que API funciona)")
 print("="*70)
 
-response =requests.get(f"{BASE_URL}/modalidades", timeout=10)
+response = client.get(f"{BASE_URL}/modalidades", timeout=10)
 print(f"Status: {response.status_code}")
 if response.status_code == 200:
     data = response.json()
@@ -62,7 +65,7 @@ for test in test_cases:
     print(f"   Params: {test['params']}")
     
     try:
-        r = requests.get(test['url'], params=test['params'], timeout=15)
+        r = client.get(test['url'], params=test['params'], timeout=15)
         print(f"   Status: {r.status_code}")
         
         if r.status_code == 200:
@@ -115,7 +118,7 @@ swagger_urls = [
 for url in swagger_urls:
     print(f"\n📚 {url}")
     try:
-        r = requests.get(url, timeout=5)
+        r = client.get(url, timeout=5)
         print(f"   Status: {r.status_code}")
         if r.status_code == 200:
             print(f"   ✅ Swagger disponível! Verifique manualmente: {url}")